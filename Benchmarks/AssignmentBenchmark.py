@@ -0,0 +1,56 @@
+"""Auto-assignment benchmark: planning and applying a large unassigned backlog.
+
+Usage: python Benchmarks/AssignmentBenchmark.py [number_of_reports] [number_of_teachers]   (default 50,000 and 200)
+
+Files the backlog into an in-memory School (no encryption), then times a
+dry-run plan and the real batch assignment with per-teacher capacities
+and reporter/case affinity. Planning should grow with n log t.
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Reports import InPersonReport, ConfidentialityLevel
+from Scheduler import AssignmentScheduler
+from SchoolClass import School
+from UserClasses import Student, Teacher, Administrator
+
+LEVELS = list(ConfidentialityLevel)
+LOCATIONS = ["School Entrance", "Cafeteria", "Gymnasium", "Library", "Hallway B"]
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    teachers = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(7)
+    school = School("BENCH", "Benchmark School", "Benchmark Street")
+    students = [Student(f"S{n}", f"Student {n}", f"s{n}@school.edu", 9, "x") for n in range(total // 5)]
+    staff = [Teacher(f"T{n}", f"Teacher {n}", f"t{n}@school.edu", "x") for n in range(teachers)]
+    admin = Administrator("A1", "Admin", "admin@school.edu", "x")
+    school.users.extend(students + staff + [admin])
+    for n in range(total):
+        report = InPersonReport(f"R{n + 1:03}", datetime(2025, 1, 1) + timedelta(minutes=n), f"Incident {n}",
+                                rng.choice(LEVELS), rng.choice(LOCATIONS))
+        report.reporter = rng.choice(students)
+        school.reports.append(report)
+    capacities = {teacher.userID: rng.randrange(total // teachers, 4 * total // teachers) for teacher in staff}
+    scheduler = AssignmentScheduler(school, capacities=capacities)
+
+    start = time.perf_counter()
+    plan = scheduler.assign(admin, dryRun=True)
+    planned = time.perf_counter() - start
+    print(f"dry run: {len(plan):,} planned, {len(scheduler.unplaced):,} without room, {planned:.2f}s")
+
+    start = time.perf_counter()
+    applied = scheduler.assign(admin)
+    print(f"assign:  {len(applied):,} assigned in {time.perf_counter() - start:.2f}s")
+    loads = scheduler.caseloads()
+    print(f"caseloads: min {min(loads.values())}, max {max(loads.values())}")
+
+
+if __name__ == "__main__":
+    main()
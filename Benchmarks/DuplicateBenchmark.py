@@ -0,0 +1,72 @@
+"""Duplicate detection benchmark: cost of one filing as the corpus grows.
+
+Usage: python Benchmarks/DuplicateBenchmark.py [number_of_reports]   (default 200,000)
+
+Feeds synthetic reports straight to a DuplicateDetector (no School,
+storage or encryption), about 200 a day, and times the filings around a
+few corpus sizes. One report in ten re-tells an earlier one from the same
+place a few days before, so real matches are found along the way. Only
+reports inside the detector's window are kept, so the time per filing
+should stay flat however many reports came before.
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Duplicates import DuplicateDetector
+from Reports import InPersonReport, ConfidentialityLevel
+
+LOCATIONS = ["School Entrance", "Cafeteria", "Gymnasium", "Library", "Hallway B"]
+VOCABULARY = ("pushed teased mocked shoved threatened excluded insulted followed laughed tripped "
+              "locker bag phone photo video comment message rumour name lunch recess bus class group chat "
+              "after before during near behind every again today yesterday student classmate senior").split() \
+             + [f"word{n}" for n in range(2000)]
+PER_DAY = 200
+SAMPLE = 2000
+
+
+def report(n, rng, told):
+    date = datetime(2025, 1, 1) + timedelta(days=n / PER_DAY)
+    location = LOCATIONS[n % len(LOCATIONS)]
+    if n >= 5 * PER_DAY and n % 10 == 0:
+        # Re-tell a report from the same place a few days back, changing one word
+        words = told[n - 5 * PER_DAY + len(LOCATIONS)].split()
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    else:
+        words = rng.choices(VOCABULARY, k=16)
+    description = " ".join(words)
+    told[n] = description
+    return InPersonReport(f"R{n + 1:03}", date, description, ConfidentialityLevel.PUBLIC, location)
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    sizes = sorted({max(SAMPLE, total // 100), max(SAMPLE, total // 10), max(SAMPLE, total)})
+    rng = random.Random(7)
+    detector = DuplicateDetector()
+    told = {}
+    filed = 0
+    print(f"{'reports':>10} {'us/filing':>10} {'kept':>8} {'flagged':>8}")
+    for size in sizes:
+        while filed < size - SAMPLE:
+            detector.reportAdded(report(filed, rng, told))
+            told.pop(filed - 6 * PER_DAY, None)
+            filed += 1
+        batch = []
+        while filed < size:
+            batch.append(report(filed, rng, told))
+            told.pop(filed - 6 * PER_DAY, None)
+            filed += 1
+        start = time.perf_counter()
+        for item in batch:
+            detector.reportAdded(item)
+        elapsed = (time.perf_counter() - start) / len(batch) * 1e6
+        print(f"{size:>10,} {elapsed:>10.1f} {len(detector._signatures):>8,} {len(detector._matches):>8,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Load test for the HTTP/JSON intake service.
+
+Usage: python Benchmarks/IntakeLoadTest.py [clients] [seconds] [host:port]
+       (defaults: 200 clients, 10 seconds, a fresh in-process service)
+
+Each simulated student logs in once, then loops filing a report and
+listing their reports over one keep-alive connection. With no host:port
+a school with one student per client is created and served from a
+background thread of this process; password hashing is turned down for
+that school so the test measures intake, not the login KDF. To test a
+real instance, start "python main.py serve 8080" and pass
+127.0.0.1:8080 (the DummyData student logs in then).
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DataSecurity import SecurityManager, hash_password
+from IntakeService import IntakeService
+from SchoolClass import School
+from UserClasses import Student
+
+
+async def call(reader, writer, method: str, path: str, payload: dict = None, token: str = None) -> tuple:
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+    if token:
+        head += f"Authorization: Bearer {token}\r\n"
+    writer.write(head.encode("latin-1") + b"\r\n" + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def student(host: str, port: int, email: str, password: str, deadline: float, latencies: list, errors: list):
+    reader, writer = await asyncio.open_connection(host, port)
+    status, result = await call(reader, writer, "POST", "/login", {"email": email, "password": password})
+    if status != 200:
+        errors.append(status)
+        writer.close()
+        return
+    token = result["token"]
+    n = 0
+    while time.perf_counter() < deadline:
+        n += 1
+        if n % 4:
+            request = ("POST", "/reports", {"type": "in_person", "description": f"Load test incident {n}",
+                                             "confidentialityLevel": "CONFIDENTIAL", "location": "Hallway"})
+        else:
+            request = ("GET", "/reports/mine", None)
+        start = time.perf_counter()
+        status, _ = await call(reader, writer, *request, token=token)
+        latencies.append(time.perf_counter() - start)
+        if status >= 400:
+            errors.append(status)
+    writer.close()
+
+
+def start_local_service(clients: int) -> tuple:
+    SecurityManager.configurePasswords(iterations=1_000)
+    school = School("LOAD", "Load Test School", "localhost")
+    school.users.extend(Student(f"S{n:05}", f"Student {n}", f"student{n}@load.test", grade=10,
+                                passwordHash=hash_password("password")) for n in range(clients))
+    school.startEncryption()
+    service = IntakeService(school, port=0)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(service.start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return service, [(f"student{n}@load.test", "password") for n in range(clients)]
+
+
+async def run(clients: int, seconds: float, host: str, port: int, accounts: list) -> tuple:
+    latencies, errors = [], []
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    await asyncio.gather(*(student(host, port, *accounts[n % len(accounts)], deadline, latencies, errors)
+                           for n in range(clients)))
+    return time.perf_counter() - start, sorted(latencies), errors
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    if len(sys.argv) > 3:
+        host, port = sys.argv[3].rsplit(":", 1)
+        accounts = [("Ben@student.com", "yulo")]
+        port = int(port)
+    else:
+        service, accounts = start_local_service(clients)
+        host, port = service.host, service.port
+    real_stdout, sys.stdout = sys.stdout, open(os.devnull, "w")  # Silence the per-request log lines
+    try:
+        elapsed, latencies, errors = asyncio.run(run(clients, seconds, host, port, accounts))
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+    print(f"{clients} clients, {len(latencies):,} requests in {elapsed:.1f}s: "
+          f"{len(latencies) / elapsed:,.0f} requests/s, {len(errors)} errors")
+    if latencies:
+        print(f"latency p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Login throughput at each password hashing cost setting.
+
+Usage: python Benchmarks/PasswordHashBenchmark.py [seconds_per_setting]   (default 2)
+
+Each setting is timed on one core (the KDFs are single-threaded C code,
+so N cores give roughly N times the figure). "Cached" is a repeat login
+inside the verified-credential TTL, which skips the KDF entirely.
+Multiply the per-core rate by the cores you have to size for the
+morning login peak.
+"""
+import hashlib
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DataSecurity import PasswordHasher
+
+SETTINGS = [
+    ("legacy sha256", None),
+    ("pbkdf2_sha256 100k", PasswordHasher("pbkdf2_sha256", iterations=100_000)),
+    ("pbkdf2_sha256 310k (default)", PasswordHasher("pbkdf2_sha256", iterations=310_000)),
+    ("pbkdf2_sha256 600k", PasswordHasher("pbkdf2_sha256", iterations=600_000)),
+    ("scrypt n=2^14 r=8 p=1", PasswordHasher("scrypt", n=2 ** 14, r=8, p=1)),
+    ("scrypt n=2^15 r=8 p=1", PasswordHasher("scrypt", n=2 ** 15, r=8, p=1)),
+]
+
+
+def logins_per_second(verify, seconds: float) -> float:
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        verify()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    password = "NoliMeTangereLite"
+    print(f"{'setting':<30} {'logins/s/core':>14} {'ms/login':>9} {'cached logins/s':>16}")
+    for name, hasher in SETTINGS:
+        if hasher is None:
+            stored = hashlib.sha256(password.encode()).hexdigest()
+            hasher = PasswordHasher(cacheTTL=0)  # Verifies the legacy format without caching
+        else:
+            stored = hasher.hash(password)
+        ttl = hasher.cacheTTL
+        hasher.cacheTTL = 0  # Cold: every login pays the KDF
+        cold = logins_per_second(lambda: hasher.verify(password, stored), seconds)
+        hasher.cacheTTL = ttl
+        hasher.forget()
+        hasher.verify(password, stored)  # The login that fills the cache
+        cached = logins_per_second(lambda: hasher.verify(password, stored), seconds / 4)
+        print(f"{name:<30} {cold:>14,.1f} {1000 / cold:>9.2f} {cached:>16,.0f}")
+    print(f"\nCores available: {os.cpu_count()}")
+
+
+if __name__ == "__main__":
+    main()
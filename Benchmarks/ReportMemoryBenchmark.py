@@ -0,0 +1,94 @@
+"""Memory benchmark: bytes per report before and after the __slots__ redesign.
+
+Usage: python Benchmarks/ReportMemoryBenchmark.py [number_of_reports]   (default 1,000,000)
+
+"Before" is a copy of the original dict-based report classes; "after" is
+the current Reports module. Both get the same descriptions, so the gap is
+the per-object overhead.
+"""
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+
+
+class LegacyInPersonReport:
+    """The report layout before __slots__: instance __dict__ and eager lists."""
+
+    def __init__(self, reportID, reportDate, description, confidentialityLevel, location,
+                 reporter=None, witnesses=None):
+        self.reportID = reportID
+        self.reportDate = reportDate
+        self.description = description
+        self.confidentialityLevel = confidentialityLevel
+        self.status = ReportStatus.NEW
+        self.encrypted = False
+        self.reporter = reporter
+        self.location = location
+        self.witnesses = witnesses if witnesses is not None else []
+
+
+class LegacyCyberBullyingReport:
+    def __init__(self, reportID, reportDate, description, confidentialityLevel, onlinePlatform,
+                 reporter=None, evidence=None):
+        self.reportID = reportID
+        self.reportDate = reportDate
+        self.description = description
+        self.confidentialityLevel = confidentialityLevel
+        self.status = ReportStatus.NEW
+        self.encrypted = False
+        self.reporter = reporter
+        self.onlinePlatform = onlinePlatform
+        self.evidence = evidence if evidence is not None else []
+
+
+LOCATIONS = ["School Entrance", "Cafeteria", "Gymnasium", "Library", "Hallway B"]
+PLATFORMS = ["Facebook", "Instagram", "Messenger", "TikTok"]
+
+
+def build(count, inPersonClass, cyberClass, descriptions):
+    start = datetime(2024, 6, 1)
+    reports = []
+    for n in range(count):
+        date = start + timedelta(minutes=n)
+        if n % 2:
+            # Build the place name at runtime, as input() would.
+            location = "".join(LOCATIONS[n % len(LOCATIONS)])
+            reports.append(inPersonClass(f"R{n + 1:03}", date, descriptions[n],
+                                         ConfidentialityLevel.CONFIDENTIAL, location))
+        else:
+            platform = "".join(PLATFORMS[n % len(PLATFORMS)])
+            reports.append(cyberClass(f"R{n + 1:03}", date, descriptions[n],
+                                      ConfidentialityLevel.PUBLIC, platform))
+    return reports
+
+
+def measure(count, inPersonClass, cyberClass, descriptions):
+    gc.collect()
+    tracemalloc.start()
+    reports = build(count, inPersonClass, cyberClass, descriptions)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del reports
+    gc.collect()
+    return current / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    descriptions = [f"Incident number {n} reported by a student." for n in range(count)]
+    before = measure(count, LegacyInPersonReport, LegacyCyberBullyingReport, descriptions)
+    after = measure(count, InPersonReport, CyberBullyingReport, descriptions)
+    print(f"Reports:            {count:,}")
+    print(f"Before (__dict__):  {before:8.1f} bytes/report  ({before * count / 2**20:8.1f} MiB)")
+    print(f"After (__slots__):  {after:8.1f} bytes/report  ({after * count / 2**20:8.1f} MiB)")
+    print(f"Saved:              {100 * (1 - after / before):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
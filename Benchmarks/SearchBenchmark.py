@@ -0,0 +1,76 @@
+"""Search benchmark: query latency of ReportSearchIndex as the corpus grows.
+
+Usage: python Benchmarks/SearchBenchmark.py [number_of_reports]   (default 1,000,000)
+
+Builds the index directly (no School, storage or encryption) from
+synthetic descriptions, then times a mix of rare, common, phrase and
+filtered queries at a few corpus sizes. Descriptions draw from a few
+thousand words with Zipf-like frequencies, so the common query words
+still match a sizeable share of all reports.
+"""
+import itertools
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+from Search import ReportSearchIndex
+
+LOCATIONS = ["School Entrance", "Cafeteria", "Gymnasium", "Library", "Hallway B"]
+PLATFORMS = ["Facebook", "Instagram", "Messenger", "TikTok"]
+WORDS = ("pushed teased mocked shoved threatened excluded insulted followed laughed tripped "
+         "locker bag phone photo video comment message rumour name lunch recess bus class group chat "
+         "after before during near behind every again today yesterday student classmate senior").split()
+VOCABULARY = WORDS + [f"word{n}" for n in range(5000)]
+WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+QUERIES = [
+    ("rare word", "rumour", {}),
+    ("two words", "locker phone", {}),
+    ("phrase", '"group chat"', {}),
+    ("scattered", '"bus phone"', {}),  # Two common words that are seldom adjacent
+    ("place", "gymnasium", {}),
+    ("filtered", "mocked", {"status": ReportStatus.IN_PROGRESS, "reportType": CyberBullyingReport}),
+    ("exclusion", "bus -senior", {}),
+]
+
+
+def build(index, start, count, rng):
+    for n in range(start, start + count):
+        description = " ".join(rng.choices(VOCABULARY, cum_weights=WEIGHTS, k=12))
+        if n % 50 == 0:
+            description += " in the group chat"
+        if n % 2:
+            report = InPersonReport(f"R{n + 1:03}", datetime(2025, 1, 1), description,
+                                    ConfidentialityLevel.PUBLIC, LOCATIONS[n % len(LOCATIONS)])
+        else:
+            report = CyberBullyingReport(f"R{n + 1:03}", datetime(2025, 1, 1), description,
+                                         ConfidentialityLevel.PUBLIC, PLATFORMS[n % len(PLATFORMS)])
+        if n % 3 == 0:
+            report.status = ReportStatus.IN_PROGRESS
+        index.reportAdded(report)
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sizes = sorted({max(1, total // 100), max(1, total // 10), total})
+    rng = random.Random(7)
+    index = ReportSearchIndex()
+    built = 0
+    print(f"{'reports':>10} {'query':<10} {'ms':>8} {'results':>8}")
+    for size in sizes:
+        build(index, built, size - built, rng)
+        built = size
+        for name, query, filters in QUERIES:
+            start = time.perf_counter()
+            results = index.search(query, limit=20, **filters)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{size:>10,} {name:<10} {elapsed:>8.1f} {len(results):>8}")
+
+
+if __name__ == "__main__":
+    main()
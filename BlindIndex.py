@@ -0,0 +1,175 @@
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from DataSecurity import SecurityManager, BLIND_TOKEN_SIZE
+from Reports import ConfidentialityLevel
+from Search import tokenize, parse_query
+
+if TYPE_CHECKING:
+    from ReportRegistry import ReportRegistry
+
+# Reports whose descriptions get blind index tokens.
+BLIND_LEVELS = frozenset({ConfidentialityLevel.CONFIDENTIAL, ConfidentialityLevel.HIGHLY_CONFIDENTIAL})
+
+
+def _normalized(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def blind_values(description: str) -> list:
+    """The values a description is tokenized into: each distinct word, and the whole text."""
+    return ["=" + _normalized(description)] + ["w:" + word for word in dict.fromkeys(tokenize(description))]
+
+
+class BlindIndex:
+    """Keyword and exact-match search over confidential reports without decrypting them.
+
+    When a CONFIDENTIAL or HIGHLY_CONFIDENTIAL report is filed, its plaintext
+    description is turned into keyed HMAC tokens (one per distinct word plus
+    one for the whole normalized text; see SecurityManager.blindTokens) and
+    the tokens are stored on the report as report.blindIndex, so storage
+    keeps them next to the encrypted description. A query is tokenized with
+    the same key and answered from the token postings here: no description
+    is decrypted, and the tokens reveal nothing without the key.
+
+    Tokens belong to the key they were made with. After a key rotation
+    (SecurityManager.configure with a new keyID) the next query, or an
+    explicit rebuild(), decrypts the affected reports once and re-tokenizes
+    them under the new key.
+    """
+
+    def __init__(self, registry: 'ReportRegistry' = None):
+        self.registry = registry
+        self._lock = threading.RLock()
+        self._postings = {}       # token -> {reportID: report}
+        self._indexed = {}        # reportID -> (report, (keyID, packed tokens) as indexed)
+        self._keys = Counter()    # keyID -> number of reports indexed under it
+        if registry is not None:
+            for report in registry:
+                self.reportAdded(report)
+            registry.addListener(self)
+
+    def __len__(self) -> int:
+        return len(self._indexed)
+
+    @staticmethod
+    def prepare(report) -> bool:
+        """Give a confidential report its tokens if it has none yet.
+
+        School.registerReport calls this before filing, so the report is
+        stored with its tokens. Returns whether the report has tokens; False
+        for public reports and for descriptions encrypted under a key that
+        is no longer configured.
+        """
+        if report.confidentialityLevel not in BLIND_LEVELS:
+            return False
+        if report.blindIndex is None:
+            try:
+                description = report.plaintextDescription()
+            except ValueError as e:
+                print(f"[WARN] Report {report.reportID} cannot be blind indexed: {e}")
+                return False
+            report.blindIndex = SecurityManager.get_instance().blindTokens(blind_values(description))
+        return True
+
+    # --- Registry listener callbacks ---
+
+    def reportAdded(self, report) -> None:
+        missing = report.blindIndex is None  # Filed without registerReport, or stored before blind indexing
+        if not self.prepare(report):
+            return
+        if missing and self.registry is not None:
+            self.registry.notifyUpdated(report, "blindIndex")
+        self._store(report)
+
+    def reportRemoved(self, report) -> None:
+        with self._lock:
+            self._drop(report.reportID)
+
+    def reportUpdated(self, report, field: str, old) -> None:
+        if field == "description" and not report.descriptionState()[1] and report.confidentialityLevel in BLIND_LEVELS:
+            # A plaintext edit; encrypting the description leaves the words as they were.
+            report.blindIndex = None
+            self.reportAdded(report)
+        elif field == "blindIndex" and report.reportID in self._indexed:
+            self._store(report)
+
+    def _store(self, report) -> None:
+        with self._lock:
+            self._drop(report.reportID)
+            keyID, tokens = report.blindIndex
+            self._indexed[report.reportID] = (report, report.blindIndex)
+            self._keys[keyID] += 1
+            for start in range(0, len(tokens), BLIND_TOKEN_SIZE):
+                token = (keyID, tokens[start:start + BLIND_TOKEN_SIZE])
+                self._postings.setdefault(token, {})[report.reportID] = report
+
+    def _drop(self, reportID: str) -> None:
+        indexed = self._indexed.pop(reportID, None)
+        if indexed is None:
+            return
+        keyID, tokens = indexed[1]
+        self._keys[keyID] -= 1
+        if not self._keys[keyID]:
+            del self._keys[keyID]
+        for start in range(0, len(tokens), BLIND_TOKEN_SIZE):
+            token = (keyID, tokens[start:start + BLIND_TOKEN_SIZE])
+            reports = self._postings.get(token)
+            if reports is not None:
+                reports.pop(reportID, None)
+                if not reports:
+                    del self._postings[token]
+
+    # --- Key rotation ---
+
+    def rebuild(self) -> int:
+        """Re-tokenize every report indexed under an old key; returns how many were redone."""
+        keyID = SecurityManager.activeKeyID()
+        with self._lock:
+            stale = [report for report, (indexedKeyID, _) in self._indexed.values() if indexedKeyID != keyID]
+        for report in stale:
+            report.blindIndex = None
+            if not self.prepare(report):
+                with self._lock:
+                    self._drop(report.reportID)
+                continue
+            self._store(report)
+            if self.registry is not None:
+                self.registry.notifyUpdated(report, "blindIndex")  # Save the new tokens
+        return len(stale)
+
+    # --- Queries ---
+
+    def _lookup(self, values: list) -> list:
+        if set(self._keys) - {SecurityManager.activeKeyID()}:
+            self.rebuild()
+        keyID, tokens = SecurityManager.get_instance().blindTokens(values)
+        with self._lock:
+            postings = [self._postings.get((keyID, tokens[start:start + BLIND_TOKEN_SIZE]), {})
+                        for start in range(0, len(tokens), BLIND_TOKEN_SIZE)]
+            postings.sort(key=len)
+            return [report for reportID, report in postings[0].items()
+                    if all(reportID in other for other in postings[1:])]
+
+    def search(self, query: str) -> list:
+        """Confidential reports whose description contains every word of `query`.
+
+        Takes the same syntax as ReportSearchIndex.search, but tokens carry
+        no positions: a "phrase" matches its words anywhere in the
+        description, and -excluded parts drop reports holding all their words.
+        """
+        required, excluded = parse_query(query)
+        words = list(dict.fromkeys(word for part in required for word in part))
+        if not words:
+            return []
+        results = self._lookup(["w:" + word for word in words])
+        for part in excluded:
+            if results:
+                dropped = {report.reportID for report in self._lookup(["w:" + word for word in part])}
+                results = [report for report in results if report.reportID not in dropped]
+        return results
+
+    def equals(self, description: str) -> list:
+        """Confidential reports whose description is exactly `description` (ignoring case and spacing)."""
+        return self._lookup(["=" + _normalized(description)])
@@ -0,0 +1,170 @@
+import threading
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from ReportIDs import report_number
+from Duplicates import report_time
+
+if TYPE_CHECKING:
+    from ReportRegistry import ReportRegistry
+    from Duplicates import DuplicateDetector
+
+
+def _normalized(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _place(report) -> str:
+    return _normalized(getattr(report, "location", None) or getattr(report, "onlinePlatform", None) or "")
+
+
+def link_keys(report) -> list:
+    """The attributes that tie a report to earlier ones in the same situation.
+
+    A place on its own is shared by too many unrelated incidents, so it
+    only links reports from the same reporter.
+    """
+    witnesses = report.witnessNames() if hasattr(report, "witnessNames") else ()
+    keys = [("witness", _normalized(name)) for name in witnesses if name.strip()]
+    if report.reporter is not None:
+        keys.append(("reporter", report.reporter.userID, type(report).__name__, _place(report)))
+    return keys
+
+
+class Case:
+    """The reports of one ongoing situation, as grouped by a CaseTracker."""
+
+    def __init__(self, caseID: str, reports: list):
+        self.caseID = caseID
+        self.reports = reports
+
+    def __iter__(self):
+        return iter(self.reports)
+
+    def __len__(self) -> int:
+        return len(self.reports)
+
+    def __repr__(self) -> str:
+        return f"Case({self.caseID!r}, {len(self.reports)} reports)"
+
+
+class CaseTracker:
+    """Groups reports about the same ongoing situation into cases.
+
+    Two reports are linked when, within `window` of each other, they share a
+    witness, come from the same reporter about the same place or platform,
+    or one was flagged as a near-duplicate of the other by the
+    DuplicateDetector. Cases are the connected groups of links, kept in a
+    union-find (union by size, path halving), so filing a report costs a
+    few near-constant merges however large its case already is. For each
+    link key only the latest report is remembered; linking to it is enough
+    to join the whole case.
+
+    A case is named after its lowest report ID ("C-R001"). Removing a report
+    takes it out of its case but does not split the case: the links it made
+    still hold the remaining reports together.
+    """
+
+    def __init__(self, registry: 'ReportRegistry' = None, duplicates: 'DuplicateDetector' = None,
+                 window: timedelta = timedelta(days=30)):
+        self.duplicates = duplicates
+        self.window = window
+        self._lock = threading.Lock()
+        self._reports = {}  # reportID -> report, while it is filed
+        self._parent = {}   # reportID -> parent reportID (removed reports stay as links)
+        self._size = {}     # root -> number of reportIDs under it
+        self._members = {}  # root -> set of filed reportIDs (merged cases only)
+        self._latest = {}   # link key -> (timestamp, reportID) of the latest report with it
+        if registry is not None:
+            for report in registry:
+                self.reportAdded(report)
+            registry.addListener(self)
+
+    def _find(self, reportID: str) -> str:
+        parent = self._parent
+        while parent[reportID] != reportID:
+            parent[reportID] = parent[parent[reportID]]
+            reportID = parent[reportID]
+        return reportID
+
+    def _union(self, first: str, second: str) -> None:
+        first, second = self._find(first), self._find(second)
+        if first == second:
+            return
+        if self._size[first] < self._size[second]:
+            first, second = second, first
+        self._parent[second] = first
+        self._size[first] += self._size.pop(second)
+        # Merge the smaller member set into the larger one.
+        big, small = self._membersOf(first), self._membersOf(second)
+        if len(big) < len(small):
+            big, small = small, big
+        big |= small
+        self._members[first] = big
+
+    def _membersOf(self, root: str) -> set:
+        members = self._members.pop(root, None)
+        if members is None:  # Never merged, so the root is the only report
+            members = {root} if root in self._reports else set()
+        return members
+
+    def _case(self, reportIDs) -> Case:
+        reports = sorted((self._reports[reportID] for reportID in reportIDs),
+                         key=lambda report: (report_number(report.reportID), report.reportID))
+        return Case(f"C-{reports[0].reportID}", reports)
+
+    # --- Registry listener callbacks ---
+
+    def reportAdded(self, report) -> None:
+        reportID, date = report.reportID, report_time(report)  # Naive and aware dates on one clock
+        related = self.duplicates.duplicatesOf(reportID) if self.duplicates is not None else []
+        with self._lock:
+            self._reports[reportID] = report
+            if reportID not in self._parent:
+                self._parent[reportID] = reportID
+                self._size[reportID] = 1
+            else:  # Filed again after a removal: back into its old case
+                self._members.get(self._find(reportID), set()).add(reportID)
+            for key in link_keys(report):
+                latest = self._latest.get(key)
+                if latest is not None and abs(latest[0] - date) <= self.window.total_seconds():
+                    related.append(latest[1])
+                if latest is None or date >= latest[0]:
+                    self._latest[key] = (date, reportID)
+            for other in related:
+                if other in self._parent:
+                    self._union(reportID, other)
+
+    def reportRemoved(self, report) -> None:
+        with self._lock:
+            if self._reports.pop(report.reportID, None) is None:
+                return
+            root = self._find(report.reportID)
+            self._members.get(root, set()).discard(report.reportID)
+
+    def reportUpdated(self, report, field: str, old) -> None:
+        pass  # Cases are linked at filing time.
+
+    # --- Queries ---
+
+    def caseOf(self, report) -> Case:
+        """The case `report` belongs to (a case of just the report if it is linked to nothing)."""
+        with self._lock:
+            members = self._members.get(self._find(report.reportID)) if report.reportID in self._parent else None
+            if not members or len(members) < 2:
+                return Case(f"C-{report.reportID}", [report])
+            return self._case(members)
+
+    def caseKey(self, report) -> str:
+        """A key shared by every report of the same case, cheaper than caseOf().
+
+        Keys change when cases merge, so compare them only between filings.
+        """
+        with self._lock:
+            return self._find(report.reportID) if report.reportID in self._parent else report.reportID
+
+    def cases(self) -> list:
+        """Every case of two or more reports, largest first."""
+        with self._lock:
+            found = [self._case(members) for members in self._members.values() if len(members) > 1]
+        return sorted(found, key=lambda case: (-len(case), report_number(case.caseID[2:]), case.caseID))
@@ -1,27 +1,418 @@
 import base64
 import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
 
+from Permissions import DEFAULT_POLICY
 from UserClasses import User
 
+# Reports are encrypted with a key derived from this secret when TUTOK_SECRET
+# is not set (and SecurityManager.configure was not called). Anyone with the
+# source can derive it, so using it prints a warning unless TUTOK_DEV=1 says
+# this is local development or a test run, and the intake service refuses it.
+_DEFAULT_SECRET = "tuTok-development-secret"
+_KDF_SALT = b"tuTok/report-encryption"
+_KDF_ITERATIONS = 200_000
+
+
+def _development_mode() -> bool:
+    """Whether TUTOK_DEV=1 marks this process as local development or a test run."""
+    return os.environ.get("TUTOK_DEV", "") == "1"
+
+
+# Ciphertext format, version 1:
+#   $tk1$<keyID>$<nonce, base64url>$<ciphertext + tag, base64url>
+# Anything without the "$tk" prefix is a legacy (version 0) plain base64 value.
+_VERSION = "tk1"
+_PREFIX = "$" + _VERSION + "$"
+_NONCE_SIZE = 16
+_TAG_SIZE = 16
+_BLOCK_SIZE = 64
+# Blind index tokens are truncated HMAC-SHA256 values (96 bits).
+BLIND_TOKEN_SIZE = 12
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class ReportCipher:
+    """Authenticated encryption built from hashlib only (no third-party crypto).
+
+    Encrypt-then-MAC: the keystream is keyed BLAKE2b in counter mode over a
+    random nonce, and the tag is a keyed BLAKE2b over the header, nonce and
+    ciphertext. The keyed hash objects are built once and copied per use,
+    so no key setup is repeated per message.
+    """
+
+    def __init__(self, keyID: str, key: bytes):
+        self.keyID = keyID
+        self.key = key
+        self._stream = hashlib.blake2b(key=hmac.digest(key, b"encrypt", "sha256"), digest_size=_BLOCK_SIZE)
+        self._mac = hashlib.blake2b(key=hmac.digest(key, b"authenticate", "sha256"), digest_size=_TAG_SIZE)
+        self._blind = hmac.new(hmac.digest(key, b"blind-index", "sha256"), digestmod="sha256")
+        self._header = f"{_PREFIX}{keyID}$"
+
+    def blindToken(self, value: str) -> bytes:
+        """Keyed, deterministic token for `value`: equal values give equal tokens under one key."""
+        h = self._blind.copy()
+        h.update(value.encode("utf-8"))
+        return h.digest()[:BLIND_TOKEN_SIZE]
+
+    def _keystream(self, nonce: bytes, length: int) -> bytes:
+        blocks = []
+        for counter in range((length + _BLOCK_SIZE - 1) // _BLOCK_SIZE):
+            h = self._stream.copy()
+            h.update(nonce + counter.to_bytes(8, "little"))
+            blocks.append(h.digest())
+        return b"".join(blocks)[:length]
+
+    def _tag(self, nonce: bytes, body: bytes) -> bytes:
+        h = self._mac.copy()
+        h.update(self._header.encode("ascii"))
+        h.update(nonce)
+        h.update(body)
+        return h.digest()
+
+    def encrypt(self, plaintext: str, nonce: bytes = None) -> str:
+        data = plaintext.encode("utf-8")
+        nonce = nonce or os.urandom(_NONCE_SIZE)
+        stream = self._keystream(nonce, len(data))
+        body = (int.from_bytes(data, "little") ^ int.from_bytes(stream, "little")).to_bytes(len(data), "little")
+        return f"{self._header}{_b64encode(nonce)}${_b64encode(body + self._tag(nonce, body))}"
+
+    def decrypt(self, token: str) -> str:
+        try:
+            nonceText, payloadText = token[len(self._header):].split("$")
+            nonce, payload = _b64decode(nonceText), _b64decode(payloadText)
+        except ValueError:
+            raise ValueError("Malformed ciphertext.") from None
+        body, tag = payload[:-_TAG_SIZE], payload[-_TAG_SIZE:]
+        if len(nonce) != _NONCE_SIZE or not hmac.compare_digest(tag, self._tag(nonce, body)):
+            raise ValueError("Ciphertext failed authentication.")
+        stream = self._keystream(nonce, len(body))
+        return (int.from_bytes(body, "little") ^ int.from_bytes(stream, "little")).to_bytes(len(body), "little").decode("utf-8")
+
+
+class PasswordHasher:
+    """Salted password hashing with the parameters stored next to each hash.
+
+    Stored formats:
+      pbkdf2_sha256$<iterations>$<salt>$<hash>
+      scrypt$<n>$<r>$<p>$<salt>$<hash>
+      <64 hex digits>  - legacy unsalted SHA-256, only ever verified
+
+    needsRehash() says whether a stored hash was made with weaker or
+    different settings than this hasher's, so callers can upgrade it
+    while they still have the plaintext (i.e. on a successful login).
+
+    Successful verifications are remembered for `cacheTTL` seconds, so a
+    user who authenticates repeatedly within a session pays the KDF once.
+    Only a keyed digest of the password is kept, under a key that never
+    leaves this process.
+    """
+
+    def __init__(self, algorithm: str = "pbkdf2_sha256", iterations: int = 310_000,
+                 n: int = 2 ** 14, r: int = 8, p: int = 1,
+                 cacheTTL: float = 300.0, cacheSize: int = 1024):
+        if algorithm not in ("pbkdf2_sha256", "scrypt"):
+            raise ValueError(f"Unknown password hashing algorithm {algorithm}.")
+        self.algorithm = algorithm
+        self.iterations = iterations
+        self.n, self.r, self.p = n, r, p
+        self.cacheTTL = cacheTTL
+        self.cacheSize = cacheSize
+        self._verified = OrderedDict()   # stored hash -> (expires, password digest)
+        self._cacheKey = os.urandom(32)
+        self._cacheLock = threading.Lock()
+
+    def settings(self) -> dict:
+        """Constructor arguments that rebuild this hasher (e.g. in a worker process)."""
+        return {"algorithm": self.algorithm, "iterations": self.iterations, "n": self.n, "r": self.r, "p": self.p}
+
+    def _params(self) -> list:
+        if self.algorithm == "scrypt":
+            return [str(self.n), str(self.r), str(self.p)]
+        return [str(self.iterations)]
+
+    @staticmethod
+    def _derive(algorithm: str, params: list, password: str, salt: bytes) -> bytes:
+        if algorithm == "pbkdf2_sha256":
+            return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, int(params[0]))
+        if algorithm == "scrypt":
+            n, r, p = (int(v) for v in params)
+            return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+                                  maxmem=256 * n * r + (1 << 20), dklen=32)
+        raise ValueError(f"Unknown password hashing algorithm {algorithm}.")
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(16)
+        params = self._params()
+        digest = self._derive(self.algorithm, params, password, salt)
+        return "$".join([self.algorithm] + params + [_b64encode(salt), _b64encode(digest)])
+
+    def needsRehash(self, stored: str) -> bool:
+        return stored.split("$")[:-2] != [self.algorithm] + self._params()
+
+    def _digest(self, password: str) -> bytes:
+        return hmac.digest(self._cacheKey, password.encode("utf-8"), "blake2b")
+
+    def verify(self, password: str, stored: str) -> bool:
+        digest = self._digest(password)
+        with self._cacheLock:
+            entry = self._verified.get(stored)
+            if entry is not None and entry[0] > time.monotonic() and hmac.compare_digest(entry[1], digest):
+                self._verified.move_to_end(stored)
+                return True
+
+        parts = stored.split("$")
+        if len(parts) == 1:
+            ok = hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored)
+        else:
+            try:
+                expected = _b64decode(parts[-1])
+                ok = hmac.compare_digest(self._derive(parts[0], parts[1:-2], password, _b64decode(parts[-2])), expected)
+            except (ValueError, IndexError):
+                return False
+
+        if ok:
+            with self._cacheLock:
+                self._verified[stored] = (time.monotonic() + self.cacheTTL, digest)
+                self._verified.move_to_end(stored)
+                if len(self._verified) > self.cacheSize:
+                    self._verified.popitem(last=False)
+        return ok
+
+    def forget(self, stored: str = None) -> None:
+        """Drop the cached verification of one hash, or of all of them."""
+        with self._cacheLock:
+            if stored is None:
+                self._verified.clear()
+            else:
+                self._verified.pop(stored, None)
+
+
 class SecurityManager:
-    def checkPermission(self, user: "User", action: str) -> bool:
-        permissions = {
-            "file_report": ["Student"],
-            "review_report": ["Teacher"],
-            "assign_staff": ["Administrator"]
-        }
-        if action in permissions and user.role in permissions[action]:
-            return True
-        return False
+    # Process-wide keyring: keys are derived once (PBKDF2 is slow on purpose)
+    # and shared by every SecurityManager instance.
+    _ciphers = {}
+    _activeKeyID = None
+    _developmentKey = False  # Whether the active key comes from _DEFAULT_SECRET
+    _keyLock = threading.Lock()
+    _instance = None
+    _passwordHasher = PasswordHasher()
+    policy = DEFAULT_POLICY
+
+    @classmethod
+    def get_instance(cls) -> "SecurityManager":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def configure(cls, secret: str, keyID: str = "k1") -> None:
+        """Derive the report key for `secret` and make it the active key.
+
+        Previously configured keys stay available for decryption.
+        """
+        cls.installKey(keyID, hashlib.pbkdf2_hmac("sha256", secret.encode("utf-8"), _KDF_SALT, _KDF_ITERATIONS))
+
+    @classmethod
+    def configurePasswords(cls, algorithm: str = "pbkdf2_sha256", **params) -> PasswordHasher:
+        """Hash new (and upgraded) passwords with these settings from now on.
+
+        Existing hashes keep verifying; they are rehashed on the next login.
+        """
+        cls._passwordHasher = PasswordHasher(algorithm, **params)
+        return cls._passwordHasher
+
+    @classmethod
+    def passwordHasher(cls) -> PasswordHasher:
+        return cls._passwordHasher
+
+    @classmethod
+    def installKey(cls, keyID: str, key: bytes) -> None:
+        """Make an already derived key the active one (used by worker processes)."""
+        with cls._keyLock:
+            cls._ciphers[keyID] = ReportCipher(keyID, key)
+            cls._activeKeyID = keyID
+            cls._developmentKey = False
+
+    @classmethod
+    def activeKey(cls) -> tuple:
+        """(keyID, key) of the active key, for handing to worker processes."""
+        cipher = cls._activeCipher()
+        return cipher.keyID, cipher.key
+
+    @classmethod
+    def activeKeyID(cls) -> str:
+        return cls._activeCipher().keyID
+
+    @classmethod
+    def _activeCipher(cls) -> ReportCipher:
+        if cls._activeKeyID is None:
+            secret = os.environ.get("TUTOK_SECRET")
+            if secret:
+                cls.configure(secret)
+            else:
+                if not _development_mode():
+                    print("[WARN] TUTOK_SECRET is not set; reports are encrypted with the built-in development "
+                          "secret. Set TUTOK_SECRET, or TUTOK_DEV=1 for local development and tests.")
+                cls.configure(_DEFAULT_SECRET)
+                cls._developmentKey = True
+        return cls._ciphers[cls._activeKeyID]
+
+    @classmethod
+    def requireDeploymentKey(cls) -> None:
+        """Raise RuntimeError if reports would be encrypted with the development secret outside TUTOK_DEV=1."""
+        cls._activeCipher()
+        if cls._developmentKey and not _development_mode():
+            raise RuntimeError("TUTOK_SECRET is not set; refusing to encrypt reports with the development secret "
+                               "(set TUTOK_DEV=1 to allow it for local testing).")
+
+    @classmethod
+    def _cipherFor(cls, token: str) -> ReportCipher:
+        cls._activeCipher()  # Make sure the default key exists.
+        keyID = token[len(_PREFIX):].split("$", 1)[0]
+        cipher = cls._ciphers.get(keyID)
+        if cipher is None:
+            raise ValueError(f"No key configured for key ID {keyID}.")
+        return cipher
+
+    @staticmethod
+    def ciphertextVersion(data: str) -> str:
+        """Identify one encryption of a value: the header and nonce ("" for legacy base64)."""
+        if not data.startswith(_PREFIX):
+            return ""
+        return data[:data.rindex("$")]
+
+    def checkPermission(self, user: "User", action: str, report=None) -> bool:
+        """O(1) check against the compiled permission policy (see Permissions.py)."""
+        return self.policy.allows(user, action, report)
+
+    def filter_permitted(self, user: "User", reports, action: str = "view_report") -> list:
+        """The reports `user` may take `action` on, filtered in one pass."""
+        return self.policy.filter(user, reports, action)
 
     def encryptData(self, data: str) -> str:
-        encoded_bytes = base64.b64encode(data.encode("utf-8"))
-        return str(encoded_bytes, "utf-8")
+        return self._activeCipher().encrypt(data)
 
     def decryptData(self, data: str) -> str:
+        if data.startswith(_PREFIX):
+            return self._cipherFor(data).decrypt(data)
+        # Legacy values written before authenticated encryption.
         decoded_bytes = base64.b64decode(data.encode("utf-8"))
         return str(decoded_bytes, "utf-8")
-    
+
+    def encrypt_many(self, values: list) -> list:
+        """Encrypt a batch of strings with one nonce draw for the whole batch."""
+        cipher = self._activeCipher()
+        nonces = os.urandom(_NONCE_SIZE * len(values))
+        return [cipher.encrypt(value, nonces[i * _NONCE_SIZE:(i + 1) * _NONCE_SIZE])
+                for i, value in enumerate(values)]
+
+    def decrypt_many(self, values: list) -> list:
+        return [self.decryptData(value) for value in values]
+
+    def blindTokens(self, values) -> tuple:
+        """(keyID, tokens) for the values under the active key, tokens packed into one bytes object."""
+        cipher = self._activeCipher()
+        return cipher.keyID, b"".join(cipher.blindToken(value) for value in values)
+
+class DecryptionCache:
+    """Small LRU cache of decrypted report descriptions for one session.
+
+    Entries are keyed by reportID and ciphertext version, so a report that
+    is re-encrypted simply misses, and its stale plaintext is dropped at
+    that point. At most `maxEntries` plaintexts are held, each for at most
+    `ttl` seconds; clear() (on logout) drops them all.
+
+    A session's requests may run on several threads at once (the intake
+    service decrypts on executor threads), so the cache is guarded by a
+    lock. Decryption itself happens outside it.
+    """
+
+    def __init__(self, security_manager: SecurityManager = None, maxEntries: int = 128, ttl: float = 300.0):
+        self.security_manager = security_manager or SecurityManager.get_instance()
+        self.maxEntries = maxEntries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # (reportID, version) -> (expires, plaintext)
+        self._versions = {}             # reportID -> version currently cached
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key) -> None:
+        del self._entries[key]
+        del self._versions[key[0]]
+
+    def decrypt(self, report) -> str:
+        """Plaintext description of `report`, decrypting only on a cache miss."""
+        if not report.encrypted:
+            return report.description
+        version = SecurityManager.ciphertextVersion(report.description)
+        key = (report.reportID, version)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        plaintext = self.security_manager.decryptData(report.description)
+        with self._lock:
+            cached = self._versions.get(report.reportID)
+            if cached is not None:
+                self._drop((report.reportID, cached))  # Expired, or re-encrypted since it was cached
+            self._entries[key] = (now + self.ttl, plaintext)
+            self._versions[report.reportID] = version
+            if len(self._entries) > self.maxEntries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return plaintext
+
+    def invalidate(self, reportID: str) -> None:
+        """Forget the cached plaintext of one report."""
+        with self._lock:
+            version = self._versions.get(reportID)
+            if version is not None:
+                self._drop((reportID, version))
+
+    def clear(self) -> None:
+        """Forget every cached plaintext (e.g. on logout). Metrics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+            }
+
+
 def hash_password(password: str) -> str:
-    """Compute a SHA-256 hash for the given password."""
-    return hashlib.sha256(password.encode()).hexdigest()
\ No newline at end of file
+    """Hash a password for storage with the configured password hasher."""
+    return SecurityManager.passwordHasher().hash(password)
+
+
+def verify_password(password: str, stored: str) -> bool:
+    return SecurityManager.passwordHasher().verify(password, stored)
@@ -0,0 +1,192 @@
+import random
+import re
+import threading
+import zlib
+from array import array
+from collections import deque
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from Search import STOPWORDS
+
+if TYPE_CHECKING:
+    from ReportRegistry import ReportRegistry
+
+_WORD = re.compile(r"\w+")
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+
+
+def shingles(text: str) -> set:
+    """Hashed word pairs of a text (single words for a text of one word)."""
+    words = _WORD.findall(text.lower())
+    if len(words) < 2:
+        pairs = words
+    else:
+        pairs = [f"{a} {b}" for a, b in zip(words, words[1:])]
+    return {zlib.crc32(pair.encode("utf-8")) for pair in pairs}
+
+
+def report_time(report) -> float:
+    """A report's date as a POSIX timestamp, so naive and aware dates compare.
+
+    Naive dates are read as local time, as the date sort in Pagination does.
+    """
+    return report.reportDate.timestamp()
+
+
+def _scope(report) -> tuple:
+    """Reports are only compared within the same type and place."""
+    place = getattr(report, "location", None) or getattr(report, "onlinePlatform", None) or ""
+    return type(report).__name__, " ".join(place.lower().split())
+
+
+class DuplicateDetector:
+    """Flags reports that likely describe the same incident as an earlier one.
+
+    Each description gets a MinHash signature of `permutations` values over
+    its word pairs; two signatures agree in a position with probability equal
+    to the Jaccard similarity of the texts. The signature is cut into `bands`
+    bands, and reports sharing any band (in the same type and place) become
+    candidates, so a filing looks at a few hash buckets instead of every
+    report. A candidate counts as a duplicate when its estimated similarity
+    reaches `threshold` and it was filed within `window` of the new report.
+
+    Signatures older than `window` (relative to the newest report seen) are
+    dropped, so memory and the cost of a filing depend on how many reports
+    arrive within one window, not on the total. As a registry listener
+    registered before the encryption pipeline, the detector sees plaintext
+    descriptions.
+
+    A duplicate joins the group of the report it matches best; groups()
+    lists every group of two or more reports, keyed by its first report.
+    When that report is removed, the next one in the group takes its place.
+    A description with nothing but stopwords (or no words at all) is never
+    compared: every such text would share one signature and look like a
+    duplicate of every other.
+    """
+
+    def __init__(self, registry: 'ReportRegistry' = None, window: timedelta = timedelta(days=14),
+                 threshold: float = 0.5, permutations: int = 64, bands: int = 16, seed: int = 2024):
+        if permutations % bands:
+            raise ValueError("permutations must be a multiple of bands.")
+        self.window = window
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = permutations // bands
+        rng = random.Random(seed)
+        self._hashes = [(rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(permutations)]
+        self._lock = threading.Lock()
+        self._buckets = {}      # (scope, band, band hash) -> {reportID: timestamp}
+        self._signatures = {}   # reportID -> (signature, bucket keys)
+        self._recent = deque()  # (timestamp, reportID) in filing order, for expiry
+        self._newest = None
+        self._groupOf = {}      # reportID -> first report of its group (grouped reports only)
+        self._groups = {}       # first report -> [reportIDs]
+        self._matches = {}      # reportID -> IDs it duplicated when filed (duplicates only)
+        if registry is not None:
+            for report in registry:
+                self.reportAdded(report)
+            registry.addListener(self)
+
+    def signature(self, text: str) -> array:
+        values = shingles(text) or {0}
+        return array("I", (min((a * x + b) % _PRIME for x in values) & _MASK for a, b in self._hashes))
+
+    @staticmethod
+    def similarity(first: array, second: array) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+    # --- Registry listener callbacks ---
+
+    def reportAdded(self, report) -> None:
+        try:
+            description = report.plaintextDescription()
+        except ValueError:
+            return  # Encrypted with a key we no longer hold
+        if all(word in STOPWORDS for word in _WORD.findall(description.lower())):
+            return  # Nothing distinctive to compare
+        signature = self.signature(description)
+        scope = _scope(report)
+        date = report_time(report)
+        keys = [(scope, band, hash(tuple(signature[band * self.rows:(band + 1) * self.rows])))
+                for band in range(self.bands)]
+        with self._lock:
+            candidates = {}
+            for key in keys:
+                for reportID, filed in self._buckets.get(key, {}).items():
+                    candidates[reportID] = filed
+            matches = []
+            for reportID, filed in candidates.items():
+                if abs(filed - date) > self.window.total_seconds():
+                    continue
+                score = self.similarity(signature, self._signatures[reportID][0])
+                if score >= self.threshold:
+                    matches.append((score, reportID))
+            if matches:
+                matches.sort(key=lambda match: (-match[0], match[1]))
+                self._matches[report.reportID] = [reportID for _, reportID in matches]
+                best = matches[0][1]
+                root = self._groupOf.setdefault(best, best)
+                self._groups.setdefault(root, [root]).append(report.reportID)
+                self._groupOf[report.reportID] = root
+            self._signatures[report.reportID] = (signature, keys)
+            for key in keys:
+                self._buckets.setdefault(key, {})[report.reportID] = date
+            self._recent.append((date, report.reportID))
+            if self._newest is None or date > self._newest:
+                self._newest = date
+            self._expire()
+
+    def reportRemoved(self, report) -> None:
+        with self._lock:
+            self._forget(report.reportID)
+            self._matches.pop(report.reportID, None)
+            root = self._groupOf.pop(report.reportID, None)
+            members = self._groups.pop(root, None)
+            if members is not None:
+                members.remove(report.reportID)
+                if len(members) < 2:
+                    for reportID in members:
+                        self._groupOf.pop(reportID, None)
+                else:
+                    # The group is keyed by its first report, which may be the one removed.
+                    self._groups[members[0]] = members
+                    for reportID in members:
+                        self._groupOf[reportID] = members[0]
+
+    def reportUpdated(self, report, field: str, old) -> None:
+        pass  # Duplicates are judged once, at filing time.
+
+    def _forget(self, reportID: str) -> None:
+        """Drop a report's signature; it can no longer match new filings."""
+        entry = self._signatures.pop(reportID, None)
+        if entry is None:
+            return
+        for key in entry[1]:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.pop(reportID, None)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _expire(self) -> None:
+        cutoff = self._newest - self.window.total_seconds()
+        while self._recent and self._recent[0][0] < cutoff:
+            self._forget(self._recent.popleft()[1])
+
+    # --- Queries ---
+
+    def duplicatesOf(self, reportID: str) -> list:
+        """Earlier reports this one looked like when it was filed, best match first."""
+        return list(self._matches.get(reportID, ()))
+
+    def groupOf(self, reportID: str) -> str:
+        """First report of the duplicate group `reportID` belongs to (itself if none)."""
+        return self._groupOf.get(reportID, reportID)
+
+    def groups(self) -> dict:
+        """Every group of likely duplicates: first reportID -> reportIDs, in filing order."""
+        with self._lock:
+            return {root: list(members) for root, members in self._groups.items()}
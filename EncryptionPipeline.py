@@ -0,0 +1,148 @@
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from DataSecurity import SecurityManager
+
+if TYPE_CHECKING:
+    from ReportRegistry import ReportRegistry
+
+_STOP = object()
+
+
+def _install_key(keyID: str, key: bytes) -> None:
+    """Process pool initializer: give the worker the parent's report key."""
+    SecurityManager.installKey(keyID, key)
+
+
+def _encrypt_values(values: list) -> list:
+    return SecurityManager.get_instance().encrypt_many(values)
+
+
+class EncryptionPipeline:
+    """Encrypts newly filed report descriptions in the background.
+
+    Registered as a registry listener, it queues every unencrypted report
+    as it is filed. Worker threads drain the queue in batches of up to
+    `batchSize` (waiting at most `linger` seconds to fill one) and encrypt
+    each batch with a single encrypt_many call, either in the thread or,
+    with useProcesses=True, on a process pool so the work spreads across
+    cores. The queue holds at most `maxPending` reports: filing blocks
+    once it is full, which keeps a burst of filings from outrunning the
+    encryptors. flush() waits for everything queued so far; close() (also
+    run at interpreter exit) flushes and stops the workers.
+    """
+
+    def __init__(self, registry: 'ReportRegistry', batchSize: int = 64, maxPending: int = 1024,
+                 workers: int = 1, useProcesses: bool = False, linger: float = 0.005, backlog: bool = True):
+        self.registry = registry
+        self.batchSize = batchSize
+        self.linger = linger
+        self.encrypted = 0   # Reports encrypted by the pipeline so far
+        self.batches = 0
+        self._statsLock = threading.Lock()
+        self._queue = queue.Queue(maxPending)
+        self._closed = False
+        self._pool = None
+        if useProcesses:
+            self._pool = ProcessPoolExecutor(workers, initializer=_install_key,
+                                             initargs=SecurityManager.activeKey())
+        self._threads = [threading.Thread(target=self._run, name=f"encryption-{n}", daemon=True)
+                         for n in range(workers)]
+        for thread in self._threads:
+            thread.start()
+        registry.addListener(self)
+        atexit.register(self.close)
+        if backlog:
+            for report in list(registry):
+                self.submit(report)
+
+    def submit(self, report) -> None:
+        """Queue a report for encryption; blocks while the queue is full."""
+        if self._closed:
+            raise RuntimeError("Encryption pipeline is closed.")
+        if not report.encrypted:
+            self._queue.put((report, report.description))
+
+    def flush(self) -> None:
+        """Wait until every report queued so far has been encrypted."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Flush the queue, then stop the workers. Safe to call twice."""
+        if self._closed:
+            return
+        self._closed = True
+        self.registry.removeListener(self)
+        atexit.unregister(self.close)
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    # --- Registry listener callbacks ---
+
+    def reportAdded(self, report) -> None:
+        self.submit(report)
+
+    def reportRemoved(self, report) -> None:
+        pass
+
+    def reportUpdated(self, report, field: str, old) -> None:
+        pass
+
+    # --- Workers ---
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.linger
+            while len(batch) < self.batchSize:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                self._encryptBatch(batch)
+            except Exception as e:
+                # Leave the batch unencrypted; reviewReport still encrypts on demand.
+                print(f"[ERROR] Encrypting {len(batch)} reports failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stopping:
+                self._queue.task_done()
+                return
+
+    def _encryptBatch(self, batch: list) -> None:
+        pending = [(report, plaintext) for report, plaintext in batch if not report.encrypted]
+        if not pending:
+            return
+        values = [plaintext for _, plaintext in pending]
+        if self._pool is not None:
+            ciphertexts = self._pool.submit(_encrypt_values, values).result()
+        else:
+            ciphertexts = SecurityManager.get_instance().encrypt_many(values)
+        applied = 0
+        for (report, plaintext), ciphertext in zip(pending, ciphertexts):
+            # Skipped if a teacher encrypted it (or it was edited) in the meantime.
+            if report.applyEncryption(ciphertext, plaintext):
+                applied += 1
+                self.registry.notifyUpdated(report, "description")
+        with self._statsLock:
+            self.encrypted += applied
+            self.batches += 1
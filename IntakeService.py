@@ -0,0 +1,257 @@
+import asyncio
+import json
+import re
+from datetime import datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from DataSecurity import SecurityManager
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel
+from Sessions import SessionManager
+
+if TYPE_CHECKING:
+    from SchoolClass import School
+
+MAX_BODY = 64 * 1024
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def report_summary(report) -> dict:
+    """What the API shows about a report (never the description)."""
+    teacher = report.assigned_teacher
+    return {
+        "reportID": report.reportID,
+        "type": type(report).__name__,
+        "status": report.status.value,
+        "confidentialityLevel": report.confidentialityLevel.value,
+        "reportDate": report.reportDate.isoformat(),
+        "assignedTeacher": teacher.userID if teacher else None,
+    }
+
+
+def _required_text(data: dict, field: str) -> str:
+    """A non-empty string field of a request body (400 otherwise)."""
+    value = data.get(field)
+    if not isinstance(value, str) or not value.strip():
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"A {field} is required.")
+    return value
+
+
+class IntakeService:
+    """HTTP/JSON front end to a School, built on asyncio streams (stdlib only).
+
+    Endpoints (JSON in and out; all but login need "Authorization: Bearer <token>"):
+      POST /login                  {"email", "password", "role"?}  -> {"token", ...}
+      POST /logout
+      POST /reports                {"type": "in_person"|"cyber", "description",
+                                    "confidentialityLevel"?, "location"|"onlinePlatform"}
+      GET  /reports/mine
+      POST /reports/<id>/assign    {"teacherID": "T001" or null}
+      POST /reports/<id>/review    {"decrypt": true}?
+
+    Each connection is a coroutine, so hundreds of clients are served by
+    one thread. Requests run the same domain methods as the menus
+    (Student.fileReport, Administrator.assignTeacher, Teacher.reviewReport)
+    with the same validation. Those calls, like the password check, run in
+    the default executor: with a journal, storage or encryption attached
+    they may fsync, write to SQLite or wait on a full queue, and the event
+    loop must stay free for the other connections. Connections are kept
+    alive between requests unless the client asks otherwise. A request
+    that fails unexpectedly gets a 500 with a JSON error.
+    """
+
+    def __init__(self, school: 'School', sessions: SessionManager = None,
+                 host: str = "127.0.0.1", port: int = 8080):
+        self.school = school
+        self.sessions = sessions or SessionManager()
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self._server = None
+        self._routes = [
+            ("POST", re.compile(r"^/login$"), self.login),
+            ("POST", re.compile(r"^/logout$"), self.logout),
+            ("POST", re.compile(r"^/reports$"), self.fileReport),
+            ("GET", re.compile(r"^/reports/mine$"), self.myReports),
+            ("POST", re.compile(r"^/reports/([^/]+)/assign$"), self.assign),
+            ("POST", re.compile(r"^/reports/([^/]+)/review$"), self.review),
+        ]
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handleConnection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]  # In case port 0 was asked for
+        print(f"[INFO] Intake service listening on http://{self.host}:{self.port}")
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    # --- HTTP plumbing ---
+
+    async def _handleConnection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine:
+                    break
+                method, target, version = requestLine.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:
+                    writer.write(self._response(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                                {"error": "Request body too large."}, False))
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self._dispatch(method, target.split("?", 1)[0], headers, body)
+                keepAlive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                writer.write(self._response(status, payload, keepAlive))
+                await writer.drain()
+                if not keepAlive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass  # Client went away or sent garbage; just drop the connection.
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _response(status: int, payload: dict, keepAlive: bool) -> bytes:
+        body = json.dumps(payload).encode("utf-8")
+        status = HTTPStatus(status)
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keepAlive else 'close'}\r\n\r\n")
+        return head.encode("latin-1") + body
+
+    async def _dispatch(self, method: str, path: str, headers: dict, body: bytes) -> tuple:
+        self.requests += 1
+        try:
+            for routeMethod, pattern, handler in self._routes:
+                match = pattern.match(path)
+                if match and routeMethod == method:
+                    data = json.loads(body) if body else {}
+                    if not isinstance(data, dict):
+                        raise HttpError(HTTPStatus.BAD_REQUEST, "Expected a JSON object.")
+                    return await handler(headers, data, *match.groups())
+            raise HttpError(HTTPStatus.NOT_FOUND, f"No route for {method} {path}.")
+        except HttpError as e:
+            return e.status, {"error": str(e)}
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except Exception as e:
+            print(f"[ERROR] {method} {path} failed: {e!r}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."}
+
+    def _session(self, headers: dict, action: str):
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        session = self.sessions.validate(token) if scheme.lower() == "bearer" else None
+        if session is None:
+            raise HttpError(HTTPStatus.UNAUTHORIZED, "Missing, expired or unknown session token.")
+        if action and not SecurityManager.get_instance().checkPermission(session.user, action):
+            raise HttpError(HTTPStatus.FORBIDDEN, f"{session.user.role} may not {action.replace('_', ' ')}.")
+        return session
+
+    @staticmethod
+    async def _run(function, *args):
+        """Run a blocking domain call in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    def _report(self, reportID: str):
+        report = self.school.reports.getByID(reportID)
+        if report is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Report {reportID} not found.")
+        return report
+
+    # --- Endpoints ---
+
+    async def login(self, headers: dict, data: dict) -> tuple:
+        user = self.school.users.getByEmail(str(data.get("email", "")), data.get("role"))
+        session = await self._run(self.sessions.login, user, str(data.get("password", "")))
+        if session is None:
+            raise HttpError(HTTPStatus.UNAUTHORIZED, "Authentication failed.")
+        return HTTPStatus.OK, {"token": session.token, "userID": session.user.userID, "role": session.user.role}
+
+    async def logout(self, headers: dict, data: dict) -> tuple:
+        self._session(headers, None).end()
+        return HTTPStatus.OK, {}
+
+    async def fileReport(self, headers: dict, data: dict) -> tuple:
+        student = self._session(headers, "file_report").user
+        description = _required_text(data, "description")
+        level = ConfidentialityLevel(data.get("confidentialityLevel", ConfidentialityLevel.CONFIDENTIAL.value))
+        if data.get("type") == "in_person":
+            reportClass, place = InPersonReport, _required_text(data, "location")
+        elif data.get("type") == "cyber":
+            reportClass, place = CyberBullyingReport, _required_text(data, "onlinePlatform")
+        else:
+            raise HttpError(HTTPStatus.BAD_REQUEST, 'Report type must be "in_person" or "cyber".')
+        reportID = self.school.nextReportID()  # Only once the request is known to be well-formed
+        report = reportClass(reportID, datetime.now(), description, level, place)
+        if not report.validateReport():
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Report {reportID} is incomplete.")
+        if not await self._run(student.fileReport, report):
+            raise HttpError(HTTPStatus.CONFLICT, f"Report {reportID} could not be filed.")
+        return HTTPStatus.CREATED, report_summary(report)
+
+    async def myReports(self, headers: dict, data: dict) -> tuple:
+        student = self._session(headers, "file_report").user
+        return HTTPStatus.OK, {"reports": [report_summary(r) for r in self.school.reports.byReporter(student)]}
+
+    async def assign(self, headers: dict, data: dict, reportID: str) -> tuple:
+        admin = self._session(headers, "assign_staff").user
+        report = self._report(reportID)
+        teacher = None
+        teacherID = data.get("teacherID")
+        if teacherID is not None:
+            if not isinstance(teacherID, str):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "teacherID must be a string or null.")
+            teacher = self.school.users.getByID(teacherID)
+            if teacher is None or teacher.role != "Teacher":
+                raise HttpError(HTTPStatus.NOT_FOUND, f"Teacher {teacherID} not found.")
+        await self._run(admin.assignTeacher, report, teacher)
+        return HTTPStatus.OK, report_summary(report)
+
+    async def review(self, headers: dict, data: dict, reportID: str) -> tuple:
+        session = self._session(headers, "review_report")
+        report = self._report(reportID)
+        if not await self._run(session.user.reviewReport, report):
+            raise HttpError(HTTPStatus.FORBIDDEN, f"Report {reportID} is not assigned to you.")
+        result = report_summary(report)
+        if data.get("decrypt"):
+            if not SecurityManager.get_instance().checkPermission(session.user, "decrypt_report", report):
+                raise HttpError(HTTPStatus.FORBIDDEN, "You are not allowed to view this description.")
+            result["description"] = await self._run(session.decryptionCache.decrypt, report)
+        return HTTPStatus.OK, result
+
+
+def serve(school: 'School', host: str = "127.0.0.1", port: int = 8080) -> None:
+    """Run the intake service until interrupted (not with the development secret, unless TUTOK_DEV=1)."""
+    try:
+        SecurityManager.requireDeploymentKey()
+    except RuntimeError as e:
+        print(f"[ERROR] {e}")
+        return
+    try:
+        asyncio.run(IntakeService(school, host=host, port=port).serve_forever())
+    except KeyboardInterrupt:
+        print("[INFO] Intake service stopped.")
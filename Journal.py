@@ -0,0 +1,290 @@
+import json
+import os
+import threading
+import time
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from SchoolClass import School
+
+
+class JournalEvent(Enum):
+    USER_ADDED = "USER_ADDED"
+    USER_REMOVED = "USER_REMOVED"
+    USER_UPDATED = "USER_UPDATED"
+    REPORT_FILED = "REPORT_FILED"
+    REPORT_REMOVED = "REPORT_REMOVED"
+    REPORT_ASSIGNED = "REPORT_ASSIGNED"
+    REPORT_STATUS_CHANGED = "REPORT_STATUS_CHANGED"
+    REPORT_ENCRYPTED = "REPORT_ENCRYPTED"
+
+
+class Journal:
+    """Append-only, fsync'd log of report lifecycle events for one school.
+
+    The journal lives in a directory holding two files:
+      journal.log   - one JSON event per line, each with a sequence number
+      snapshot.json - full state of the school as of some sequence number
+
+    Appends are group-committed: a background writer collects every event
+    queued during a short window and writes them with a single fsync, so
+    a burst of filings pays one fsync per batch instead of one per event.
+    checkpoint() writes a snapshot and truncates the log, so recover()
+    only replays the events recorded since then.
+    """
+
+    LOG_NAME = "journal.log"
+    SNAPSHOT_NAME = "snapshot.json"
+
+    def __init__(self, directory: str, commitWindow: float = 0.002, maxBatch: int = 1024):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.logPath = os.path.join(directory, self.LOG_NAME)
+        self.snapshotPath = os.path.join(directory, self.SNAPSHOT_NAME)
+        self.commitWindow = commitWindow
+        self.maxBatch = maxBatch
+
+        lastSeq = self._readSnapshot(self.snapshotPath)["seq"] if os.path.exists(self.snapshotPath) else 0
+        validLength = 0
+        if os.path.exists(self.logPath):
+            with open(self.logPath, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        lastSeq = max(lastSeq, json.loads(line)["seq"])
+                    except ValueError:
+                        break
+                    validLength += len(line)
+
+        self._file = open(self.logPath, "ab")
+        # Drop a torn final line left by a crash so new events follow valid ones.
+        self._file.truncate(validLength)
+        self._cond = threading.Condition()
+        self._pending = []
+        self._lastSeq = lastSeq
+        self._durableSeq = lastSeq
+        self._error = None
+        self._closed = False
+        self._writer = threading.Thread(target=self._writeLoop, name="journal-writer", daemon=True)
+        self._writer.start()
+
+    # --- Writing ---
+
+    def append(self, event: JournalEvent, data: dict, wait: bool = True) -> int:
+        """Queue an event and return its sequence number.
+
+        With wait=True this blocks until the event is on disk; pass
+        wait=False during bulk intake and call sync() once at the end.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Journal is closed.")
+            self._lastSeq += 1
+            seq = self._lastSeq
+            line = json.dumps({"seq": seq, "ts": time.time(), "type": event.value, "data": data},
+                              separators=(",", ":"))
+            self._pending.append(line.encode("utf-8") + b"\n")
+            self._cond.notify_all()
+            if wait:
+                self._waitDurable(seq)
+        return seq
+
+    def sync(self) -> None:
+        """Block until every event appended so far is on disk."""
+        with self._cond:
+            self._waitDurable(self._lastSeq)
+
+    def _waitDurable(self, seq: int) -> None:
+        while self._durableSeq < seq and self._error is None:
+            self._cond.wait()
+        if self._error is not None:
+            raise self._error
+
+    def _writeLoop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                if self.commitWindow and len(self._pending) < self.maxBatch and not self._closed:
+                    # Group commit: give concurrent writers a moment to join this batch.
+                    self._cond.wait(self.commitWindow)
+                batch, self._pending = self._pending, []
+                batchSeq = self._lastSeq
+            try:
+                self._file.write(b"".join(batch))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._durableSeq = batchSeq
+                self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        self._file.close()
+
+    # --- Snapshots ---
+
+    def checkpoint(self, school: 'School') -> int:
+        """Snapshot the school's full state and truncate the log.
+
+        Returns the sequence number the snapshot covers. The snapshot is
+        written to a temporary file and renamed into place, so a crash
+        leaves either the old or the new snapshot, never a partial one.
+        """
+        with self._cond:
+            self._waitDurable(self._lastSeq)
+            seq = self._lastSeq
+            snapshot = {
+                "seq": seq,
+                "school": {"schoolID": school.schoolID, "name": school.name, "address": school.address},
+                "users": [user.toRecord() for user in school.users],
+                "reports": [report.toRecord() for report in school.reports],
+            }
+            tmpPath = self.snapshotPath + ".tmp"
+            with open(tmpPath, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmpPath, self.snapshotPath)
+            # Every logged event is now covered by the snapshot.
+            self._file.truncate(0)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        return seq
+
+    # --- Reading and recovery ---
+
+    @staticmethod
+    def _readSnapshot(path: str) -> dict:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def readEvents(path: str, afterSeq: int = 0):
+        """Yield logged events with seq > afterSeq, stopping at a torn final line."""
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partial write from a crash; it was never acknowledged.
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break
+                if event["seq"] > afterSeq:
+                    yield event
+
+    @classmethod
+    def recover(cls, directory: str) -> 'School':
+        """Rebuild a School from the latest snapshot plus the events logged after it."""
+        from SchoolClass import School
+        from Reports import ReportStatus, report_from_record
+        from UserClasses import user_from_record
+
+        school = None
+        seq = 0
+        snapshotPath = os.path.join(directory, cls.SNAPSHOT_NAME)
+        if os.path.exists(snapshotPath):
+            snapshot = cls._readSnapshot(snapshotPath)
+            seq = snapshot["seq"]
+            info = snapshot["school"]
+            school = School(info["schoolID"], info["name"], info["address"])
+            school.users.extend(user_from_record(record) for record in snapshot["users"])
+            school.reports.extend(report_from_record(record, school.users) for record in snapshot["reports"])
+
+        for event in cls.readEvents(os.path.join(directory, cls.LOG_NAME), afterSeq=seq):
+            if school is None:
+                raise ValueError(f"Journal in {directory} has events but no snapshot.")
+            kind = JournalEvent(event["type"])
+            data = event["data"]
+            if kind == JournalEvent.USER_ADDED:
+                school.users.append(user_from_record(data))
+            elif kind == JournalEvent.USER_REMOVED:
+                user = school.users.getByID(data["userID"])
+                if user is not None:
+                    school.users.remove(user)
+            elif kind == JournalEvent.USER_UPDATED:
+                user = school.users.getByID(data["userID"])
+                if user is not None:
+                    setattr(user, data["field"], data["value"])
+            elif kind == JournalEvent.REPORT_FILED:
+                school.reports.append(report_from_record(data, school.users))
+            else:
+                report = school.reports.getByID(data["reportID"])
+                if report is None:
+                    continue
+                if kind == JournalEvent.REPORT_REMOVED:
+                    school.reports.remove(report)
+                elif kind == JournalEvent.REPORT_ASSIGNED:
+                    teacherID = data["teacherID"]
+                    school.reports.updateAssignment(report, school.users.getByID(teacherID) if teacherID else None)
+                elif kind == JournalEvent.REPORT_STATUS_CHANGED:
+                    school.reports.updateStatus(report, ReportStatus(data["status"]))
+                elif kind == JournalEvent.REPORT_ENCRYPTED:
+                    report.description = data["description"]
+                    report.encrypted = True
+        if school is None:
+            raise ValueError(f"No snapshot found in {directory}.")
+        return school
+
+
+class JournalListener:
+    """Registry listener that turns School changes into journal events.
+
+    Events are appended without waiting while they are delivered; with
+    wait=True the change then waits for them to be on disk in
+    afterDelivery(), outside the delivery lock, so concurrent changes are
+    group-committed together.
+    """
+
+    def __init__(self, journal: Journal, wait: bool = True):
+        self.journal = journal
+        self.wait = wait
+
+    def afterDelivery(self) -> None:
+        if self.wait:
+            self.journal.sync()
+
+    def userAdded(self, user) -> None:
+        self.journal.append(JournalEvent.USER_ADDED, user.toRecord(), False)
+
+    def userRemoved(self, user) -> None:
+        self.journal.append(JournalEvent.USER_REMOVED, {"userID": user.userID}, False)
+
+    def userUpdated(self, user, field: str, old) -> None:
+        self.journal.append(JournalEvent.USER_UPDATED,
+                            {"userID": user.userID, "field": field, "value": getattr(user, field)}, False)
+
+    def reportAdded(self, report) -> None:
+        self.journal.append(JournalEvent.REPORT_FILED, report.toRecord(), False)
+
+    def reportRemoved(self, report) -> None:
+        self.journal.append(JournalEvent.REPORT_REMOVED, {"reportID": report.reportID}, False)
+
+    def reportUpdated(self, report, field: str, old) -> None:
+        if field == "status":
+            self.journal.append(JournalEvent.REPORT_STATUS_CHANGED,
+                                {"reportID": report.reportID, "status": report.status.value}, False)
+        elif field == "assigned_teacher":
+            teacher = report.assigned_teacher
+            self.journal.append(JournalEvent.REPORT_ASSIGNED,
+                                {"reportID": report.reportID, "teacherID": teacher.userID if teacher else None},
+                                False)
+        elif field == "description" and report.encrypted:
+            self.journal.append(JournalEvent.REPORT_ENCRYPTED,
+                                {"reportID": report.reportID, "description": report.description}, False)
@@ -0,0 +1,87 @@
+import threading
+from collections import deque
+
+
+class ListenerSet:
+    """Listeners of a registry, told about changes in the order they happened.
+
+    The registry queues events while it holds its own lock and calls
+    deliver() once it has released it, so a slow listener (a journal
+    fsync, a storage write, a full encryption queue) never holds up
+    lookups. Only one thread delivers at a time, in queue order, so
+    listeners are never called concurrently. With wait=True deliver()
+    returns once the caller's events have been delivered, possibly by
+    another thread that was already delivering. Changes that do not touch
+    indexed state (notifyUpdated) use wait=False instead: if another
+    thread is delivering, it delivers these events too. That thread may be
+    blocked inside a listener (e.g. on the full queue of the encryption
+    pipeline) waiting for the very thread that is notifying.
+
+    After a delivery, each listener with an afterDelivery() method has it
+    called outside every lock. The journal uses this to wait for its
+    fsync, so threads changing the registry at the same time share one.
+
+    A listener that changes the registry from inside a callback has its
+    events delivered after the current ones, by the same loop.
+
+    A listener that raises is reported and skipped for that event; the
+    listeners after it still get the event. The change itself is already
+    made by then, so raising to the caller (who may not even be the thread
+    that made it) would only leave the other listeners out of step.
+    """
+
+    def __init__(self):
+        self._listeners = ()
+        self._pending = deque()
+        self._delivering = threading.Lock()
+        self._owner = None
+
+    def __bool__(self) -> bool:
+        return bool(self._listeners)
+
+    def add(self, listener) -> None:
+        self._listeners = self._listeners + (listener,)
+
+    def remove(self, listener) -> None:
+        listeners = list(self._listeners)
+        listeners.remove(listener)
+        self._listeners = tuple(listeners)
+
+    def queue(self, event: str, *args) -> None:
+        if self._listeners:
+            self._pending.append((event, args))
+
+    def deliver(self, wait: bool = True) -> None:
+        if not self._listeners and not self._pending:
+            return
+        if self._owner == threading.get_ident():
+            return  # Called from inside a listener; the outer loop delivers.
+        while True:
+            # With wait=True this also waits for a delivery in progress on
+            # another thread, which may have taken our events off the queue.
+            if not self._delivering.acquire(blocking=wait):
+                return
+            self._owner = threading.get_ident()
+            try:
+                while self._pending:
+                    event, args = self._pending.popleft()
+                    for listener in self._listeners:
+                        _call(listener, event, args)
+            finally:
+                self._owner = None
+                self._delivering.release()
+            # A thread that gave up on the lock may have queued events meanwhile.
+            if not self._pending:
+                break
+        for listener in self._listeners:
+            if getattr(listener, "afterDelivery", None) is not None:
+                _call(listener, "afterDelivery", ())
+
+
+def _call(listener, event: str, args: tuple) -> None:
+    """Call one listener callback, reporting (not raising) what it raises."""
+    try:
+        getattr(listener, event)(*args)
+    except Exception as e:
+        subject = (getattr(args[0], "reportID", None) or getattr(args[0], "userID", "")) if args else ""
+        print(f"[ERROR] {type(listener).__name__}.{event}({subject}) failed: {e!r}")
@@ -1,11 +1,20 @@
+import sys
+
 from UserClasses import Teacher, Administrator, Student
-from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+from Pagination import report_page, render_report_page
+from Scheduler import AssignmentScheduler, render_plan
 from SchoolClass import School
+from Sessions import Session, SessionManager
 from DataSecurity import SecurityManager
 from datetime import datetime
 
-def student_menu(student: Student, school: School):
+def student_menu(session: Session, school: School):
+    student = session.user
     while True:
+        if not session.isValid():
+            print("[INFO] Your session has expired. Please log in again.")
+            break
         print("\n--- Student Menu ---")
         print("1. File a bullying report")
         print("2. View my reports")
@@ -17,8 +26,11 @@ def student_menu(student: Student, school: School):
             print("1. In-Person Bullying")
             print("2. Cyberbullying")
             report_type = input("Select report type: ")
+            if report_type not in ("1", "2"):
+                print("[ERROR] Invalid report type selection.")
+                continue
 
-            reportID = f"R{len(school.reports) + 1:03}"  # Generate a unique ID
+            reportID = school.nextReportID()  # Generate a unique ID once the type is accepted
             report_date = datetime.now()
             description = input("Enter report description: ")
 
@@ -42,7 +54,7 @@ def student_menu(student: Student, school: School):
                     confidentialityLevel=conf_level,
                     location=location,
                 )
-            elif report_type == "2":
+            else:
                 online_platform = input("Enter online platform (e.g., Facebook, Instagram): ")
                 report = CyberBullyingReport(
                     reportID=reportID,
@@ -51,16 +63,15 @@ def student_menu(student: Student, school: School):
                     confidentialityLevel=conf_level,
                     onlinePlatform=online_platform,
                 )
-            else:
-                print("[ERROR] Invalid report type selection.")
-                continue
 
-            student.fileReport(report)  # File report through Student method
-            print(f"[SUCCESS] Report {report.reportID} filed successfully.")
+            if student.fileReport(report):  # File report through Student method
+                print(f"[SUCCESS] Report {report.reportID} filed successfully.")
+            else:
+                print(f"[ERROR] Report {report.reportID} was not filed.")
 
         elif choice == "2":
             print("\n--- My Filed Reports ---")
-            student_reports = [r for r in school.reports if r.reporter == student]
+            student_reports = school.reports.byReporter(student)
 
             if not student_reports:
                 print("[INFO] No reports filed yet.")
@@ -71,12 +82,17 @@ def student_menu(student: Student, school: School):
 
         elif choice == "3":
             print("[INFO] Logging out...")
+            session.end()
             break
         else:
             print("[WARN] Invalid choice. Please try again.")
 
-def teacher_menu(teacher: Teacher, school: School, security_manager: SecurityManager):
+def teacher_menu(session: Session, school: School):
+    teacher = session.user
     while True:
+        if not session.isValid():
+            print("[INFO] Your session has expired. Please log in again.")
+            break
         print("\n--- Teacher Menu ---")
         print("1. Review an assigned bullying report")
         print("2. View all your assigned reports")
@@ -84,8 +100,8 @@ def teacher_menu(teacher: Teacher, school: School, security_manager: SecurityMan
         choice = input("Enter your choice: ")
 
         if choice == "1":
-            # Filter reports assigned to this teacher
-            assigned_reports = [report for report in school.reports if hasattr(report, "assigned_teacher") and report.assigned_teacher == teacher]
+            # Reports assigned to this teacher, straight from the registry index
+            assigned_reports = school.reports.byTeacher(teacher)
             if not assigned_reports:
                 print("[INFO] No reports assigned to you for review.")
                 continue
@@ -105,13 +121,17 @@ def teacher_menu(teacher: Teacher, school: School, security_manager: SecurityMan
 
             teacher.reviewReport(selected_report)
             view_details = input("\nDo you want to view the decrypted description? (y/n): ")
-            if view_details.lower() == "y":
-                decrypted = security_manager.decryptData(selected_report.description)
-                print(f"Decrypted Description: {decrypted}")
+            if view_details.lower() != "y":
+                continue
+            if not SecurityManager.get_instance().checkPermission(teacher, "decrypt_report", selected_report):
+                print("[ERROR] You are not allowed to view this description.")
+                continue
+            decrypted = session.decryptionCache.decrypt(selected_report)
+            print(f"Decrypted Description: {decrypted}")
 
         elif choice == "2":
             # Again, list only reports assigned to this teacher
-            assigned_reports = [report for report in school.reports if hasattr(report, "assigned_teacher") and report.assigned_teacher == teacher]
+            assigned_reports = school.reports.byTeacher(teacher)
             if not assigned_reports:
                 print("[INFO] No reports assigned to you.")
                 continue
@@ -122,19 +142,27 @@ def teacher_menu(teacher: Teacher, school: School, security_manager: SecurityMan
 
         elif choice == "3":
             print("[INFO] Logging out...")
+            session.end()
             break
 
         else:
             print("[WARN] Invalid choice. Please try again.")
 
-def admin_menu(administrator: Administrator, school: School, security_manager: SecurityManager):
-    available_teachers = [user for user in school.users if isinstance(user, Teacher)]  # Extract only Teachers
+def admin_menu(session: Session, school: School):
+    administrator = session.user
+    available_teachers = school.users.withRole("Teacher")  # Extract only Teachers
 
     while True:
+        if not session.isValid():
+            print("[INFO] Your session has expired. Please log in again.")
+            break
         print("\n--- Administrator Menu ---")
         print("1. Assign staff")
         print("2. View all reports")
-        print("3. Logout")
+        print("3. Dashboard summary")
+        print("4. Search reports")
+        print("5. Auto-assign unassigned reports")
+        print("6. Logout")
         choice = input("Enter your choice: ")
 
         if choice == "1":
@@ -142,72 +170,143 @@ def admin_menu(administrator: Administrator, school: School, security_manager: S
                 print("[INFO] No reports available to review.")
                 continue
 
-            reports_to_assign = [
-                {
-                    "Report ID": report.reportID,
-                    "Type": type(report).__name__,
-                    "Status": report.status.value,
-                    "Assigned Teacher": getattr(report, "assigned_teacher", None).name if hasattr(report, "assigned_teacher") and report.assigned_teacher else "None"
-                }
-                for report in school.reports
-            ]
-
-            print("\n--- Reports List ---")
-            for idx, report_info in enumerate(reports_to_assign, start=1):
-                print(f"{idx}. Report ID: {report_info['Report ID']}, Type: {report_info['Type']}, Status: {report_info['Status']}, Assigned Staff: {report_info['Assigned Teacher']}")
-
-            sel = input("Select a report number to assign a staff on the case: ")
-            try:
-                sel = int(sel)
-                if sel < 1 or sel > len(reports_to_assign):
-                    print("[ERROR] Invalid selection.")
-                    continue
-                selected_report = school.reports[sel - 1]  # Get the actual Report object
-            except ValueError:
-                print("[ERROR] Invalid input; please enter a number.")
-                continue
-
-            administrator.assignStaff(selected_report, available_teachers)
+            selected_report = browse_reports(school, "Select a report number to assign a staff on the case")
+            if selected_report is not None:
+                administrator.assignStaff(ask_case(school, selected_report), available_teachers)
 
         elif choice == "2":
-            reports_to_assign = [
-                {
-                    "Report ID": report.reportID,
-                    "Type": type(report).__name__,
-                    "Status": report.status.value,
-                    "Assigned Teacher": getattr(report, "assigned_teacher", None).name if hasattr(report, "assigned_teacher") and report.assigned_teacher else "None"
-                }
-                for report in school.reports
-            ]
-
-            print("\n--- Reports List ---")
-            for idx, report_info in enumerate(reports_to_assign, start=1):
-                print(f"{idx}. Report ID: {report_info['Report ID']}, Type: {report_info['Type']}, Status: {report_info['Status']}, Assigned Staff: {report_info['Assigned Teacher']}")
+            browse_reports(school)
 
         elif choice == "3":
+            print_dashboard(school)
+
+        elif choice == "4":
+            search_reports(school)
+
+        elif choice == "5":
+            auto_assign(school, administrator)
+
+        elif choice == "6":
             print("[INFO] Logging out...")
+            session.end()
             break
 
         else:
             print("[WARN] Invalid choice. Please try again.")
 
+def auto_assign(school: School, administrator: Administrator):
+    """Preview a balanced assignment of the whole backlog and apply it on confirmation."""
+    scheduler = AssignmentScheduler(school)
+    plan = scheduler.assign(administrator, dryRun=True)
+    sys.stdout.write(render_plan(plan, scheduler.unplaced))
+    if not plan:
+        return
+    if input("Apply these assignments? (y/n): ").strip().lower() == "y":
+        scheduler.assign(administrator, [report for report, _ in plan])
+    else:
+        print("[INFO] Nothing was assigned.")
+
+def ask_case(school: School, report):
+    """Offer to act on the whole case of a report; returns the Case or the report itself."""
+    case = school.cases.caseOf(report)
+    if len(case) < 2:
+        return report
+    others = ", ".join(item.reportID for item in case if item is not report)
+    print(f"[INFO] Report {report.reportID} is part of case {case.caseID} with {others}.")
+    if input("Apply to the whole case? (y/n): ").strip().lower() == "y":
+        return case
+    return report
+
+def search_reports(school: School, limit: int = 20):
+    """Prompt for a full-text query and print the best matching reports."""
+    print('[INFO] Words must all match; use "quotes" for a phrase and -word to exclude.')
+    query = input("Search for: ").strip()
+    if not query:
+        print("[INFO] Empty search.")
+        return
+    filters = ask_report_filters(ask_sort=False)  # Results are ranked by relevance
+    results = school.searchReports(query, limit=limit, **filters)
+    sys.stdout.write(render_report_page(results, title=f"Search results for {query!r}",
+                                        groupOf=school.duplicates.groupOf))
+
+def ask_report_filters(ask_sort: bool = True) -> dict:
+    """Prompt for the listing filters and sort order; blank answers mean "any"."""
+    status = {
+        "1": ReportStatus.NEW,
+        "2": ReportStatus.IN_PROGRESS,
+        "3": ReportStatus.RESOLVED
+    }.get(input("Filter by status (1. New, 2. In progress, 3. Resolved, blank for any): ").strip())
+    report_type = {
+        "1": InPersonReport,
+        "2": CyberBullyingReport
+    }.get(input("Filter by type (1. In-Person, 2. Cyberbullying, blank for any): ").strip())
+    assigned = {"y": True, "n": False}.get(input("Only assigned reports? (y/n, blank for any): ").strip().lower())
+    if not ask_sort:
+        return {"status": status, "reportType": report_type, "assigned": assigned}
+    sort_by = {"2": "date", "3": "status"}.get(input("Sort by (1. Report ID, 2. Date, 3. Status): ").strip(), "id")
+    return {"status": status, "reportType": report_type, "assigned": assigned, "sortBy": sort_by}
+
+def browse_reports(school: School, select_prompt: str = None, page_size: int = 20):
+    """Page through the school's reports; return the selected report if select_prompt is given."""
+    filters = ask_report_filters()
+    cursors = [None]  # cursors[i] starts page i, so "previous" is just popping one off
+    while True:
+        page, next_cursor = report_page(school.reports, page_size, cursors[-1], **filters)
+        first_number = (len(cursors) - 1) * page_size + 1
+        sys.stdout.write(render_report_page(page, start=first_number, groupOf=school.duplicates.groupOf))
+
+        options = []
+        if next_cursor is not None:
+            options.append("n=next")
+        if len(cursors) > 1:
+            options.append("p=previous")
+        options.append("q=back")
+        prompt = f"{select_prompt} ({', '.join(options)}): " if select_prompt else f"[{', '.join(options)}]: "
+        answer = input(prompt).strip().lower()
+
+        if answer == "n" and next_cursor is not None:
+            cursors.append(next_cursor)
+        elif answer == "p" and len(cursors) > 1:
+            cursors.pop()
+        elif answer == "q":
+            return None
+        elif not select_prompt:
+            print("[WARN] Invalid choice. Please try again.")
+        else:
+            try:
+                sel = int(answer) - first_number
+                if sel < 0 or sel >= len(page):
+                    print("[ERROR] Invalid selection.")
+                    continue
+                return page[sel]  # Get the actual Report object
+            except ValueError:
+                print("[ERROR] Invalid input; please enter a number.")
+
+def print_dashboard(school: School):
+    """Print the live report counters; costs the same whatever the number of reports."""
+    summary = school.dashboard.summary()
+    teacher_names = {teacher.userID: teacher.name for teacher in school.users.withRole("Teacher")}
+    print("\n--- Dashboard Summary ---")
+    print(f"Total reports: {summary['total']}")
+    print(f"Unassigned backlog: {summary['unassigned']}")
+    print("By status: " + ", ".join(f"{status.value}: {n}" for status, n in summary["byStatus"].items()))
+    print("By type: " + ", ".join(f"{name}: {n}" for name, n in summary["byType"].items()))
+    for teacherID, n in summary["byTeacher"].items():
+        print(f"  {teacher_names.get(teacherID, teacherID)}: {n} assigned (open and resolved)")
+
     
-def login_user(role_choice: str, school: School):
+def login_user(role_choice: str, school: School, sessions: SessionManager):
+    """Check the credentials once and return a new Session (None on failure)."""
     email = input("Enter your email: ").strip()
     password = input("Enter your password: ").strip()
-    for user in school.users:
-        if user.email.lower() == email.lower():
-            if role_choice == "1" and isinstance(user, Student):
-                if user.login(password):
-                    print(f"\nLogin Successful! Welcome, {user.name}!")
-                    return user
-            elif role_choice == "2" and isinstance(user, Teacher):
-                if user.login(password):
-                    print(f"\nLogin Successful! Welcome, honorable sir {user.name}!")
-                    return user
-            elif role_choice == "3" and isinstance(user, Administrator):
-                if user.login(password):
-                    print(f"\nLogin Successful! Welcome, {user.name}!")
-                    return user
+    role = {"1": "Student", "2": "Teacher", "3": "Administrator"}.get(role_choice)
+    user = school.users.getByEmail(email, role) if role else None
+    session = sessions.login(user, password)
+    if session is not None:
+        if role == "Teacher":
+            print(f"\nLogin Successful! Welcome, honorable sir {user.name}!")
+        else:
+            print(f"\nLogin Successful! Welcome, {user.name}!")
+        return session
     print("[ERROR] Authentication failed. Please check your credentials and role.")
     return None
@@ -0,0 +1,62 @@
+import heapq
+from typing import TYPE_CHECKING
+
+from ReportIDs import report_number
+
+if TYPE_CHECKING:
+    from ReportRegistry import ReportRegistry
+
+_STATUS_ORDER = {"NEW": 0, "IN_PROGRESS": 1, "RESOLVED": 2}
+
+# Sort name -> key function. Every key ends with the report number so keys
+# are unique and a cursor identifies exactly one position.
+SORT_KEYS = {
+    "id": lambda report: (report_number(report.reportID), report.reportID),
+    "date": lambda report: (report.reportDate.timestamp(), report_number(report.reportID), report.reportID),
+    "status": lambda report: (_STATUS_ORDER.get(report.status.value, 99), report_number(report.reportID), report.reportID),
+}
+
+
+def report_page(registry: 'ReportRegistry', pageSize: int = 20, cursor: tuple = None, sortBy: str = "id",
+                descending: bool = False, status=None, reportType: type = None, assigned: bool = None):
+    """Return (reports, nextCursor) for one page of a filtered, sorted listing.
+
+    cursor is the nextCursor of the previous page (None for the first).
+    Reports are streamed from ReportRegistry.iterWhere() and only the
+    `pageSize` best candidates are kept, so a page costs O(n log pageSize)
+    time and O(pageSize) memory. nextCursor is None on the last page.
+    """
+    key = SORT_KEYS[sortBy]
+    candidates = registry.iterWhere(status=status, reportType=reportType, assigned=assigned)
+    if cursor is not None:
+        if descending:
+            candidates = (r for r in candidates if key(r) < cursor)
+        else:
+            candidates = (r for r in candidates if key(r) > cursor)
+    # Take one extra to know whether another page follows.
+    pick = heapq.nlargest if descending else heapq.nsmallest
+    page = pick(pageSize + 1, candidates, key=key)
+    if len(page) > pageSize:
+        page = page[:pageSize]
+        return page, key(page[-1])
+    return page, None
+
+
+def render_report_page(reports: list, start: int = 1, title: str = "Reports List", groupOf=None) -> str:
+    """Format a page of reports as one string, ready for a single write.
+
+    groupOf (e.g. DuplicateDetector.groupOf) maps a reportID to the first
+    report of its duplicate group; reports in a group are marked.
+    """
+    lines = [f"\n--- {title} ---"]
+    for idx, report in enumerate(reports, start=start):
+        teacher = report.assigned_teacher.name if report.assigned_teacher else "None"
+        line = (f"{idx}. Report ID: {report.reportID}, Type: {type(report).__name__}, "
+                f"Status: {report.status.value}, Assigned Staff: {teacher}")
+        group = groupOf(report.reportID) if groupOf is not None else report.reportID
+        if group != report.reportID:
+            line += f", Possible duplicate of {group}"
+        lines.append(line)
+    if not reports:
+        lines.append("[INFO] No reports match the current filters.")
+    return "\n".join(lines) + "\n"
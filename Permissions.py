@@ -0,0 +1,116 @@
+from typing import TYPE_CHECKING
+
+from Reports import ConfidentialityLevel
+
+if TYPE_CHECKING:
+    from UserClasses import User
+
+
+# Actions each role may take, before per-report rules. A role also gets
+# everything its parent roles may do.
+ROLE_PERMISSIONS = {
+    "Staff": {"view_report"},
+    "Student": {"file_report", "view_report", "decrypt_report"},
+    "Teacher": {"review_report", "decrypt_report"},
+    "Administrator": {"assign_staff", "decrypt_report"},
+}
+ROLE_PARENTS = {
+    "Teacher": ("Staff",),
+    "Administrator": ("Staff",),
+}
+
+# Highest confidentiality level each role may read in plaintext.
+CLEARANCE = {
+    "Student": ConfidentialityLevel.HIGHLY_CONFIDENTIAL,   # Their own reports only, see below
+    "Teacher": ConfidentialityLevel.HIGHLY_CONFIDENTIAL,
+    "Administrator": ConfidentialityLevel.CONFIDENTIAL,
+}
+_LEVEL_ORDER = list(ConfidentialityLevel)
+
+
+def _is_reporter(user, report) -> bool:
+    return report.reporter is user
+
+
+def _is_assigned(user, report) -> bool:
+    return report.assigned_teacher is user
+
+
+# Per-report rules: (role, action) -> which of the role's reports the action applies to.
+REPORT_RULES = {
+    ("Student", "view_report"): _is_reporter,
+    ("Student", "decrypt_report"): _is_reporter,
+    ("Teacher", "review_report"): _is_assigned,
+    ("Teacher", "decrypt_report"): _is_assigned,
+}
+
+
+class PermissionPolicy:
+    """Role/action permissions compiled once into bitmasks.
+
+    Every action gets a bit and every role a mask holding its own and its
+    ancestors' actions, so a role-level check is one dict lookup and an
+    AND. Per-report checks add the report rule for (role, action), if any,
+    and the confidentiality gate for decryption; the allowed levels are
+    precomputed as a frozenset per role.
+    """
+
+    def __init__(self, rolePermissions: dict = None, roleParents: dict = None,
+                 clearance: dict = None, reportRules: dict = None):
+        rolePermissions = ROLE_PERMISSIONS if rolePermissions is None else rolePermissions
+        roleParents = ROLE_PARENTS if roleParents is None else roleParents
+        clearance = CLEARANCE if clearance is None else clearance
+        self.reportRules = dict(REPORT_RULES if reportRules is None else reportRules)
+
+        actions = sorted({action for granted in rolePermissions.values() for action in granted})
+        self.actionBits = {action: 1 << n for n, action in enumerate(actions)}
+        self.roleMasks = {role: self._compileRole(role, rolePermissions, roleParents, ())
+                          for role in set(rolePermissions) | set(roleParents)}
+        self.readableLevels = {
+            role: frozenset(_LEVEL_ORDER[:_LEVEL_ORDER.index(level) + 1])
+            for role, level in clearance.items()
+        }
+
+    def _compileRole(self, role: str, rolePermissions: dict, roleParents: dict, seen: tuple) -> int:
+        if role in seen:
+            raise ValueError(f"Role hierarchy has a cycle through {role}.")
+        mask = 0
+        for action in rolePermissions.get(role, ()):
+            mask |= self.actionBits[action]
+        for parent in roleParents.get(role, ()):
+            mask |= self._compileRole(parent, rolePermissions, roleParents, seen + (role,))
+        return mask
+
+    def allows(self, user: 'User', action: str, report=None) -> bool:
+        """Whether `user` may take `action`, on `report` if one is given."""
+        bit = self.actionBits.get(action)
+        if bit is None or not self.roleMasks.get(user.role, 0) & bit:
+            return False
+        if report is None:
+            return True
+        rule = self.reportRules.get((user.role, action))
+        if rule is not None and not rule(user, report):
+            return False
+        if action == "decrypt_report":
+            return report.confidentialityLevel in self.readableLevels.get(user.role, ())
+        return True
+
+    def filter(self, user: 'User', reports, action: str = "view_report") -> list:
+        """The reports in `reports` that `user` may take `action` on, in one pass."""
+        bit = self.actionBits.get(action)
+        if bit is None or not self.roleMasks.get(user.role, 0) & bit:
+            return []
+        rule = self.reportRules.get((user.role, action))
+        levels = self.readableLevels.get(user.role, frozenset()) if action == "decrypt_report" else None
+        if rule is _is_assigned:
+            reports = [r for r in reports if r.assigned_teacher is user]
+        elif rule is _is_reporter:
+            reports = [r for r in reports if r.reporter is user]
+        elif rule is not None:
+            reports = [r for r in reports if rule(user, r)]
+        if levels is not None:
+            return [r for r in reports if r.confidentialityLevel in levels]
+        return list(reports)
+
+
+DEFAULT_POLICY = PermissionPolicy()
@@ -0,0 +1,185 @@
+import csv
+import gzip
+import io
+import json
+import os
+from typing import TYPE_CHECKING
+
+from DataSecurity import SecurityManager
+from Reports import ConfidentialityLevel
+
+if TYPE_CHECKING:
+    from SchoolClass import School
+
+# What an export does with the description at each confidentiality level:
+# "plain" writes the plaintext, "encrypted" the ciphertext, "redacted" nothing.
+DEFAULT_DESCRIPTIONS = {
+    ConfidentialityLevel.PUBLIC: "plain",
+    ConfidentialityLevel.CONFIDENTIAL: "encrypted",
+    ConfidentialityLevel.HIGHLY_CONFIDENTIAL: "redacted",
+}
+
+# CSV columns; list fields (witnesses, evidence) are written as JSON arrays.
+FIELDS = ["reportID", "type", "reportDate", "confidentialityLevel", "status", "reporterID", "teacherID",
+          "description", "encrypted", "redacted", "location", "witnesses", "onlinePlatform", "evidence"]
+
+# Records written between two saves of the cursor file.
+SEGMENT_SIZE = 1000
+
+
+def iter_reports(school: 'School', after: str = None):
+    """Yield a school's reports in ID order, starting after the report ID `after`."""
+    yield from school.reports.iterByID(after)
+
+
+def cursor_path(path: str) -> str:
+    """Where the resume cursor of an export to `path` is kept."""
+    return path + ".cursor"
+
+
+class ReportExporter:
+    """Writes a school's reports to JSON lines or CSV, one record at a time.
+
+    The format comes from the extension (.jsonl or .csv, gzip-compressed
+    when it ends in .gz). Records are built from BullyingReport.toRecord(),
+    so they carry the type-specific fields (location and witnesses, or
+    onlinePlatform and evidence). The description follows `descriptions`
+    (DEFAULT_DESCRIPTIONS unless given): stored ciphertext is decrypted
+    for "plain", plaintext is encrypted for the export only for
+    "encrypted", and "redacted" drops it.
+
+    Only one report and one output record are held at a time. Records are
+    written in segments of `segmentSize`; each segment is flushed to disk
+    (as a complete gzip member for .gz) before the ID of its last report
+    and the file size are saved next to the output (cursor_path(path)).
+    `cursor` is that ID. resume(path) truncates the file back to the last
+    saved segment and appends the rest, so a crash mid-segment leaves no
+    partial or repeated records. The cursor file is removed once the
+    export completes.
+    """
+
+    def __init__(self, school: 'School', descriptions: dict = None, segmentSize: int = SEGMENT_SIZE):
+        self.school = school
+        self.descriptions = dict(DEFAULT_DESCRIPTIONS, **(descriptions or {}))
+        self.segmentSize = segmentSize
+        self.cursor = None
+
+    def record(self, report) -> dict:
+        """The export record of one report, with its description treated per policy."""
+        record = report.toRecord()
+        del record["blindIndex"]  # Keyed search tokens stay inside the system
+        mode = self.descriptions[report.confidentialityLevel]
+        security = SecurityManager.get_instance()
+        record["redacted"] = mode == "redacted"
+        if mode == "redacted":
+            record["description"] = None
+            record["encrypted"] = False
+        elif mode == "plain" and record["encrypted"]:
+            record["description"] = security.decryptData(record["description"])
+            record["encrypted"] = False
+        elif mode == "encrypted" and not record["encrypted"]:
+            record["description"] = security.encryptData(record["description"])
+            record["encrypted"] = True
+        return record
+
+    def records(self, after: str = None):
+        for report in iter_reports(self.school, after):
+            yield report.reportID, self.record(report)
+
+    def export(self, path: str, after: str = None) -> int:
+        """Write every report after `after` (all of them if None) to `path`; returns the count.
+
+        With after=None the file is started over. Otherwise the rest is
+        appended, from the size saved with `after` in the cursor file if
+        there is one.
+        """
+        name = path[:-3] if path.endswith(".gz") else path
+        if not name.endswith((".jsonl", ".csv")):
+            raise ValueError(f"Unsupported export format: {path} (use .jsonl or .csv).")
+        saved = self._loadCursor(path)
+        if after is None:
+            size = 0
+        elif saved is not None and saved["cursor"] == after:
+            size = saved["size"]
+        else:
+            size = os.path.getsize(path)
+        self.cursor = after
+        isCSV, compressed = name.endswith(".csv"), path.endswith(".gz")
+        header = size == 0 and isCSV
+        written = 0
+        records = self.records(after)
+        with open(path, "r+b" if size else "wb") as f:
+            f.truncate(size)
+            f.seek(size)
+            while True:
+                count = self._writeSegment(f, records, isCSV, compressed, header)
+                header = False
+                if not count:
+                    break
+                written += count
+                self._saveCursor(path, f.tell())
+        if os.path.exists(cursor_path(path)):
+            os.remove(cursor_path(path))
+        return written
+
+    def resume(self, path: str) -> int:
+        """Finish an interrupted export to `path` from its saved cursor (the whole export if none)."""
+        saved = self._loadCursor(path)
+        return self.export(path, saved["cursor"] if saved is not None else None)
+
+    def _writeSegment(self, f, records, isCSV: bool, compressed: bool, header: bool) -> int:
+        """Write up to segmentSize records and flush them to disk; returns how many were written."""
+        first = next(records, None)
+        if first is None and not header:
+            return 0
+        member = gzip.GzipFile(fileobj=f, mode="wb") if compressed else None
+        stream = io.TextIOWrapper(member or f, encoding="utf-8", newline="")
+        if isCSV:
+            writer = csv.DictWriter(stream, fieldnames=FIELDS, extrasaction="ignore")
+            if header:
+                writer.writeheader()
+            write = writer.writerow
+        else:
+            write = lambda record: stream.write(json.dumps(record) + "\n")
+        count = 0
+        try:
+            item = first
+            while item is not None:
+                reportID, record = item
+                if isCSV:
+                    record["witnesses"] = json.dumps(record["witnesses"]) if "witnesses" in record else ""
+                    record["evidence"] = json.dumps(record["evidence"]) if "evidence" in record else ""
+                write(record)
+                count += 1
+                if count == self.segmentSize:
+                    break
+                item = next(records, None)
+        finally:
+            stream.flush()
+            stream.detach()
+            if member is not None:
+                member.close()  # Ends the gzip member; the file itself stays open
+        f.flush()
+        os.fsync(f.fileno())
+        if count:
+            self.cursor = reportID
+        return count
+
+    def _saveCursor(self, path: str, size: int) -> None:
+        temp = cursor_path(path) + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({"cursor": self.cursor, "size": size}, f)
+        os.replace(temp, cursor_path(path))
+
+    @staticmethod
+    def _loadCursor(path: str) -> dict:
+        try:
+            with open(cursor_path(path), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+
+def export_reports(school: 'School', path: str, after: str = None, descriptions: dict = None) -> int:
+    """Export a school's reports to a .jsonl/.csv(.gz) file (see ReportExporter)."""
+    return ReportExporter(school, descriptions).export(path, after)
@@ -0,0 +1,78 @@
+import re
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from SchoolClass import School
+
+_ID_PATTERN = re.compile(r"^R(\d+)$")
+
+
+def report_number(reportID: str) -> int:
+    """Numeric part of an "R001"-style report ID, or 0 if it has another shape."""
+    match = _ID_PATTERN.match(reportID)
+    return int(match.group(1)) if match else 0
+
+
+def format_report_id(number: int) -> str:
+    """Format a report number as R001, R002, ... (R1000 and up simply get longer)."""
+    return f"R{number:03}"
+
+
+class ReportIDAllocator:
+    """Hands out unique, increasing report IDs for one School.
+
+    Numbers are reserved from the school's storage backend in blocks of
+    `blockSize`, so the persisted counter is touched once per block
+    rather than once per report, and two processes sharing a database
+    never receive the same block. A school without storage counts in
+    memory instead. Within a block, taking the next number
+    is a single step on a range iterator, which needs no lock; the lock
+    is only taken to fetch a new block.
+    """
+
+    SEQUENCE_NAME = "report"
+
+    def __init__(self, school: 'School', blockSize: int = 64):
+        self.school = school
+        self.blockSize = blockSize
+        self._block = iter(())
+        self._lock = threading.Lock()
+        self._seeded = False
+        self._next = 1  # Next unreserved number when the school has no storage
+
+    def _refill(self, exhausted) -> None:
+        with self._lock:
+            if self._block is not exhausted:
+                return  # Another thread already fetched a new block.
+            minimum = 1
+            if not self._seeded:
+                # Never go below IDs that already exist (dummy data, older stores).
+                minimum = max((report_number(r.reportID) for r in self.school.reports), default=0) + 1
+                self._seeded = True
+            storage = self.school.storage
+            if storage is not None:
+                start = storage.reserveSequence(self.school.schoolID, self.SEQUENCE_NAME, self.blockSize, minimum)
+            else:
+                start = max(self._next, minimum)
+            self._next = start + self.blockSize
+            self._block = iter(range(start, start + self.blockSize))
+
+    def allocate(self) -> str:
+        """Return a report ID that no registered report uses."""
+        while True:
+            block = self._block
+            try:
+                number = next(block)
+            except StopIteration:
+                self._refill(block)
+                continue
+            reportID = format_report_id(number)
+            if self.school.reports.getByID(reportID) is None:
+                return reportID
+
+    def reset(self) -> None:
+        """Drop the current block, e.g. after the school switched storage."""
+        with self._lock:
+            self._block = iter(())
+            self._seeded = False
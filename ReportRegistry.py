@@ -0,0 +1,348 @@
+import bisect
+import threading
+from collections.abc import MutableSequence
+from typing import TYPE_CHECKING
+
+from Listeners import ListenerSet
+from ReportIDs import report_number
+
+if TYPE_CHECKING:
+    from Reports import BullyingReport, ReportStatus
+    from UserClasses import Teacher
+
+
+# Reports copied out per lock acquisition by the ID-order walks.
+_CHUNK = 256
+
+
+def _userKey(user) -> str:
+    """Index key for a reporter or assigned teacher (None when there is none)."""
+    return user.userID if user is not None else None
+
+
+class ReportRegistry(MutableSequence):
+    """List of reports held by a School, with secondary indexes.
+
+    Behaves like the plain list School.reports used to be, so existing code
+    can keep appending, clearing and indexing it. On top of that it keeps
+    indexes by reportID, reporter userID, assigned teacher userID, status
+    and report type, so lookups cost O(result size) instead of a full scan.
+
+    Status and assignment changes must go through updateStatus() and
+    updateAssignment() (or their compare-and-set forms) so the indexes
+    stay in sync.
+
+    The registry is safe to share between threads. Every change to the
+    list and its indexes happens under one short-held lock, and the
+    lookups return snapshot lists taken under it, so a listing is never
+    torn by a concurrent filing.
+
+    Listeners added with addListener() are told about every change through
+    reportAdded(report), reportRemoved(report) and
+    reportUpdated(report, field, old), where old is the field's previous value.
+    Events are queued under the lock but delivered after it is released, so
+    lookups never wait on a listener's disk write. Listeners are called in
+    the order the changes happened and one at a time, and a change returns
+    once its events have been delivered (see Listeners.ListenerSet). By then
+    the report may have changed again, so a listener should apply the
+    report's current fields rather than assume they hold the value set by
+    the change it is told about.
+    """
+
+    def __init__(self, reports=None):
+        self._listeners = ListenerSet()
+        self._lock = threading.RLock()
+        self._reports = []
+        self._byID = {}
+        self._byReporter = {}
+        self._byTeacher = {}
+        self._byStatus = {}
+        self._byType = {}
+        self._ordered = []  # Sorted (report number, reportID) of every report, for iterByID
+        if reports:
+            self.extend(reports)
+
+    # --- Listeners ---
+
+    def addListener(self, listener) -> None:
+        self._listeners.add(listener)
+
+    def removeListener(self, listener) -> None:
+        self._listeners.remove(listener)
+
+    # --- Index maintenance (callers hold self._lock) ---
+
+    @staticmethod
+    def _addTo(index: dict, key, report) -> None:
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = {}
+        bucket[report.reportID] = report
+
+    @staticmethod
+    def _removeFrom(index: dict, key, report) -> None:
+        bucket = index.get(key)
+        if bucket is not None and bucket.get(report.reportID) is report:
+            del bucket[report.reportID]
+            if not bucket:
+                del index[key]
+
+    def _index(self, report) -> None:
+        if report.reportID in self._byID:
+            raise ValueError(f"Report {report.reportID} is already registered.")
+        self._byID[report.reportID] = report
+        bisect.insort(self._ordered, (report_number(report.reportID), report.reportID))  # Usually at the end
+        self._addTo(self._byReporter, _userKey(report.reporter), report)
+        self._addTo(self._byTeacher, _userKey(report.assigned_teacher), report)
+        self._addTo(self._byStatus, report.status, report)
+        self._addTo(self._byType, type(report), report)
+        self._listeners.queue("reportAdded", report)
+
+    def _unindex(self, report) -> None:
+        if self._byID.get(report.reportID) is not report:
+            return
+        del self._byID[report.reportID]
+        key = (report_number(report.reportID), report.reportID)
+        del self._ordered[bisect.bisect_left(self._ordered, key)]
+        self._removeFrom(self._byReporter, _userKey(report.reporter), report)
+        self._removeFrom(self._byTeacher, _userKey(report.assigned_teacher), report)
+        self._removeFrom(self._byStatus, report.status, report)
+        self._removeFrom(self._byType, type(report), report)
+        self._listeners.queue("reportRemoved", report)
+
+    def _delete(self, index) -> None:
+        removed = self._reports[index]
+        for report in (removed if isinstance(index, slice) else [removed]):
+            self._unindex(report)
+        del self._reports[index]
+
+    def _setStatus(self, report, status) -> None:
+        old = report.status
+        if report in self:
+            self._removeFrom(self._byStatus, old, report)
+            self._addTo(self._byStatus, status, report)
+            self._listeners.queue("reportUpdated", report, "status", old)
+        report.status = status
+
+    def _setAssignment(self, report, teacher) -> None:
+        old = report.assigned_teacher
+        if report in self:
+            self._removeFrom(self._byTeacher, _userKey(old), report)
+            self._addTo(self._byTeacher, _userKey(teacher), report)
+            self._listeners.queue("reportUpdated", report, "assigned_teacher", old)
+        report.assigned_teacher = teacher
+
+    # --- MutableSequence interface ---
+
+    def __getitem__(self, index):
+        return self._reports[index]
+
+    def __setitem__(self, index, value) -> None:
+        try:
+            with self._lock:
+                if isinstance(index, slice):
+                    for report in self._reports[index]:
+                        self._unindex(report)
+                    new = list(value)
+                    for report in new:
+                        self._index(report)
+                    self._reports[index] = new
+                else:
+                    self._unindex(self._reports[index])
+                    self._index(value)
+                    self._reports[index] = value
+        finally:
+            self._listeners.deliver()
+
+    def __delitem__(self, index) -> None:
+        with self._lock:
+            self._delete(index)
+        self._listeners.deliver()
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __contains__(self, report) -> bool:
+        reportID = getattr(report, "reportID", None)
+        return reportID is not None and self._byID.get(reportID) is report
+
+    def __repr__(self) -> str:
+        return f"ReportRegistry({self.snapshot()!r})"
+
+    def snapshot(self) -> list:
+        """A consistent copy of the report list, in filing order."""
+        with self._lock:
+            return self._reports[:]
+
+    def insert(self, index: int, report) -> None:
+        with self._lock:
+            self._index(report)
+            self._reports.insert(index, report)
+        self._listeners.deliver()
+
+    def append(self, report) -> None:
+        with self._lock:
+            self._index(report)
+            self._reports.append(report)
+        self._listeners.deliver()
+
+    def remove(self, report) -> None:
+        with self._lock:
+            self._delete(self._reports.index(report))
+        self._listeners.deliver()
+
+    def pop(self, index: int = -1):
+        with self._lock:
+            report = self._reports[index]
+            self._delete(index)
+        self._listeners.deliver()
+        return report
+
+    def clear(self) -> None:
+        with self._lock:
+            for report in self._reports:
+                self._listeners.queue("reportRemoved", report)
+            self._reports.clear()
+            self._byID.clear()
+            self._byReporter.clear()
+            self._byTeacher.clear()
+            self._byStatus.clear()
+            self._byType.clear()
+            self._ordered.clear()
+        self._listeners.deliver()
+
+    # --- State transitions ---
+
+    def updateStatus(self, report: 'BullyingReport', status: 'ReportStatus') -> None:
+        """Change a report's status and move it to the matching status index."""
+        with self._lock:
+            self._setStatus(report, status)
+        self._listeners.deliver()
+
+    def compareAndSetStatus(self, report: 'BullyingReport', expected: 'ReportStatus', status: 'ReportStatus') -> bool:
+        """Change the status only if it is still `expected`; False if another change won."""
+        with self._lock:
+            if report.status != expected:
+                return False
+            self._setStatus(report, status)
+        self._listeners.deliver()
+        return True
+
+    def updateAssignment(self, report: 'BullyingReport', teacher: 'Teacher') -> None:
+        """Assign (or with None, unassign) a teacher and update the teacher index."""
+        with self._lock:
+            self._setAssignment(report, teacher)
+        self._listeners.deliver()
+
+    def compareAndSetAssignment(self, report: 'BullyingReport', expected: 'Teacher', teacher: 'Teacher') -> bool:
+        """Assign `teacher` only if the report is still assigned to `expected` (None: unassigned)."""
+        with self._lock:
+            if report.assigned_teacher is not expected:
+                return False
+            self._setAssignment(report, teacher)
+        self._listeners.deliver()
+        return True
+
+    def notifyUpdated(self, report: 'BullyingReport', field: str, old=None) -> None:
+        """Tell listeners about an in-place change to a non-indexed field."""
+        if report in self:
+            self._listeners.queue("reportUpdated", report, field, old)
+            self._listeners.deliver(wait=False)
+
+    # --- Lookups ---
+
+    def getByID(self, reportID: str):
+        """Return the report with the given ID, or None."""
+        return self._byID.get(reportID)
+
+    def iterByID(self, after: str = None):
+        """Yield reports in ID order (Pagination.SORT_KEYS["id"]), starting after the report ID `after`.
+
+        Walks the registry's sorted ID index a chunk of reports at a time,
+        each chunk copied under the lock, so memory stays constant whatever
+        the number of reports and gaps between IDs cost nothing. Reports
+        filed during the walk are included if their ID is still ahead of it.
+        """
+        cursor = (report_number(after), after) if after is not None else None
+        while True:
+            with self._lock:
+                start = bisect.bisect_right(self._ordered, cursor) if cursor is not None else 0
+                keys = self._ordered[start:start + _CHUNK]
+                reports = [self._byID[reportID] for _, reportID in keys]
+            if not keys:
+                return
+            yield from reports
+            cursor = keys[-1]
+
+    def byReporter(self, reporter) -> list:
+        """Reports filed by the given Student (or userID)."""
+        key = reporter if isinstance(reporter, str) or reporter is None else reporter.userID
+        with self._lock:
+            return list(self._byReporter.get(key, {}).values())
+
+    def byTeacher(self, teacher) -> list:
+        """Reports assigned to the given Teacher (or userID); None for unassigned."""
+        key = teacher if isinstance(teacher, str) or teacher is None else teacher.userID
+        with self._lock:
+            return list(self._byTeacher.get(key, {}).values())
+
+    def unassigned(self) -> list:
+        """Reports with no assigned teacher."""
+        return self.byTeacher(None)
+
+    def byStatus(self, status: 'ReportStatus') -> list:
+        """Reports currently in the given status."""
+        with self._lock:
+            return list(self._byStatus.get(status, {}).values())
+
+    def byType(self, reportType: type) -> list:
+        """Reports of the given class (e.g. InPersonReport)."""
+        with self._lock:
+            return list(self._byType.get(reportType, {}).values())
+
+    def indexSizes(self) -> dict:
+        """Number of reports in each index bucket, read together under the lock.
+
+        Returns {"total": n, "byStatus": {status: n}, "byType": {class: n},
+        "byTeacher": {teacher userID or None: n}}; empty buckets are left out.
+        """
+        with self._lock:
+            return {
+                "total": len(self._reports),
+                "byStatus": {status: len(bucket) for status, bucket in self._byStatus.items()},
+                "byType": {reportType: len(bucket) for reportType, bucket in self._byType.items()},
+                "byTeacher": {teacherID: len(bucket) for teacherID, bucket in self._byTeacher.items()},
+            }
+
+    def iterWhere(self, status: 'ReportStatus' = None, reportType: type = None, assigned: bool = None):
+        """Yield reports matching every given filter.
+
+        assigned=True keeps only reports with a teacher, False only those
+        without. With a status, type or assigned=False filter, iteration
+        runs over a snapshot of the smallest matching index bucket, which
+        holds the candidates and nothing else. Otherwise the whole registry
+        is walked in ID order through iterByID(), a chunk at a time, so the
+        full list is never copied.
+        """
+        with self._lock:
+            buckets = []
+            if status is not None:
+                buckets.append(self._byStatus.get(status, {}))
+            if reportType is not None:
+                buckets.append(self._byType.get(reportType, {}))
+            if assigned is False:
+                buckets.append(self._byTeacher.get(None, {}))
+            source = list(min(buckets, key=len).values()) if buckets else None
+        if source is None:
+            source = self.iterByID()
+        for report in source:
+            if status is not None and report.status != status:
+                continue
+            if reportType is not None and type(report) is not reportType:
+                continue
+            if assigned is not None and (report.assigned_teacher is not None) != assigned:
+                continue
+            yield report
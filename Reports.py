@@ -1,5 +1,8 @@
+import base64
+import sys
+import threading
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -20,7 +23,28 @@ class ConfidentialityLevel(Enum):
     HIGHLY_CONFIDENTIAL = "HIGHLY_CONFIDENTIAL"
 
 
+# Guards the description/encrypted pair, which the background encryption
+# pipeline and a reviewing teacher may both try to change.
+_encryptionLock = threading.Lock()
+
+# Naive report dates are stored as whole microseconds since this epoch: one
+# int per report instead of a datetime object.
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _intern(value):
+    """Intern a place name so reports from the same place share one string (None stays None)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class BullyingReport(ABC):
+    # Reports are held by the hundred thousand, so they use __slots__ instead
+    # of a per-instance __dict__. Every attribute a report can carry is
+    # declared here, including assigned_teacher.
+    __slots__ = ("reportID", "_reportDate", "description", "confidentialityLevel", "status",
+                 "encrypted", "reporter", "assigned_teacher", "blindIndex")
+
     def __init__(self, reportID: str, reportDate: datetime, description: str,
                  confidentialityLevel: ConfidentialityLevel, reporter: 'Student' = None):
         self.reportID = reportID
@@ -30,6 +54,22 @@ class BullyingReport(ABC):
         self.status = ReportStatus.NEW
         self.encrypted = False
         self.reporter = reporter
+        self.assigned_teacher = None
+        self.blindIndex = None  # (keyID, packed tokens) once BlindIndex has seen it
+
+    @property
+    def reportDate(self) -> datetime:
+        value = self._reportDate
+        if isinstance(value, int):
+            return _EPOCH + value * _MICROSECOND
+        return value  # Timezone-aware dates are kept as they are.
+
+    @reportDate.setter
+    def reportDate(self, value: datetime) -> None:
+        if value.tzinfo is None:
+            self._reportDate = (value - _EPOCH) // _MICROSECOND
+        else:
+            self._reportDate = value
 
     @abstractmethod
     def validateReport(self) -> bool:
@@ -39,46 +79,175 @@ class BullyingReport(ABC):
     def encryptDetails(self) -> None:
         pass
 
+    def _encryptDescription(self) -> bool:
+        """Encrypt the description in place; False if it already was encrypted."""
+        from DataSecurity import SecurityManager
+
+        with _encryptionLock:
+            if self.encrypted:
+                return False
+            self.description = SecurityManager.get_instance().encryptData(self.description)
+            self.encrypted = True
+            return True
+
+    def applyEncryption(self, ciphertext: str, plaintext: str) -> bool:
+        """Install a ciphertext computed elsewhere (e.g. in a batch).
+
+        Only succeeds if the report is still unencrypted and its description
+        is still the plaintext that was encrypted.
+        """
+        with _encryptionLock:
+            if self.encrypted or self.description != plaintext:
+                return False
+            self.description = ciphertext
+            self.encrypted = True
+            return True
+
+    def descriptionState(self) -> tuple:
+        """(description, encrypted) read together, so a concurrent encryption can't tear the pair."""
+        with _encryptionLock:
+            return self.description, self.encrypted
+
+    def plaintextDescription(self) -> str:
+        """The description in plaintext, decrypting it if it has already been encrypted."""
+        from DataSecurity import SecurityManager
+
+        description, encrypted = self.descriptionState()
+        return SecurityManager.get_instance().decryptData(description) if encrypted else description
+
+    def toRecord(self) -> dict:
+        """Flat, JSON-friendly representation used by storage backends."""
+        teacher = self.assigned_teacher
+        description, encrypted = self.descriptionState()
+        return {
+            "reportID": self.reportID,
+            "type": type(self).__name__,
+            "reportDate": self.reportDate.isoformat(),
+            "description": description,
+            "confidentialityLevel": self.confidentialityLevel.value,
+            "status": self.status.value,
+            "encrypted": encrypted,
+            "reporterID": self.reporter.userID if self.reporter else None,
+            "teacherID": teacher.userID if teacher else None,
+            "blindIndex": format_blind_index(self.blindIndex),
+        }
+
 
 class InPersonReport(BullyingReport):
+    __slots__ = ("location", "_witnesses")
+
     def __init__(self, reportID: str, reportDate: datetime, description: str,
                  confidentialityLevel: ConfidentialityLevel, location: str,
                  reporter: 'Student' = None, witnesses: list = None):
         super().__init__(reportID, reportDate, description, confidentialityLevel, reporter)
-        self.location = location
-        self.witnesses = witnesses if witnesses is not None else []
+        self.location = _intern(location)  # Shared by every report from the same place
+        self._witnesses = witnesses or None
+
+    @property
+    def witnesses(self) -> list:
+        """Witness list, only allocated once something reads or adds to it."""
+        if self._witnesses is None:
+            self._witnesses = []
+        return self._witnesses
+
+    @witnesses.setter
+    def witnesses(self, value: list) -> None:
+        self._witnesses = value or None
+
+    def witnessNames(self):
+        """The witnesses for reading only; unlike .witnesses, never allocates a list."""
+        return self._witnesses or ()
 
     def validateReport(self) -> bool:
         return bool(self.description and self.location)
 
+    def toRecord(self) -> dict:
+        record = super().toRecord()
+        record["location"] = self.location
+        record["witnesses"] = list(self._witnesses or ())
+        return record
+
     def encryptDetails(self) -> None:
-        if not self.encrypted:
-            from DataSecurity import SecurityManager
-            sec_mgr = SecurityManager()
-            self.description = sec_mgr.encryptData(self.description)
-            self.encrypted = True
+        if self._encryptDescription():
             print(f"[SECURITY] InPersonReport {self.reportID} details encrypted.")
         else:
             print(f"[SECURITY] InPersonReport {self.reportID} is already encrypted.")
 
 
 class CyberBullyingReport(BullyingReport):
+    __slots__ = ("onlinePlatform", "_evidence")
+
     def __init__(self, reportID: str, reportDate: datetime, description: str,
                  confidentialityLevel: ConfidentialityLevel, onlinePlatform: str,
                  reporter: 'Student' = None, evidence: list = None):
         super().__init__(reportID, reportDate, description, confidentialityLevel, reporter)
-        self.onlinePlatform = onlinePlatform
-        self.evidence = evidence if evidence is not None else []
+        self.onlinePlatform = _intern(onlinePlatform)  # Shared by every report from the same platform
+        self._evidence = evidence or None
+
+    @property
+    def evidence(self) -> list:
+        """Evidence list, only allocated once something reads or adds to it."""
+        if self._evidence is None:
+            self._evidence = []
+        return self._evidence
+
+    @evidence.setter
+    def evidence(self, value: list) -> None:
+        self._evidence = value or None
 
     def validateReport(self) -> bool:
         return bool(self.description and self.onlinePlatform)
 
+    def toRecord(self) -> dict:
+        record = super().toRecord()
+        record["onlinePlatform"] = self.onlinePlatform
+        record["evidence"] = list(self._evidence or ())
+        return record
+
     def encryptDetails(self) -> None:
-        if not self.encrypted:
-            from DataSecurity import SecurityManager
-            sec_mgr = SecurityManager()
-            self.description = sec_mgr.encryptData(self.description)
-            self.encrypted = True
+        if self._encryptDescription():
             print(f"[SECURITY] CyberBullyingReport {self.reportID} details encrypted.")
         else:
             print(f"[SECURITY] CyberBullyingReport {self.reportID} is already encrypted.")
+
+
+def format_blind_index(blindIndex: tuple) -> str:
+    """Record form of a report's blind index tokens: "<keyID>$<tokens, base64url>"."""
+    if blindIndex is None:
+        return None
+    keyID, tokens = blindIndex
+    return f"{keyID}${base64.urlsafe_b64encode(tokens).decode('ascii')}"
+
+
+def parse_blind_index(text: str) -> tuple:
+    if not text:
+        return None
+    keyID, tokens = text.split("$", 1)
+    return keyID, base64.urlsafe_b64decode(tokens)
+
+
+def report_from_record(record: dict, users=None) -> BullyingReport:
+    """Rebuild a report from BullyingReport.toRecord() output.
+
+    users is anything with a getByID() method (normally School.users) and is
+    used to resolve the reporter and assigned teacher.
+    """
+    common = dict(
+        reportID=record["reportID"],
+        reportDate=datetime.fromisoformat(record["reportDate"]),
+        description=record["description"],
+        confidentialityLevel=ConfidentialityLevel(record["confidentialityLevel"]),
+        reporter=users.getByID(record["reporterID"]) if users is not None and record.get("reporterID") else None,
+    )
+    if record["type"] == "InPersonReport":
+        report = InPersonReport(location=record["location"], witnesses=record.get("witnesses") or None, **common)
+    elif record["type"] == "CyberBullyingReport":
+        report = CyberBullyingReport(onlinePlatform=record["onlinePlatform"], evidence=record.get("evidence") or None, **common)
+    else:
+        raise ValueError(f"Unknown report type: {record['type']}")
+    report.status = ReportStatus(record["status"])
+    report.encrypted = bool(record["encrypted"])
+    report.blindIndex = parse_blind_index(record.get("blindIndex"))
+    if record.get("teacherID") and users is not None:
+        report.assigned_teacher = users.getByID(record["teacherID"])
+    return report
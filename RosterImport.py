@@ -0,0 +1,222 @@
+import csv
+import gzip
+import json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from DataSecurity import SecurityManager, PasswordHasher
+from UserDirectory import emailKey
+from UserClasses import user_from_record
+
+if TYPE_CHECKING:
+    from SchoolClass import School
+
+ROLES = ("Student", "Teacher", "Administrator")
+TEXT_FIELDS = ("userID", "name", "email", "role", "password", "passwordHash")
+
+_workerHashers = {}
+
+
+def _hash_passwords(settings: dict, passwords: list) -> list:
+    """Process pool task: hash a slice of a chunk's initial passwords."""
+    key = tuple(sorted(settings.items()))
+    hasher = _workerHashers.get(key)
+    if hasher is None:
+        hasher = _workerHashers[key] = PasswordHasher(**settings)
+    return [hasher.hash(password) for password in passwords]
+
+
+def _open_text(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def read_roster(path: str):
+    """Yield (line number, row dict) from a CSV or JSON-lines roster, one row at a time.
+
+    The format comes from the extension (.csv or .jsonl, optionally .gz).
+    CSV needs a header row. A JSON line that does not parse is yielded
+    as a row holding only an "_error" entry.
+    """
+    name = path[:-3] if path.endswith(".gz") else path
+    if not name.endswith((".csv", ".jsonl")):
+        raise ValueError(f"Unsupported roster format: {path} (use .csv or .jsonl).")
+    with _open_text(path) as f:
+        if name.endswith(".csv"):
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line, text in enumerate(f, start=1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except ValueError as e:
+                row = {"_error": f"Invalid JSON: {e}"}
+            yield line, row if isinstance(row, dict) else {"_error": "Expected a JSON object."}
+
+
+class RowError:
+    __slots__ = ("line", "message")
+
+    def __init__(self, line: int, message: str):
+        self.line = line
+        self.message = message
+
+    def __repr__(self) -> str:
+        return f"RowError(line={self.line}, {self.message!r})"
+
+
+class ImportResult:
+    """Outcome of one roster import. Only the first `maxErrors` row errors are kept."""
+
+    def __init__(self, maxErrors: int):
+        self.imported = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.errors = []
+        self.maxErrors = maxErrors
+
+    def reject(self, line: int, message: str, duplicate: bool = False) -> None:
+        if duplicate:
+            self.duplicates += 1
+        else:
+            self.invalid += 1
+        if len(self.errors) < self.maxErrors:
+            self.errors.append(RowError(line, message))
+
+    def __repr__(self) -> str:
+        return f"ImportResult(imported={self.imported}, duplicates={self.duplicates}, invalid={self.invalid})"
+
+
+class RosterImporter:
+    """Streams a roster file into a school's user directory.
+
+    Rows are read and validated `chunkSize` at a time. A row needs userID,
+    name, email and role, plus grade for students, and either an initial
+    password (hashed here with the configured PasswordHasher) or a
+    ready-made passwordHash. Emails and userIDs already in the directory,
+    or earlier in the file, are skipped as duplicates. Bad rows are
+    recorded in the result and the import carries on.
+
+    With processes=N the password hashing of each chunk is split across
+    N worker processes, and the next chunk is read and validated while
+    they work. Each chunk is added in one storage transaction, one user at
+    a time: a user registered by someone else since the chunk was validated
+    is recorded as a duplicate row rather than aborting the import. Memory use
+    depends on the chunk size, not the file size: duplicate checks go
+    against the directory itself, which holds every earlier chunk.
+    """
+
+    def __init__(self, school: 'School', chunkSize: int = 1000, processes: int = None, maxErrors: int = 1000):
+        self.school = school
+        self.chunkSize = chunkSize
+        self.processes = processes
+        self.maxErrors = maxErrors
+
+    def run(self, path: str) -> ImportResult:
+        return self.importRows(read_roster(path))
+
+    def importRows(self, rows) -> ImportResult:
+        """Import an iterable of (line number, row dict) pairs."""
+        result = ImportResult(self.maxErrors)
+        hasher = SecurityManager.passwordHasher()
+        pool = ProcessPoolExecutor(self.processes) if self.processes and self.processes > 1 else None
+        rows = iter(rows)
+        pending = None  # Validated chunk whose passwords are still being hashed
+        try:
+            while True:
+                chunk = list(islice(rows, self.chunkSize))
+                if not chunk:
+                    break
+                records = self._validate(chunk, result, pending[0] if pending else ())
+                hashing = self._startHashing(records, hasher, pool)
+                if pending:
+                    self._commit(*pending, result)
+                pending = (records, hashing)
+            if pending:
+                self._commit(*pending, result)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return result
+
+    def _validate(self, chunk: list, result: ImportResult, uncommitted) -> list:
+        users = self.school.users
+        seenEmails = {emailKey(record["email"]) for _, record, _ in uncommitted}
+        seenIDs = {record["userID"] for _, record, _ in uncommitted}
+        records = []
+        for line, row in chunk:
+            if "_error" in row:
+                result.reject(line, row["_error"])
+                continue
+            row = {k.strip(): v.strip() if isinstance(v, str) else v for k, v in row.items() if k}
+            # JSON rows can hold numbers, lists or null where text is expected.
+            wrong = [field for field in TEXT_FIELDS if row.get(field) is not None and not isinstance(row[field], str)]
+            if wrong:
+                result.reject(line, f"{', '.join(wrong)} must be text.")
+                continue
+            missing = [field for field in ("userID", "name", "email", "role") if not row.get(field)]
+            if missing:
+                result.reject(line, f"Missing {', '.join(missing)}.")
+                continue
+            if row["role"] not in ROLES:
+                result.reject(line, f"Unknown role {row['role']!r}.")
+                continue
+            if "@" not in row["email"]:
+                result.reject(line, f"Invalid email {row['email']!r}.")
+                continue
+            password, passwordHash = row.get("password"), row.get("passwordHash")
+            if not password and not passwordHash:
+                result.reject(line, "Needs a password or a passwordHash.")
+                continue
+            record = {"userID": row["userID"], "name": row["name"], "email": row["email"],
+                      "role": row["role"], "passwordHash": passwordHash}
+            if row["role"] == "Student":
+                try:
+                    record["grade"] = int(row.get("grade"))
+                except (TypeError, ValueError):
+                    result.reject(line, f"Invalid grade {row.get('grade')!r}.")
+                    continue
+            key = emailKey(row["email"])
+            if key in seenEmails or users.getByEmail(row["email"]) is not None:
+                result.reject(line, f"Duplicate email {row['email']}.", duplicate=True)
+                continue
+            if row["userID"] in seenIDs or users.getByID(row["userID"]) is not None:
+                result.reject(line, f"Duplicate userID {row['userID']}.", duplicate=True)
+                continue
+            seenEmails.add(key)
+            seenIDs.add(row["userID"])
+            records.append((line, record, password if not passwordHash else None))
+        return records
+
+    def _startHashing(self, records: list, hasher: PasswordHasher, pool):
+        passwords = [password for _, _, password in records if password is not None]
+        if pool is None or not passwords:
+            return [hasher.hash(password) for password in passwords]
+        share = -(-len(passwords) // self.processes)
+        return [pool.submit(_hash_passwords, hasher.settings(), passwords[n:n + share])
+                for n in range(0, len(passwords), share)]
+
+    def _commit(self, records: list, hashing: list, result: ImportResult) -> None:
+        if hashing and not isinstance(hashing[0], str):
+            hashing = [h for future in hashing for h in future.result()]
+        hashes = iter(hashing)
+        with self.school.batch():
+            for line, record, password in records:
+                if password is not None:
+                    record["passwordHash"] = next(hashes)
+                try:
+                    self.school.users.append(user_from_record(record))
+                except ValueError as e:  # Registered by someone else since validation
+                    result.reject(line, str(e), duplicate=True)
+                    continue
+                result.imported += 1
+
+
+def import_roster(school: 'School', path: str, **options) -> ImportResult:
+    """Import a CSV/JSONL roster into `school` (see RosterImporter for options)."""
+    return RosterImporter(school, **options).run(path)
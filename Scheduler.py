@@ -0,0 +1,205 @@
+import heapq
+from typing import TYPE_CHECKING
+
+from Reports import ConfidentialityLevel, ReportStatus
+
+if TYPE_CHECKING:
+    from SchoolClass import School
+    from UserClasses import Administrator, Teacher
+
+# How much one open report adds to a teacher's caseload.
+CASELOAD_WEIGHTS = {
+    ConfidentialityLevel.PUBLIC: 1,
+    ConfidentialityLevel.CONFIDENTIAL: 2,
+    ConfidentialityLevel.HIGHLY_CONFIDENTIAL: 3,
+}
+
+# Ways a report can be steered to a teacher already handling related reports.
+AFFINITIES = ("reporter", "case")
+
+
+class AssignmentScheduler:
+    """Assigns reports to teachers, balancing their open caseloads.
+
+    A teacher's caseload is the weight of their reports that are not yet
+    RESOLVED, each weighted by its confidentiality level (CASELOAD_WEIGHTS).
+    A report goes to the teacher with the lightest caseload who still has
+    room for it under their capacity (`capacity` for everyone, overridden
+    per teacher by `capacities`, a dict of userID -> capacity; None means
+    no limit). With affinity, a report from a reporter, or in a case, that
+    a teacher already handles goes to that teacher instead while they have
+    room.
+
+    Teachers are kept in one heap per report weight, keyed by caseload and
+    holding only teachers with room for that weight. Caseloads only grow
+    while planning, so a teacher without room is dropped from a heap for
+    good. A teacher's old entries go stale when their caseload grows; they
+    are skipped as they surface and swept out once a heap reaches twice the
+    number of teachers, so planning n reports for t teachers costs
+    O(n log t), after one pass over the reports already assigned to read
+    the caseloads.
+    """
+
+    def __init__(self, school: 'School', capacity: int = None, capacities: dict = None,
+                 affinity: tuple = AFFINITIES, weights: dict = None):
+        unknown = set(affinity) - set(AFFINITIES)
+        if unknown:
+            raise ValueError(f"Unknown affinity: {', '.join(sorted(unknown))}.")
+        self.school = school
+        self.capacity = capacity
+        self.capacities = dict(capacities or {})
+        self.affinity = tuple(affinity)
+        self.weights = dict(CASELOAD_WEIGHTS if weights is None else weights)
+        self.unplaced = []  # Reports the last plan() found no room for
+
+    def weightOf(self, report) -> int:
+        return self.weights.get(report.confidentialityLevel, 1)
+
+    def capacityOf(self, teacher: 'Teacher'):
+        return self.capacities.get(teacher.userID, self.capacity)
+
+    def caseloads(self, teachers: list = None) -> dict:
+        """Open caseload of each teacher: userID -> weight of their unresolved reports."""
+        if teachers is None:
+            teachers = self.school.users.withRole("Teacher")
+        return {teacher.userID: sum(self.weightOf(report) for report in self.school.reports.byTeacher(teacher)
+                                    if report.status != ReportStatus.RESOLVED)
+                for teacher in teachers}
+
+    def _affinityKeys(self, report) -> list:
+        keys = []
+        if "reporter" in self.affinity and report.reporter is not None:
+            keys.append(("reporter", report.reporter.userID))
+        if "case" in self.affinity:
+            keys.append(("case", self.school.cases.caseKey(report)))
+        return keys
+
+    def _preferences(self, teachers: list) -> dict:
+        """Affinity key -> the teacher already handling a report with it."""
+        preferred = {}
+        if self.affinity:
+            for teacher in teachers:
+                for report in self.school.reports.byTeacher(teacher):
+                    for key in self._affinityKeys(report):
+                        preferred[key] = teacher
+        return preferred
+
+    def _fits(self, teacher: 'Teacher', load: int, weight: int) -> bool:
+        capacity = self.capacityOf(teacher)
+        return capacity is None or load + weight <= capacity
+
+    def plan(self, reports: list = None, teachers: list = None) -> list:
+        """Decide who gets each report without assigning anything: a list of (report, teacher).
+
+        `reports` defaults to every unassigned report and `teachers` to every
+        teacher of the school. Reports nobody has room for are left out of
+        the plan and listed in self.unplaced.
+        """
+        if reports is None:
+            reports = self.school.reports.unassigned()
+        if teachers is None:
+            teachers = self.school.users.withRole("Teacher")
+        byID = {teacher.userID: teacher for teacher in teachers}
+        loads = self.caseloads(teachers)
+        preferred = self._preferences(teachers)
+
+        order = {teacherID: n for n, teacherID in enumerate(byID)}
+        heaps = {}
+        for weight in set(self.weights.values()) | {1}:
+            heaps[weight] = [(loads[teacherID], order[teacherID], teacherID) for teacherID, teacher in byID.items()
+                             if self._fits(teacher, loads[teacherID], weight)]
+            heapq.heapify(heaps[weight])
+
+        plan, self.unplaced = [], []
+        for report in reports:
+            weight = self.weightOf(report)
+            keys = self._affinityKeys(report) if self.affinity else ()
+            teacher = None
+            for key in keys:
+                candidate = preferred.get(key)
+                if candidate is not None and self._fits(candidate, loads[candidate.userID], weight):
+                    teacher = candidate
+                    break
+            if teacher is None:
+                teacher = self._lightest(heaps[weight], byID, loads, weight)
+            if teacher is None:
+                self.unplaced.append(report)
+                continue
+            loads[teacher.userID] += weight
+            for heapWeight, heap in heaps.items():
+                if self._fits(teacher, loads[teacher.userID], heapWeight):
+                    heapq.heappush(heap, (loads[teacher.userID], order[teacher.userID], teacher.userID))
+                    if len(heap) > 2 * len(byID) + 16:
+                        # Drop the outdated entries so a heap never holds more than O(t)
+                        heap[:] = [entry for entry in heap if entry[0] == loads[entry[2]]]
+                        heapq.heapify(heap)
+            for key in keys:
+                preferred[key] = teacher
+            plan.append((report, teacher))
+        return plan
+
+    def _lightest(self, heap: list, byID: dict, loads: dict, weight: int):
+        while heap:
+            load, _, teacherID = heap[0]
+            if load != loads[teacherID] or not self._fits(byID[teacherID], load, weight):
+                heapq.heappop(heap)  # Outdated, or full for this weight from now on
+                continue
+            return byID[teacherID]
+        return None
+
+    def suggest(self, reports: list, teachers: list = None):
+        """The teacher plan() would give all of `reports` to as one unit (None if nobody has room)."""
+        if teachers is None:
+            teachers = self.school.users.withRole("Teacher")
+        loads = self.caseloads(teachers)
+        weight = sum(self.weightOf(report) for report in reports)
+        preferred = self._preferences(teachers)
+        for report in reports:
+            for key in self._affinityKeys(report) if self.affinity else ():
+                teacher = preferred.get(key)
+                if teacher is not None and self._fits(teacher, loads[teacher.userID], weight):
+                    return teacher
+        fitting = [teacher for teacher in teachers if self._fits(teacher, loads[teacher.userID], weight)]
+        return min(fitting, key=lambda teacher: loads[teacher.userID], default=None)
+
+    def assign(self, administrator: 'Administrator', reports: list = None, dryRun: bool = False) -> list:
+        """Plan and apply the assignments in one storage transaction; returns the (report, teacher) pairs.
+
+        With dryRun=True nothing is assigned and the plan is returned as a
+        preview. A report assigned by someone else in the meantime is left
+        as it is.
+        """
+        from DataSecurity import SecurityManager
+
+        if not SecurityManager.get_instance().checkPermission(administrator, "assign_staff"):
+            print("Permission denied to assign staff.")
+            return []
+        plan = self.plan(reports)
+        if dryRun:
+            return plan
+        applied = []
+        with self.school.batch():
+            for report, teacher in plan:
+                if self.school.reports.compareAndSetAssignment(report, None, teacher):
+                    applied.append((report, teacher))
+        print(f"[SUCCESS] {len(applied)} reports assigned automatically.")
+        if self.unplaced:
+            print(f"[WARN] {len(self.unplaced)} reports left unassigned: no teacher has room for them.")
+        return applied
+
+
+def render_plan(plan: list, unplaced: list = (), limit: int = 20) -> str:
+    """Summarize an assignment plan as one string: reports per teacher and the first `limit` assignments."""
+    counts = {}
+    for _, teacher in plan:
+        counts[teacher.name] = counts.get(teacher.name, 0) + 1
+    lines = ["\n--- Assignment Preview ---"]
+    lines.extend(f"{report.reportID} -> {teacher.name}" for report, teacher in plan[:limit])
+    if len(plan) > limit:
+        lines.append(f"... and {len(plan) - limit} more")
+    lines.extend(f"{name}: {n} new reports" for name, n in counts.items())
+    if unplaced:
+        lines.append(f"[WARN] {len(unplaced)} reports would stay unassigned: no teacher has room for them.")
+    if not plan and not unplaced:
+        lines.append("[INFO] No unassigned reports.")
+    return "\n".join(lines) + "\n"
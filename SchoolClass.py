@@ -1,26 +1,199 @@
+from contextlib import nullcontext
+
+from ReportRegistry import ReportRegistry
+from UserDirectory import UserDirectory
+from Storage import StorageBackend
+from ReportIDs import ReportIDAllocator
+from Analytics import DashboardCounters
+from Search import ReportSearchIndex
+from BlindIndex import BlindIndex
+from Duplicates import DuplicateDetector
+from Cases import CaseTracker
+
+
 class School:
-    _instance = None  
+    # The first school created (unless it opted out). Users added to a school
+    # know it through user.school; this default only serves objects that
+    # belong to none, so later schools never take it over.
+    _instance = None
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super(School, cls).__new__(cls)
-            cls._instance.reports = []
-            cls._instance.users = []
-        return cls._instance
-    
     @classmethod
     def get_instance(cls):
-        if cls._instance is None:
-            cls()
-        return cls._instance if cls._instance else cls()
-        
-    def __init__(self, schoolID: str, name: str, address: str):
+        return cls._instance
+
+    @staticmethod
+    def of(user) -> "School":
+        """The school a user belongs to (the default school if none)."""
+        school = getattr(user, "school", None)
+        return school if school is not None else School._instance
+
+    def __init__(self, schoolID: str, name: str, address: str, storage: StorageBackend = None,
+                 default: bool = True):
+        if default and School._instance is None:
+            School._instance = self
         self.schoolID = schoolID
         self.name = name
         self.address = address
-        self.users = []        # List of User objects
-        self.reports = []      # List of BullyingReport objects
+        self.users = UserDirectory()     # User objects, keyed by email and userID
+        self.reports = ReportRegistry()  # Indexed list of BullyingReport objects
+        self.storage = None
+        self.journal = None
+        self.encryption = None
+        self.reportIDs = ReportIDAllocator(self)
+        self._columns = None
+        if storage is not None:
+            self.attachStorage(storage)  # Without one the school only lives in memory
+        self.users.addListener(self)
+        self.reports.addListener(self)
+        self.dashboard = DashboardCounters(self.reports)
+        # Added before any encryption pipeline, so it sees plaintext descriptions.
+        self.searchIndex = ReportSearchIndex(self.reports)
+        self.blindIndex = BlindIndex(self.reports)
+        self.duplicates = DuplicateDetector(self.reports)
+        self.cases = CaseTracker(self.reports, self.duplicates)  # After the detector, to use its matches
 
-    def registerReport(self, report) -> None:
-        self.reports.append(report)
+    def registerReport(self, report) -> bool:
+        self.blindIndex.prepare(report)  # Stored with its search tokens from the start
+        try:
+            self.reports.append(report)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            return False
         print(f"[REGISTER] Report {report.reportID} registered in {self.name}.")
+        similar = self.duplicates.duplicatesOf(report.reportID)
+        if similar:
+            print(f"[INFO] Report {report.reportID} looks like a duplicate of {', '.join(similar)}.")
+        return True
+
+    def searchReports(self, query: str, limit: int = 20, status=None, reportType: type = None,
+                      assigned: bool = None) -> list:
+        """Best `limit` reports for a search query, with the filters of ReportRegistry.iterWhere().
+
+        Full-text matches (places, and descriptions of public reports) come
+        first, by relevance; confidential reports whose description matches
+        through the blind index follow, in filing order. No confidential
+        description is decrypted to answer a query.
+        """
+        results = self.searchIndex.search(query, limit, status=status, reportType=reportType, assigned=assigned)
+        found = {report.reportID for report in results}
+        for report in self.blindIndex.search(query):
+            if len(results) >= limit:
+                break
+            if report.reportID in found or report not in self.reports:
+                continue
+            if status is not None and report.status != status:
+                continue
+            if reportType is not None and type(report) is not reportType:
+                continue
+            if assigned is not None and (report.assigned_teacher is not None) != assigned:
+                continue
+            results.append(report)
+        return results
+
+    def nextReportID(self) -> str:
+        """Allocate a fresh report ID (R001, R002, ...) for a new filing."""
+        return self.reportIDs.allocate()
+
+    def analytics(self):
+        """Live columnar view of the reports for aggregate queries (built on first use)."""
+        from Analytics import ReportColumns
+
+        if self._columns is None:
+            self._columns = ReportColumns(self.reports)
+        return self._columns
+
+    def startEncryption(self, **options):
+        """Encrypt filed reports in the background (see EncryptionPipeline for options).
+
+        Reports already on file that are still in plaintext are queued too.
+        """
+        from EncryptionPipeline import EncryptionPipeline
+
+        if self.encryption is None:
+            self.encryption = EncryptionPipeline(self.reports, **options)
+        return self.encryption
+
+    def stopEncryption(self) -> None:
+        """Finish encrypting everything queued and stop the background workers."""
+        if self.encryption is not None:
+            self.encryption.close()
+            self.encryption = None
+
+    # --- Persistence ---
+
+    def batch(self):
+        """Group the storage writes of several changes into one transaction (no-op without storage)."""
+        return self.storage.batch() if self.storage is not None else nullcontext()
+
+    def attachStorage(self, storage: StorageBackend, save: bool = True) -> None:
+        """Persist this school to the given backend from now on.
+
+        With save=True the school and everything it currently holds is
+        written out in a single transaction.
+        """
+        self.storage = storage
+        self.reportIDs.reset()
+        if save:
+            with storage.batch():
+                storage.saveSchool(self.schoolID, self.name, self.address)
+                storage.saveUsers(self.schoolID, list(self.users))
+                storage.saveReports(self.schoolID, list(self.reports))
+
+    @classmethod
+    def load(cls, storage: StorageBackend, schoolID: str) -> "School":
+        """Rebuild a school, its users and its reports from storage."""
+        from UserClasses import user_from_record
+        from Reports import report_from_record
+
+        row = storage.loadSchool(schoolID)
+        if row is None:
+            raise KeyError(f"School {schoolID} not found in storage.")
+        school = cls(row["schoolID"], row["name"], row["address"])
+        school.users.extend(user_from_record(record) for record in storage.loadUsers(schoolID))
+        school.reports.extend(report_from_record(record, school.users) for record in storage.loadReports(schoolID))
+        school.attachStorage(storage, save=False)
+        return school
+
+    def attachJournal(self, journal, wait: bool = True) -> None:
+        """Record every change to this school in a write-ahead journal.
+
+        A checkpoint is taken first so the journal's snapshot covers
+        everything the school already holds. With wait=False events are
+        not fsync'd individually; call journal.sync() after a bulk load.
+        """
+        from Journal import JournalListener
+
+        journal.checkpoint(self)
+        listener = JournalListener(journal, wait)
+        self.users.addListener(listener)
+        self.reports.addListener(listener)
+        self.journal = journal
+
+    # Registry listener callbacks: mirror every change into storage, if any.
+
+    def userAdded(self, user) -> None:
+        user.school = self
+        if self.storage is not None:
+            self.storage.saveUsers(self.schoolID, [user])
+
+    def userRemoved(self, user) -> None:
+        if getattr(user, "school", None) is self:
+            user.school = None
+        if self.storage is not None:
+            self.storage.deleteUser(self.schoolID, user.userID)
+
+    def userUpdated(self, user, field: str, old) -> None:
+        if self.storage is not None:
+            self.storage.saveUsers(self.schoolID, [user])
+
+    def reportAdded(self, report) -> None:
+        if self.storage is not None:
+            self.storage.saveReports(self.schoolID, [report])
+
+    def reportRemoved(self, report) -> None:
+        if self.storage is not None:
+            self.storage.deleteReport(self.schoolID, report.reportID)
+
+    def reportUpdated(self, report, field: str, old) -> None:
+        if self.storage is not None:
+            self.storage.saveReports(self.schoolID, [report])
@@ -0,0 +1,123 @@
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from Analytics import count_encoded
+from SchoolClass import School
+from Storage import StorageBackend
+
+
+def _count_group(queries: list) -> Counter:
+    """Process pool task: add up the counts of a group of schools."""
+    total = Counter()
+    for query in queries:
+        total.update(count_encoded(*query))
+    return total
+
+
+class SchoolDirectory:
+    """Hosts many schools in one process, keyed by schoolID.
+
+    Each School is its own partition: its own user directory, report
+    registry, ID allocator and storage rows, so nothing filed in one
+    school is visible in another. Users know their school (user.school),
+    so Student.fileReport, Teacher.reviewReport and the administrator
+    methods act on the right partition without any lookup here. Hosted
+    schools never become the process-wide default school (School.of), so
+    an object that belongs to no school is never routed into a shard.
+
+    Cross-school aggregates add up each school's columnar analytics. With
+    processes=N the per-school counting is spread over a pool of N worker
+    processes; each worker gets the encoded columns of a share of the
+    schools (a few bytes per report), not the report objects.
+    """
+
+    def __init__(self, processes: int = None):
+        self.processes = processes
+        self._schools = {}
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def __len__(self) -> int:
+        return len(self._schools)
+
+    def __iter__(self):
+        return iter(list(self._schools.values()))
+
+    def __contains__(self, schoolID: str) -> bool:
+        return schoolID in self._schools
+
+    # --- Schools ---
+
+    def create(self, schoolID: str, name: str, address: str, storage: StorageBackend = None) -> School:
+        """Create a school and host it here."""
+        school = School(schoolID, name, address, storage, default=False)
+        self.add(school)
+        return school
+
+    def add(self, school: School) -> None:
+        with self._lock:
+            if school.schoolID in self._schools:
+                raise ValueError(f"School {school.schoolID} is already hosted.")
+            self._schools[school.schoolID] = school
+
+    def remove(self, schoolID: str) -> School:
+        with self._lock:
+            return self._schools.pop(schoolID)
+
+    def get(self, schoolID: str) -> School:
+        """Return the school with this schoolID, or None."""
+        return self._schools.get(schoolID)
+
+    def schoolOf(self, item) -> School:
+        """The hosted school a user, or a report through its reporter, belongs to."""
+        user = getattr(item, "reporter", item)
+        school = getattr(user, "school", None)
+        return school if school is not None and self._schools.get(school.schoolID) is school else None
+
+    def findUser(self, email: str, role: str = None):
+        """Look a user up by email across every school (for a shared login page)."""
+        for school in self:
+            user = school.users.getByEmail(email, role)
+            if user is not None:
+                return user
+        return None
+
+    # --- Cross-school aggregates ---
+
+    def countBy(self, name: str, **filters) -> dict:
+        """ReportColumns.countBy summed over every school."""
+        queries = [school.analytics().countQuery(name, **filters) for school in self]
+        if not self.processes or self.processes < 2 or len(queries) < 2:
+            return dict(_count_group(queries))
+        groups = [queries[n::self.processes] for n in range(self.processes)]
+        total = Counter()
+        for counts in self._executor().map(_count_group, [g for g in groups if g]):
+            total.update(counts)
+        return dict(total)
+
+    def count(self, **filters) -> int:
+        """Number of reports, across every school, matching every filter."""
+        return sum(school.analytics().count(**filters) for school in self)
+
+    def summary(self) -> dict:
+        """Dashboard totals for the whole directory, added up from each school's live counters."""
+        total = Counter()
+        for school in self:
+            counters = school.dashboard
+            total["total"] += counters.total
+            total["unassigned"] += counters.unassigned
+        return dict(total, schools=len(self))
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.processes)
+            return self._pool
+
+    def close(self) -> None:
+        """Shut the process pool down (if one was started)."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
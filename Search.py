@@ -0,0 +1,304 @@
+import heapq
+import itertools
+import math
+import re
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+from Reports import ConfidentialityLevel
+
+if TYPE_CHECKING:
+    from ReportRegistry import ReportRegistry
+    from Reports import ReportStatus
+
+_WORD = re.compile(r"\w+")
+_QUERY_PART = re.compile(r'(-?)(?:"([^"]*)"|(\S+))')
+
+# Words too common to be worth a posting list.
+STOPWORDS = frozenset("a an and are as at be by for from he her his i in is it me my of on or she "
+                      "that the their them they this to was were with you".split())
+
+# Fields searched, with the weight a match in each adds to the ranking.
+DESCRIPTION_WEIGHT = 1.0
+PLACE_WEIGHT = 2.0
+
+# Documents of one score class checked in order before it is treated as
+# sparse and intersected as sets instead (see ReportSearchIndex._firstInClass).
+_WALK_BUDGET = 2048
+
+
+def tokenize(text: str) -> list:
+    """Lower-cased words of `text`, stopwords removed, each interned so postings share one copy."""
+    return [sys.intern(word) for word in _WORD.findall(text.lower()) if word not in STOPWORDS]
+
+
+def parse_query(query: str) -> tuple:
+    """Split a query into (required, excluded) parts, each a tuple of words (several for a "phrase")."""
+    required, excluded = [], []
+    for negate, phrase, word in _QUERY_PART.findall(query):
+        words = tuple(tokenize(phrase if phrase else word))
+        if words:
+            (excluded if negate else required).append(words)
+    return required, excluded
+
+
+def _place(report) -> str:
+    """The location of an in-person report or the platform of a cyberbullying report."""
+    return getattr(report, "location", None) or getattr(report, "onlinePlatform", None) or ""
+
+
+def _positions(value) -> tuple:
+    return value if isinstance(value, tuple) else (value,)
+
+
+class ReportSearchIndex:
+    """Inverted full-text index over report descriptions and places.
+
+    The place of every report (InPersonReport.location or
+    CyberBullyingReport.onlinePlatform) is indexed with the position of each
+    word, and so is the description of PUBLIC reports. Descriptions of
+    confidential reports never enter this index: they are searched through
+    BlindIndex instead (School.searchReports combines both). Nor does the
+    index decrypt anything. School registers it before the encryption
+    pipeline, so it reads public descriptions while they are still in
+    plaintext; a report filed or loaded already encrypted is found by its
+    place only. As a registry listener the index is updated report by
+    report as they are filed, edited, moved between statuses or removed.
+    Like the DecryptionCache, the index only lives in memory and is never
+    persisted.
+
+    A query is words (all must match), "quoted phrases" (words next to each
+    other in one field) and -excluded words or phrases. A part matching in
+    the description scores its idf, in the place twice that. Results can be
+    narrowed by status, report type and assignment like
+    ReportRegistry.iterWhere(); the index keeps those as sets of its own
+    document numbers, so a filter is one set intersection.
+
+    Reports are numbered in the order they are indexed and postings map
+    document numbers to word positions (an int, or a tuple for a repeated
+    word), so iterating a posting visits reports in indexing order. A query
+    never scores its whole match set: every match falls in one of a few
+    score classes (which parts matched in which field), and the classes are
+    walked from best to worst, each from its first report on, until the
+    page is full. A common word therefore costs about as much as a rare one.
+    """
+
+    def __init__(self, registry: 'ReportRegistry' = None):
+        self._lock = threading.Lock()
+        self._reports = []      # Document number -> report (None once removed)
+        self._docs = {}         # reportID -> document number
+        self._terms = []        # Document number -> distinct description words, for removal
+        self._description = {}  # word -> {doc: positions}
+        self._place = {}
+        self._byStatus = {}     # status -> set of docs
+        self._byType = {}       # report class -> set of docs
+        self._assigned = set()  # docs with a teacher
+        if registry is not None:
+            for report in registry:
+                self.reportAdded(report)
+            registry.addListener(self)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # --- Registry listener callbacks ---
+
+    def reportAdded(self, report) -> None:
+        description, encrypted = report.descriptionState()
+        if encrypted or report.confidentialityLevel != ConfidentialityLevel.PUBLIC:
+            description = ""  # Only the place of this report is searchable here
+        words = tokenize(description), tokenize(_place(report))
+        with self._lock:
+            self._unindex(report.reportID)
+            doc = len(self._reports)
+            self._reports.append(report)
+            self._docs[report.reportID] = doc
+            self._terms.append(tuple(dict.fromkeys(words[0])))
+            for postings, fieldWords in zip((self._description, self._place), words):
+                for position, word in enumerate(fieldWords):
+                    entry = postings.get(word)
+                    if entry is None:
+                        entry = postings[word] = {}
+                    previous = entry.get(doc)
+                    entry[doc] = position if previous is None else _positions(previous) + (position,)
+            self._byStatus.setdefault(report.status, set()).add(doc)
+            self._byType.setdefault(type(report), set()).add(doc)
+            if report.assigned_teacher is not None:
+                self._assigned.add(doc)
+
+    def reportRemoved(self, report) -> None:
+        with self._lock:
+            self._unindex(report.reportID)
+
+    def reportUpdated(self, report, field: str, old) -> None:
+        if field == "description":
+            # Encryption also notifies "description"; only a plaintext edit changes the words.
+            if not report.descriptionState()[1]:
+                self.reportAdded(report)
+            return
+        with self._lock:
+            doc = self._docs.get(report.reportID)
+            if doc is None:
+                return
+            if field == "status":
+                self._byStatus.get(old, set()).discard(doc)
+                self._byStatus.setdefault(report.status, set()).add(doc)
+            elif field == "assigned_teacher":
+                if report.assigned_teacher is not None:
+                    self._assigned.add(doc)
+                else:
+                    self._assigned.discard(doc)
+
+    def _unindex(self, reportID: str) -> None:
+        doc = self._docs.pop(reportID, None)
+        if doc is None:
+            return
+        # The place never changes, so its words are simply tokenized again.
+        fields = ((self._description, self._terms[doc]), (self._place, tokenize(_place(self._reports[doc]))))
+        for postings, words in fields:
+            for word in words:
+                entry = postings.get(word)
+                if entry is not None and entry.pop(doc, None) is not None and not entry:
+                    del postings[word]
+        for docs in self._byStatus.values():
+            docs.discard(doc)
+        for docs in self._byType.values():
+            docs.discard(doc)
+        self._assigned.discard(doc)
+        self._reports[doc] = None
+        self._terms[doc] = None
+
+    # --- Queries ---
+
+    @staticmethod
+    def _inField(entries: list, words: tuple, doc: int) -> bool:
+        """Whether a query part (a word, or a phrase with one posting per word) matches `doc` in one field."""
+        if entries is None:
+            return False
+        if len(entries) == 1:
+            return doc in entries[0]
+        if not all(doc in entry for entry in entries):
+            return False
+        starts = _positions(entries[0][doc])
+        for offset, entry in enumerate(entries[1:], start=1):
+            positions = entry[doc]
+            if isinstance(positions, tuple):
+                starts = [start for start in starts if start + offset in positions]
+            else:
+                starts = [start for start in starts if start + offset == positions]
+            if not starts:
+                return False
+        return True
+
+    def _entries(self, postings: dict, words: tuple) -> list:
+        entries = [postings.get(word) for word in words]
+        return entries if all(entries) else None
+
+    def search(self, query: str, limit: int = 20, status: 'ReportStatus' = None, reportType: type = None,
+               assigned: bool = None) -> list:
+        """Best `limit` reports for the query, most relevant first (ties in indexing order).
+
+        A query of only -excluded parts matches nothing.
+        """
+        required, excluded = parse_query(query)
+        if not required:
+            return []
+        with self._lock:
+            documents = len(self._docs)
+            parts = []
+            for words in required:
+                inDescription = self._entries(self._description, words)
+                inPlace = self._entries(self._place, words)
+                if inDescription is None and inPlace is None:
+                    return []
+                frequency = min(len(self._description.get(w, ())) + len(self._place.get(w, ())) for w in words)
+                parts.append((words, math.log(1 + documents / frequency), inDescription, inPlace))
+            filters = self._filterSets(status, reportType, assigned)
+            if not all(filters):
+                return []
+            excluded = [(words, self._entries(self._description, words), self._entries(self._place, words))
+                        for words in excluded]
+
+            def accepted(doc) -> bool:
+                if assigned is False and doc in self._assigned:
+                    return False
+                if not all(doc in docs for docs in filters):
+                    return False
+                return not any(self._inField(inDescription, words, doc) or self._inField(inPlace, words, doc)
+                               for words, inDescription, inPlace in excluded)
+
+            # For each part a match is in the description only, the place only, or both;
+            # a combination of those is a score class.
+            choices = []
+            for words, idf, inDescription, inPlace in parts:
+                options = []
+                if inDescription and inPlace:
+                    options.append(("both", idf * (DESCRIPTION_WEIGHT + PLACE_WEIGHT)))
+                if inPlace:
+                    options.append(("place", idf * PLACE_WEIGHT))
+                if inDescription:
+                    options.append(("description", idf * DESCRIPTION_WEIGHT))
+                choices.append(options)
+            classes = sorted([(round(sum(score for _, score in combo), 9), [field for field, _ in combo])
+                              for combo in itertools.product(*choices)], key=lambda c: -c[0])
+            best = []
+            for _, group in itertools.groupby(classes, key=lambda c: c[0]):
+                need = limit - len(best)
+                tied = [doc for _, fields in group for doc in self._firstInClass(parts, fields, filters, accepted, need)]
+                best.extend(heapq.nsmallest(need, tied))
+                if len(best) >= limit:
+                    break
+            return [self._reports[doc] for doc in best]
+
+    def _firstInClass(self, parts: list, fields: list, filters: list, accepted, need: int) -> list:
+        """The `need` lowest document numbers in one score class that pass the filters.
+
+        Walks the smallest posting of the class in document order and stops
+        once `need` are found, so a dense class costs O(need). A class still
+        short after _WALK_BUDGET documents is sparse; it is finished with set
+        intersections instead.
+        """
+        postings = []
+        for (words, _, inDescription, inPlace), field in zip(parts, fields):
+            if field != "place":
+                postings.extend(inDescription)
+            if field != "description":
+                postings.extend(inPlace)
+        postings.sort(key=len)
+
+        def inClass(doc) -> bool:
+            for (words, _, inDescription, inPlace), field in zip(parts, fields):
+                if self._inField(inDescription, words, doc) != (field != "place"):
+                    return False
+                if self._inField(inPlace, words, doc) != (field != "description"):
+                    return False
+            return accepted(doc)
+
+        found = []
+        driver, others = postings[0], postings[1:]
+        for walked, doc in enumerate(driver):
+            if walked == _WALK_BUDGET:
+                break
+            if all(doc in other for other in others) and inClass(doc):
+                found.append(doc)
+                if len(found) == need:
+                    return found
+        else:
+            return found
+        docs = postings[0].keys()
+        for other in postings[1:] + sorted(filters, key=len):
+            docs = docs & (other.keys() if isinstance(other, dict) else other)
+            if not docs:
+                return []
+        return heapq.nsmallest(need, (doc for doc in docs if inClass(doc)))
+
+    def _filterSets(self, status, reportType, assigned) -> list:
+        sets = []
+        if status is not None:
+            sets.append(self._byStatus.get(status, set()))
+        if reportType is not None:
+            sets.append(self._byType.get(reportType, set()))
+        if assigned is True:
+            sets.append(self._assigned)
+        return sets
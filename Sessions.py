@@ -0,0 +1,108 @@
+import heapq
+import secrets
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from DataSecurity import DecryptionCache
+
+if TYPE_CHECKING:
+    from UserClasses import User
+
+
+class Session:
+    """One logged-in user, identified by an opaque token."""
+
+    __slots__ = ("token", "user", "manager", "created", "expires", "_decryptionCache")
+
+    def __init__(self, token: str, user: 'User', manager: 'SessionManager', expires: float):
+        self.token = token
+        self.user = user
+        self.manager = manager
+        self.created = time.monotonic()
+        self.expires = expires
+        self._decryptionCache = None
+
+    @property
+    def decryptionCache(self) -> DecryptionCache:
+        """Decrypted descriptions seen in this session (dropped when it ends)."""
+        if self._decryptionCache is None:
+            self._decryptionCache = DecryptionCache()
+        return self._decryptionCache
+
+    def isValid(self) -> bool:
+        return self.manager.validate(self.token) is self
+
+    def end(self) -> None:
+        """Log out: revoke the token and forget any cached plaintext."""
+        self.manager.revoke(self.token)
+
+
+class SessionManager:
+    """Issues and checks session tokens after a successful User.login.
+
+    Tokens are random and carry no data; validating one is a dict lookup
+    plus an expiry check. Sessions expire `ttl` seconds after they were
+    issued. Expired sessions are evicted in expiry order from a heap,
+    a little at a time on every issue/validate, so the store never needs
+    a full scan.
+    """
+
+    def __init__(self, ttl: float = 1800.0):
+        self.ttl = ttl
+        self._sessions = {}   # token -> Session
+        self._expiries = []   # heap of (expires, token)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _evictExpired(self, now: float) -> None:
+        while self._expiries and self._expiries[0][0] <= now:
+            _, token = heapq.heappop(self._expiries)
+            session = self._sessions.get(token)
+            if session is not None and session.expires <= now:
+                self._drop(session)
+
+    def _drop(self, session: Session) -> None:
+        del self._sessions[session.token]
+        if session._decryptionCache is not None:
+            session._decryptionCache.clear()
+
+    def login(self, user: 'User', password: str) -> Session:
+        """Check the password once and return a new session, or None."""
+        if user is None or not user.login(password):
+            return None
+        return self.issue(user)
+
+    def issue(self, user: 'User') -> Session:
+        """Start a session for an already authenticated user."""
+        now = time.monotonic()
+        session = Session(secrets.token_urlsafe(32), user, self, now + self.ttl)
+        with self._lock:
+            self._evictExpired(now)
+            self._sessions[session.token] = session
+            heapq.heappush(self._expiries, (session.expires, session.token))
+        return session
+
+    def validate(self, token: str) -> Session:
+        """The live session for this token, or None if unknown, expired or revoked."""
+        now = time.monotonic()
+        with self._lock:
+            self._evictExpired(now)
+            session = self._sessions.get(token)
+        if session is None or session.expires <= now:
+            return None
+        return session
+
+    def revoke(self, token: str) -> None:
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is not None:
+                self._drop(session)
+
+    def revokeUser(self, user: 'User') -> None:
+        """End every session of one user (e.g. after a password change)."""
+        with self._lock:
+            for session in [s for s in self._sessions.values() if s.user is user]:
+                self._drop(session)
@@ -0,0 +1,400 @@
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from UserDirectory import emailKey
+
+if TYPE_CHECKING:
+    from Reports import BullyingReport
+    from UserClasses import User
+
+
+class StorageBackend(ABC):
+    """Where a School's users and reports are persisted.
+
+    Records are the dicts produced by User.toRecord() and
+    BullyingReport.toRecord(); every call is scoped by schoolID.
+    """
+
+    @contextmanager
+    def batch(self):
+        """Group several writes into one transaction (no-op by default)."""
+        yield self
+
+    @abstractmethod
+    def saveSchool(self, schoolID: str, name: str, address: str) -> None:
+        pass
+
+    @abstractmethod
+    def loadSchool(self, schoolID: str) -> dict:
+        """Return {"schoolID", "name", "address"} or None if unknown."""
+        pass
+
+    @abstractmethod
+    def saveUsers(self, schoolID: str, users: list) -> None:
+        pass
+
+    @abstractmethod
+    def deleteUser(self, schoolID: str, userID: str) -> None:
+        pass
+
+    @abstractmethod
+    def loadUsers(self, schoolID: str) -> list:
+        """Return user records for the school."""
+        pass
+
+    @abstractmethod
+    def saveReports(self, schoolID: str, reports: list) -> None:
+        pass
+
+    @abstractmethod
+    def deleteReport(self, schoolID: str, reportID: str) -> None:
+        pass
+
+    @abstractmethod
+    def loadReports(self, schoolID: str) -> list:
+        """Return report records for the school in reportID order."""
+        pass
+
+    @abstractmethod
+    def findUserByEmail(self, schoolID: str, email: str) -> dict:
+        pass
+
+    @abstractmethod
+    def findReports(self, schoolID: str, reporterID: str = None, teacherID: str = None,
+                    status: str = None, reportType: str = None) -> list:
+        """Return report records matching every given filter."""
+        pass
+
+    @abstractmethod
+    def reserveSequence(self, schoolID: str, name: str, count: int, minimum: int = 1) -> int:
+        """Atomically reserve `count` consecutive numbers and return the first.
+
+        Numbers are never handed out twice, even across processes sharing
+        the backend, and the next block always starts at or above `minimum`.
+        The reservation commits on its own, so it may not run inside batch().
+        """
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryStorage(StorageBackend):
+    """Keeps records in plain dicts; nothing survives the process. Used by tests."""
+
+    def __init__(self):
+        self._schools = {}
+        self._users = {}
+        self._reports = {}
+        self._sequences = {}
+        self._sequenceLock = threading.Lock()
+
+    def saveSchool(self, schoolID: str, name: str, address: str) -> None:
+        self._schools[schoolID] = {"schoolID": schoolID, "name": name, "address": address}
+        self._users.setdefault(schoolID, {})
+        self._reports.setdefault(schoolID, {})
+
+    def loadSchool(self, schoolID: str) -> dict:
+        return self._schools.get(schoolID)
+
+    def saveUsers(self, schoolID: str, users: list) -> None:
+        table = self._users.setdefault(schoolID, {})
+        for user in users:
+            table[user.userID] = user.toRecord()
+
+    def deleteUser(self, schoolID: str, userID: str) -> None:
+        self._users.get(schoolID, {}).pop(userID, None)
+
+    def loadUsers(self, schoolID: str) -> list:
+        return list(self._users.get(schoolID, {}).values())
+
+    def saveReports(self, schoolID: str, reports: list) -> None:
+        table = self._reports.setdefault(schoolID, {})
+        for report in reports:
+            table[report.reportID] = report.toRecord()
+
+    def deleteReport(self, schoolID: str, reportID: str) -> None:
+        self._reports.get(schoolID, {}).pop(reportID, None)
+
+    def loadReports(self, schoolID: str) -> list:
+        return list(self._reports.get(schoolID, {}).values())
+
+    def findUserByEmail(self, schoolID: str, email: str) -> dict:
+        key = emailKey(email)
+        return next((u for u in self._users.get(schoolID, {}).values() if emailKey(u["email"]) == key), None)
+
+    def findReports(self, schoolID: str, reporterID: str = None, teacherID: str = None,
+                    status: str = None, reportType: str = None) -> list:
+        wanted = {"reporterID": reporterID, "teacherID": teacherID, "status": status, "type": reportType}
+        wanted = {k: v for k, v in wanted.items() if v is not None}
+        return [r for r in self.loadReports(schoolID) if all(r[k] == v for k, v in wanted.items())]
+
+    def reserveSequence(self, schoolID: str, name: str, count: int, minimum: int = 1) -> int:
+        with self._sequenceLock:
+            start = max(self._sequences.get((schoolID, name), 1), minimum)
+            self._sequences[(schoolID, name)] = start + count
+        return start
+
+
+# Statements are kept as constants so sqlite3's statement cache reuses the
+# prepared form on every call.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS schools (
+    schoolID TEXT PRIMARY KEY,
+    name     TEXT NOT NULL,
+    address  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS users (
+    schoolID     TEXT NOT NULL,
+    userID       TEXT NOT NULL,
+    role         TEXT NOT NULL,
+    name         TEXT NOT NULL,
+    email        TEXT NOT NULL,
+    emailKey     TEXT NOT NULL,
+    grade        INTEGER,
+    passwordHash TEXT NOT NULL,
+    PRIMARY KEY (schoolID, userID)
+);
+CREATE INDEX IF NOT EXISTS users_email ON users (schoolID, emailKey);
+CREATE INDEX IF NOT EXISTS users_role ON users (schoolID, role);
+CREATE TABLE IF NOT EXISTS reports (
+    schoolID             TEXT NOT NULL,
+    reportID             TEXT NOT NULL,
+    type                 TEXT NOT NULL,
+    reportDate           TEXT NOT NULL,
+    description          TEXT NOT NULL,
+    confidentialityLevel TEXT NOT NULL,
+    status               TEXT NOT NULL,
+    encrypted            INTEGER NOT NULL,
+    reporterID           TEXT,
+    teacherID            TEXT,
+    location             TEXT,
+    onlinePlatform       TEXT,
+    witnesses            TEXT,
+    evidence             TEXT,
+    blindIndex           TEXT,
+    PRIMARY KEY (schoolID, reportID)
+);
+CREATE INDEX IF NOT EXISTS reports_reporter ON reports (schoolID, reporterID);
+CREATE INDEX IF NOT EXISTS reports_teacher ON reports (schoolID, teacherID);
+CREATE INDEX IF NOT EXISTS reports_status ON reports (schoolID, status);
+CREATE INDEX IF NOT EXISTS reports_type ON reports (schoolID, type);
+CREATE TABLE IF NOT EXISTS sequences (
+    schoolID  TEXT NOT NULL,
+    name      TEXT NOT NULL,
+    nextValue INTEGER NOT NULL,
+    PRIMARY KEY (schoolID, name)
+);
+"""
+
+_UPSERT_SCHOOL = "INSERT OR REPLACE INTO schools (schoolID, name, address) VALUES (?, ?, ?)"
+_SELECT_SCHOOL = "SELECT schoolID, name, address FROM schools WHERE schoolID = ?"
+# Upserts update a row in place rather than replacing it, so every row keeps
+# its rowid and loads come back in the order they were first saved.
+_UPSERT_USER = ("INSERT INTO users (schoolID, userID, role, name, email, emailKey, grade, passwordHash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (schoolID, userID) DO UPDATE SET "
+                "role = excluded.role, name = excluded.name, email = excluded.email, "
+                "emailKey = excluded.emailKey, grade = excluded.grade, passwordHash = excluded.passwordHash")
+_DELETE_USER = "DELETE FROM users WHERE schoolID = ? AND userID = ?"
+_USER_COLUMNS = "userID, role, name, email, grade, passwordHash"
+_SELECT_USERS = f"SELECT {_USER_COLUMNS} FROM users WHERE schoolID = ? ORDER BY rowid"
+_SELECT_USER_BY_EMAIL = f"SELECT {_USER_COLUMNS} FROM users WHERE schoolID = ? AND emailKey = ?"
+_UPSERT_REPORT = ("INSERT INTO reports (schoolID, reportID, type, reportDate, description, "
+                  "confidentialityLevel, status, encrypted, reporterID, teacherID, location, onlinePlatform, "
+                  "witnesses, evidence, blindIndex) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                  "ON CONFLICT (schoolID, reportID) DO UPDATE SET type = excluded.type, "
+                  "reportDate = excluded.reportDate, description = excluded.description, "
+                  "confidentialityLevel = excluded.confidentialityLevel, status = excluded.status, "
+                  "encrypted = excluded.encrypted, reporterID = excluded.reporterID, "
+                  "teacherID = excluded.teacherID, location = excluded.location, "
+                  "onlinePlatform = excluded.onlinePlatform, witnesses = excluded.witnesses, "
+                  "evidence = excluded.evidence, blindIndex = excluded.blindIndex")
+_DELETE_REPORT = "DELETE FROM reports WHERE schoolID = ? AND reportID = ?"
+_REPORT_COLUMNS = ("reportID, type, reportDate, description, confidentialityLevel, status, encrypted, "
+                   "reporterID, teacherID, location, onlinePlatform, witnesses, evidence, blindIndex")
+_SELECT_REPORTS = f"SELECT {_REPORT_COLUMNS} FROM reports WHERE schoolID = ?"
+_SELECT_SEQUENCE = "SELECT nextValue FROM sequences WHERE schoolID = ? AND name = ?"
+_UPSERT_SEQUENCE = "INSERT OR REPLACE INTO sequences (schoolID, name, nextValue) VALUES (?, ?, ?)"
+
+
+class SQLiteStorage(StorageBackend):
+    """Durable storage in a SQLite database (stdlib sqlite3, WAL mode).
+
+    Each write runs in its own transaction unless it happens inside
+    batch(), in which case the whole batch commits once at the end.
+    Users and reports load in the order they were first saved (rowid
+    order), which is filing order: report IDs compare as strings, so
+    R1000 would sort before R999.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False,
+                                     cached_statements=64, timeout=30)
+        self._lock = threading.RLock()
+        self._depth = 0
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Add columns introduced after a database was created."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(reports)")}
+        if "blindIndex" not in columns:
+            self._conn.execute("ALTER TABLE reports ADD COLUMN blindIndex TEXT")
+
+    @contextmanager
+    def batch(self):
+        with self._lock:
+            if self._depth == 0:
+                self._conn.execute("BEGIN")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.execute("COMMIT")
+
+    def _write(self, sql: str, rows: list) -> None:
+        with self.batch():
+            self._conn.executemany(sql, rows)
+
+    def _query(self, sql: str, params: tuple) -> list:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # --- Schools ---
+
+    def saveSchool(self, schoolID: str, name: str, address: str) -> None:
+        self._write(_UPSERT_SCHOOL, [(schoolID, name, address)])
+
+    def loadSchool(self, schoolID: str) -> dict:
+        rows = self._query(_SELECT_SCHOOL, (schoolID,))
+        if not rows:
+            return None
+        return dict(zip(("schoolID", "name", "address"), rows[0]))
+
+    # --- Users ---
+
+    @staticmethod
+    def _userRow(schoolID: str, user: 'User') -> tuple:
+        return (schoolID, user.userID, user.role, user.name, user.email, emailKey(user.email),
+                getattr(user, "grade", None), user.passwordHash)
+
+    @staticmethod
+    def _userRecord(row: tuple) -> dict:
+        userID, role, name, email, grade, passwordHash = row
+        record = {"userID": userID, "name": name, "email": email, "role": role, "passwordHash": passwordHash}
+        if role == "Student":
+            record["grade"] = grade
+        return record
+
+    def saveUsers(self, schoolID: str, users: list) -> None:
+        self._write(_UPSERT_USER, [self._userRow(schoolID, user) for user in users])
+
+    def deleteUser(self, schoolID: str, userID: str) -> None:
+        self._write(_DELETE_USER, [(schoolID, userID)])
+
+    def loadUsers(self, schoolID: str) -> list:
+        return [self._userRecord(row) for row in self._query(_SELECT_USERS, (schoolID,))]
+
+    def findUserByEmail(self, schoolID: str, email: str) -> dict:
+        rows = self._query(_SELECT_USER_BY_EMAIL, (schoolID, emailKey(email)))
+        return self._userRecord(rows[0]) if rows else None
+
+    # --- Reports ---
+
+    @staticmethod
+    def _reportRow(schoolID: str, report: 'BullyingReport') -> tuple:
+        record = report.toRecord()
+        witnesses = record.get("witnesses")
+        evidence = record.get("evidence")
+        return (schoolID, record["reportID"], record["type"], record["reportDate"], record["description"],
+                record["confidentialityLevel"], record["status"], int(record["encrypted"]),
+                record["reporterID"], record["teacherID"], record.get("location"), record.get("onlinePlatform"),
+                json.dumps(witnesses) if witnesses is not None else None,
+                json.dumps(evidence) if evidence is not None else None, record["blindIndex"])
+
+    @staticmethod
+    def _reportRecord(row: tuple) -> dict:
+        (reportID, reportType, reportDate, description, confidentialityLevel, status, encrypted,
+         reporterID, teacherID, location, onlinePlatform, witnesses, evidence, blindIndex) = row
+        record = {
+            "reportID": reportID, "type": reportType, "reportDate": reportDate, "description": description,
+            "confidentialityLevel": confidentialityLevel, "status": status, "encrypted": bool(encrypted),
+            "reporterID": reporterID, "teacherID": teacherID, "blindIndex": blindIndex,
+        }
+        if reportType == "InPersonReport":
+            record["location"] = location
+            record["witnesses"] = json.loads(witnesses) if witnesses else []
+        else:
+            record["onlinePlatform"] = onlinePlatform
+            record["evidence"] = json.loads(evidence) if evidence else []
+        return record
+
+    def saveReports(self, schoolID: str, reports: list) -> None:
+        self._write(_UPSERT_REPORT, [self._reportRow(schoolID, report) for report in reports])
+
+    def deleteReport(self, schoolID: str, reportID: str) -> None:
+        self._write(_DELETE_REPORT, [(schoolID, reportID)])
+
+    def loadReports(self, schoolID: str) -> list:
+        rows = self._query(_SELECT_REPORTS + " ORDER BY rowid", (schoolID,))
+        return [self._reportRecord(row) for row in rows]
+
+    def findReports(self, schoolID: str, reporterID: str = None, teacherID: str = None,
+                    status: str = None, reportType: str = None) -> list:
+        sql = _SELECT_REPORTS
+        params = [schoolID]
+        for column, value in (("reporterID", reporterID), ("teacherID", teacherID),
+                              ("status", status), ("type", reportType)):
+            if value is not None:
+                sql += f" AND {column} = ?"
+                params.append(value)
+        return [self._reportRecord(row) for row in self._query(sql + " ORDER BY rowid", tuple(params))]
+
+    # --- Sequences ---
+
+    def reserveSequence(self, schoolID: str, name: str, count: int, minimum: int = 1) -> int:
+        with self._lock:
+            # A reservation must commit on its own: rolled back with an outer
+            # batch, its block could be reserved again by another process
+            # while this one is still handing it out.
+            if self._depth > 0:
+                raise RuntimeError("reserveSequence() cannot run inside batch(); reserve IDs before the batch.")
+            # BEGIN IMMEDIATE takes the database write lock up front, so two
+            # processes can never read the same nextValue.
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(_SELECT_SEQUENCE, (schoolID, name)).fetchone()
+                start = max(row[0] if row else 1, minimum)
+                self._conn.execute(_UPSERT_SEQUENCE, (schoolID, name, start + count))
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return start
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_storage(spec: str) -> StorageBackend:
+    """Create a backend from a spec string: "memory" (for tests) or "sqlite:<path>"."""
+    if spec == "memory":
+        return MemoryStorage()
+    if spec.startswith("sqlite:"):
+        return SQLiteStorage(spec[len("sqlite:"):])
+    raise ValueError(f"Unknown storage backend: {spec}")
@@ -0,0 +1,99 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+from datetime import datetime
+import builtins
+import io
+from contextlib import redirect_stdout
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+from SchoolClass import School
+from UserClasses import Student, Teacher, Administrator
+from DataSecurity import hash_password
+from Sessions import SessionManager
+from MenuTypes import student_menu
+
+def test_tc008_report_registry_indexes():
+    """
+    Test Case TC008: Report registry keeps its lookup indexes in sync
+    """
+    # Setup: Initialize school, users and two reports
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+    school.reports.clear()
+    school.users.clear()
+
+    student = Student("S001", "Ben Gonzales", "Ben@student.com", grade=10, passwordHash=hash_password("yulo"))
+    teacher = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash=hash_password("Raffy Tulfo in Action"))
+    admin = Administrator("A001", "Cardo Dalisay", "Cardo@admin.com", passwordHash=hash_password("bengbeng"))
+    school.users.extend([student, teacher, admin])
+
+    inperson_report = InPersonReport(
+        reportID="R001",
+        reportDate=datetime.now(),
+        description="A bullying incident in the gymnasium",
+        confidentialityLevel=ConfidentialityLevel.CONFIDENTIAL,
+        location="School Gymnasium"
+    )
+    cyber_report = CyberBullyingReport(
+        reportID="R002",
+        reportDate=datetime.now(),
+        description="Cyberbullying on social media",
+        confidentialityLevel=ConfidentialityLevel.HIGHLY_CONFIDENTIAL,
+        onlinePlatform="Facebook"
+    )
+
+    # Step 1: File both reports through the student
+    student.fileReport(inperson_report)
+    student.fileReport(cyber_report)
+    assert school.reports.getByID("R001") is inperson_report, "[ERROR] reportID index mismatch."
+    assert school.reports.byReporter(student) == [inperson_report, cyber_report], "[ERROR] Reporter index mismatch."
+    assert school.reports.byType(CyberBullyingReport) == [cyber_report], "[ERROR] Type index mismatch."
+    assert len(school.reports.unassigned()) == 2, "[ERROR] Both reports should start unassigned."
+
+    # Step 2: A duplicate report ID is rejected
+    duplicate = InPersonReport("R001", datetime.now(), "Duplicate", ConfidentialityLevel.PUBLIC, "Canteen")
+    student.fileReport(duplicate)
+    assert len(school.reports) == 2, "[ERROR] Duplicate report ID was registered."
+
+    # Step 3: Assign the teacher and review the report
+    original_input = builtins.input
+    builtins.input = lambda _: "1"
+    try:
+        admin.assignStaff(inperson_report, [teacher])
+    finally:
+        builtins.input = original_input
+    assert school.reports.byTeacher(teacher) == [inperson_report], "[ERROR] Teacher index mismatch."
+    assert school.reports.unassigned() == [cyber_report], "[ERROR] Unassigned index mismatch."
+
+    teacher.reviewReport(inperson_report)
+    assert school.reports.byStatus(ReportStatus.IN_PROGRESS) == [inperson_report], "[ERROR] Status index mismatch."
+    assert school.reports.byStatus(ReportStatus.NEW) == [cyber_report], "[ERROR] Status index mismatch."
+
+    # Step 4: Remove the staff and drop a report from the list
+    builtins.input = lambda _: "2"
+    try:
+        admin.assignStaff(inperson_report, [teacher])
+    finally:
+        builtins.input = original_input
+    assert school.reports.byTeacher(teacher) == [], "[ERROR] Teacher index not cleared on removal."
+
+    school.reports.remove(cyber_report)
+    assert school.reports.getByID("R002") is None, "[ERROR] Removed report still indexed."
+    assert school.reports.byType(CyberBullyingReport) == [], "[ERROR] Removed report still in type index."
+
+    # The student menu reports a filing the school rejected instead of claiming success
+    outsider = Student("S999", "Not Enrolled", "outsider@student.com", grade=10, passwordHash="x")
+    answers = iter(["1", "1", "Pushed near the gym", "1", "Gym", "3"])
+    builtins.input = lambda _: next(answers)
+    output = io.StringIO()
+    try:
+        with redirect_stdout(output):
+            student_menu(SessionManager().issue(outsider), school)
+    finally:
+        builtins.input = original_input
+    assert "filed successfully" not in output.getvalue(), "[ERROR] Rejected filing reported as a success."
+    assert "was not filed" in output.getvalue(), "[ERROR] Rejected filing not reported."
+
+    print("[SUCCESS] Test Case TC008 passed.")
+
+if __name__ == "__main__":
+    test_tc008_report_registry_indexes()
@@ -0,0 +1,69 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import builtins
+from SchoolClass import School
+from UserClasses import Student, Teacher, Administrator
+from DataSecurity import hash_password
+from MenuTypes import login_user
+from Sessions import SessionManager
+
+def test_tc009_user_directory_login():
+    """
+    Test Case TC009: Login goes through the email-keyed user directory
+    """
+    # Setup: Initialize school and one user per role
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+    school.users.clear()
+
+    student = Student("S001", "Ben Gonzales", "Ben@student.com", grade=10, passwordHash=hash_password("yulo"))
+    teacher = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash=hash_password("Raffy Tulfo in Action"))
+    admin = Administrator("A001", "Cardo Dalisay", "Cardo@admin.com", passwordHash=hash_password("bengbeng"))
+    school.users.extend([student, teacher, admin])
+
+    # Step 1: Lookups by email are case-insensitive and by userID are exact
+    assert school.users.getByEmail("  BEN@Student.com ") is student, "[ERROR] Email lookup failed."
+    assert school.users.getByID("T001") is teacher, "[ERROR] userID lookup failed."
+    assert school.users.getByEmail("Ben@student.com", "Teacher") is None, "[ERROR] Role filter ignored."
+    assert school.users.withRole("Teacher") == [teacher], "[ERROR] Teacher view mismatch."
+
+    # Step 2: login_user finds the user for the selected role only
+    sessions = SessionManager()
+    original_input = builtins.input
+    try:
+        answers = iter(["CARDO@admin.com", "bengbeng"])
+        builtins.input = lambda _: next(answers)
+        assert login_user("3", school, sessions).user is admin, "[ERROR] Administrator login failed."
+
+        answers = iter(["Cardo@admin.com", "bengbeng"])
+        builtins.input = lambda _: next(answers)
+        assert login_user("1", school, sessions) is None, "[ERROR] Administrator logged in as a student."
+
+        answers = iter(["Ben@student.com", "wrong"])
+        builtins.input = lambda _: next(answers)
+        assert login_user("1", school, sessions) is None, "[ERROR] Wrong password accepted."
+    finally:
+        builtins.input = original_input
+
+    # Step 3: Removing a user drops it from every view
+    school.users.remove(teacher)
+    assert school.users.getByEmail("Raffy@teacher.com") is None, "[ERROR] Removed user still indexed."
+    assert school.users.withRole("Teacher") == [], "[ERROR] Removed user still in role view."
+
+    # Step 4: A taken email or userID is rejected and the directory is left as it was
+    for clash in (Student("S002", "Copy", "BEN@student.com", grade=9, passwordHash="x"),
+                  Teacher("S001", "Copy", "copy@teacher.com", passwordHash="x")):
+        try:
+            school.users.append(clash)
+            assert False, f"[ERROR] Duplicate user {clash.userID} accepted."
+        except ValueError:
+            pass
+    assert school.users.getByEmail("ben@student.com") is student, "[ERROR] Duplicate replaced the lookup."
+    assert len(school.users) == 2, "[ERROR] Duplicate user was added."
+    school.users[0] = Student("S001", "Ben Gonzales", "ben@student.com", grade=11, passwordHash="x")
+    assert school.users.getByID("S001").grade == 11, "[ERROR] Replacing a user in place failed."
+
+    print("[SUCCESS] Test Case TC009 passed.")
+
+if __name__ == "__main__":
+    test_tc009_user_directory_login()
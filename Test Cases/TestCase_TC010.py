@@ -0,0 +1,109 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import builtins
+import os
+import tempfile
+from datetime import datetime
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+from SchoolClass import School
+from UserClasses import Student, Teacher, Administrator
+from DataSecurity import hash_password
+from Storage import SQLiteStorage, MemoryStorage
+
+def _populate(storage):
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City", storage=storage)
+    student = Student("S001", "Ben Gonzales", "Ben@student.com", grade=10, passwordHash=hash_password("yulo"))
+    teacher = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash=hash_password("Raffy Tulfo in Action"))
+    admin = Administrator("A001", "Cardo Dalisay", "Cardo@admin.com", passwordHash=hash_password("bengbeng"))
+    with storage.batch():
+        school.users.extend([student, teacher, admin])
+
+    student.fileReport(InPersonReport(
+        reportID="R001",
+        reportDate=datetime(2025, 3, 14, 8, 30),
+        description="A bullying incident in the gymnasium",
+        confidentialityLevel=ConfidentialityLevel.CONFIDENTIAL,
+        location="School Gymnasium",
+        witnesses=["Jose Rizz Al"]
+    ))
+    student.fileReport(CyberBullyingReport(
+        reportID="R002",
+        reportDate=datetime(2025, 3, 15, 19, 0),
+        description="Cyberbullying on social media",
+        confidentialityLevel=ConfidentialityLevel.HIGHLY_CONFIDENTIAL,
+        onlinePlatform="Facebook"
+    ))
+
+    original_input = builtins.input
+    builtins.input = lambda _: "1"
+    try:
+        admin.assignStaff(school.reports.getByID("R001"), [teacher])
+    finally:
+        builtins.input = original_input
+    teacher.reviewReport(school.reports.getByID("R001"))
+
+def _check_reloaded(storage):
+    school = School.load(storage, "SCH001")
+    assert school.name == "BatStateU-The-NEU", "[ERROR] School name not restored."
+    assert len(school.users) == 3 and len(school.reports) == 2, "[ERROR] Users or reports missing after reload."
+
+    student = school.users.getByEmail("ben@student.com")
+    assert student.grade == 10 and student.login("yulo"), "[ERROR] Student not restored."
+
+    report = school.reports.getByID("R001")
+    assert isinstance(report, InPersonReport), "[ERROR] Report type not restored."
+    assert report.reporter is student, "[ERROR] Reporter not relinked."
+    assert report.assigned_teacher is school.users.getByID("T001"), "[ERROR] Assigned teacher not relinked."
+    assert report.status == ReportStatus.IN_PROGRESS and report.encrypted, "[ERROR] Review state not persisted."
+    assert report.witnesses == ["Jose Rizz Al"], "[ERROR] Witnesses not persisted."
+    assert report.reportDate == datetime(2025, 3, 14, 8, 30), "[ERROR] Report date not persisted."
+    assert school.reports.getByID("R002").onlinePlatform == "Facebook", "[ERROR] Platform not persisted."
+
+    # Indexed queries straight against the backend
+    assert [r["reportID"] for r in storage.findReports("SCH001", teacherID="T001")] == ["R001"], "[ERROR] Teacher query mismatch."
+    assert [r["reportID"] for r in storage.findReports("SCH001", status="NEW")] == ["R002"], "[ERROR] Status query mismatch."
+    assert storage.findUserByEmail("SCH001", "CARDO@admin.com")["userID"] == "A001", "[ERROR] Email query mismatch."
+
+    # Removing a report deletes its row
+    school.reports.remove(school.reports.getByID("R002"))
+    assert [r["reportID"] for r in storage.loadReports("SCH001")] == ["R001"], "[ERROR] Deleted report still stored."
+
+    # Reports load in filing order, even across R999 -> R1000 and after updates
+    for reportID in ("R999", "R1000"):
+        student.fileReport(CyberBullyingReport(reportID, datetime(2025, 3, 16), "Spam", ConfidentialityLevel.PUBLIC, "Messenger"))
+    school.reports.updateStatus(report, ReportStatus.RESOLVED)
+    assert [r["reportID"] for r in storage.loadReports("SCH001")] == ["R001", "R999", "R1000"], "[ERROR] Load order is not filing order."
+
+def test_tc010_sqlite_storage_round_trip():
+    """
+    Test Case TC010: School, users and reports survive a restart through SQLite
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tutok.db")
+        storage = SQLiteStorage(path)
+        _populate(storage)
+        storage.close()
+
+        # Step 2: Reopen the database as a fresh process would
+        storage = SQLiteStorage(path)
+        try:
+            _check_reloaded(storage)
+        finally:
+            storage.close()
+
+    print("[SUCCESS] Test Case TC010 passed.")
+
+def test_tc010_memory_storage_round_trip():
+    """
+    Test Case TC010: The in-memory backend behaves the same way for tests
+    """
+    storage = MemoryStorage()
+    _populate(storage)
+    _check_reloaded(storage)
+
+    print("[SUCCESS] Test Case TC010 (memory backend) passed.")
+
+if __name__ == "__main__":
+    test_tc010_sqlite_storage_round_trip()
+    test_tc010_memory_storage_round_trip()
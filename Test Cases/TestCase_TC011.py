@@ -0,0 +1,79 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import builtins
+import os
+import tempfile
+import threading
+from datetime import datetime
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+from SchoolClass import School
+from UserClasses import Student, Teacher, Administrator
+from DataSecurity import hash_password
+from Journal import Journal
+
+def test_tc011_journal_recovery():
+    """
+    Test Case TC011: Report lifecycle survives a crash through the journal
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        # Setup: School with users, journaled from the start
+        school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+        student = Student("S001", "Ben Gonzales", "Ben@student.com", grade=10, passwordHash=hash_password("yulo"))
+        teacher = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash=hash_password("Raffy Tulfo in Action"))
+        admin = Administrator("A001", "Cardo Dalisay", "Cardo@admin.com", passwordHash=hash_password("bengbeng"))
+        school.users.extend([student, teacher, admin])
+
+        journal = Journal(tmp)
+        school.attachJournal(journal)
+
+        # Step 1: File, assign, review (which encrypts) a report
+        report = InPersonReport("R001", datetime.now(), "A bullying incident in the gymnasium",
+                                ConfidentialityLevel.CONFIDENTIAL, "School Gymnasium")
+        student.fileReport(report)
+        original_input = builtins.input
+        builtins.input = lambda _: "1"
+        try:
+            admin.assignStaff(report, [teacher])
+        finally:
+            builtins.input = original_input
+        teacher.reviewReport(report)
+
+        # Step 2: A burst of concurrent filings is group-committed
+        def file_reports(start):
+            for n in range(start, start + 20):
+                student.fileReport(CyberBullyingReport(f"R{n:03}", datetime.now(), "Group chat insults",
+                                                       ConfidentialityLevel.PUBLIC, "Messenger"))
+        threads = [threading.Thread(target=file_reports, args=(100 + 20 * i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Step 3: Simulate a crash with a torn final write, then recover
+        journal.close()
+        with open(os.path.join(tmp, Journal.LOG_NAME), "ab") as f:
+            f.write(b'{"seq": 9999, "type": "REPORT_FI')
+
+        recovered = Journal.recover(tmp)
+        assert len(recovered.reports) == 81, "[ERROR] Filed reports not recovered."
+        restored = recovered.reports.getByID("R001")
+        assert restored.reporter is recovered.users.getByID("S001"), "[ERROR] Reporter not relinked."
+        assert restored.assigned_teacher is recovered.users.getByID("T001"), "[ERROR] Assignment not replayed."
+        assert restored.status == ReportStatus.IN_PROGRESS, "[ERROR] Status change not replayed."
+        assert restored.encrypted and restored.description == report.description, "[ERROR] Encryption not replayed."
+
+        # Step 4: After a checkpoint, only new events are left in the log
+        journal = Journal(tmp)
+        recovered.attachJournal(journal)
+        assert list(Journal.readEvents(journal.logPath)) == [], "[ERROR] Checkpoint did not truncate the log."
+        recovered.reports.updateStatus(recovered.reports.getByID("R100"), ReportStatus.RESOLVED)
+        journal.close()
+        assert len(list(Journal.readEvents(journal.logPath))) == 1, "[ERROR] Expected one event after checkpoint."
+        again = Journal.recover(tmp)
+        assert again.reports.getByID("R100").status == ReportStatus.RESOLVED, "[ERROR] Post-checkpoint event lost."
+
+    print("[SUCCESS] Test Case TC011 passed.")
+
+if __name__ == "__main__":
+    test_tc011_journal_recovery()
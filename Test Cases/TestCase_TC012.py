@@ -0,0 +1,92 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import os
+import tempfile
+import threading
+from datetime import datetime
+from Reports import InPersonReport, ConfidentialityLevel
+from SchoolClass import School
+from Storage import SQLiteStorage
+from ReportIDs import ReportIDAllocator
+
+def test_tc012_report_id_allocation():
+    """
+    Test Case TC012: Report IDs stay unique and keep the R001 format
+    """
+    # Setup: School holding the two dummy reports
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+    school.reports.clear()
+    for reportID in ("R001", "R002"):
+        school.reports.append(InPersonReport(reportID, datetime.now(), "Incident", ConfidentialityLevel.PUBLIC, "Canteen"))
+
+    # Step 1: Allocation continues after the existing IDs
+    assert school.nextReportID() == "R003", "[ERROR] Allocator did not skip existing IDs."
+
+    # Step 2: Removing a report never causes an ID to be reused
+    school.reports.remove(school.reports.getByID("R002"))
+    assert school.nextReportID() == "R004", "[ERROR] Allocator reused an ID."
+
+    # Step 3: Many threads allocating at once get distinct IDs
+    allocated = []
+    def allocate_many():
+        ids = [school.nextReportID() for _ in range(500)]
+        allocated.extend(ids)
+    threads = [threading.Thread(target=allocate_many) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(allocated)) == 4000, "[ERROR] Duplicate IDs handed out across threads."
+
+    print("[SUCCESS] Test Case TC012 passed.")
+
+def test_tc012_report_ids_shared_database():
+    """
+    Test Case TC012: Two processes sharing one database never collide, even across restarts
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tutok.db")
+        school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+        school.reports.clear()
+
+        # Two allocators on separate connections stand in for two processes.
+        first = SQLiteStorage(path)
+        second = SQLiteStorage(path)
+        school.attachStorage(first)
+        allocator_a = ReportIDAllocator(school, blockSize=16)
+        allocator_b = ReportIDAllocator(school, blockSize=16)
+
+        # Interleave the two "processes" block by block.
+        ids_a, ids_b = [], []
+        for _ in range(10):
+            school.storage = first
+            ids_a.extend(allocator_a.allocate() for _ in range(16))
+            school.storage = second
+            ids_b.extend(allocator_b.allocate() for _ in range(16))
+        assert not set(ids_a) & set(ids_b), "[ERROR] Allocators sharing a database collided."
+
+        # A reservation never joins a batch that could roll it back
+        try:
+            with first.batch():
+                first.reserveSequence("SCH001", ReportIDAllocator.SEQUENCE_NAME, 16)
+            assert False, "[ERROR] Reservation ran inside a batch."
+        except RuntimeError:
+            pass
+        assert first.reserveSequence("SCH001", ReportIDAllocator.SEQUENCE_NAME, 16) > 0, "[ERROR] Reservation failed."
+
+        # A restart resumes after everything already reserved
+        first.close()
+        second.close()
+        reopened = SQLiteStorage(path)
+        school.attachStorage(reopened, save=False)
+        next_id = school.nextReportID()
+        assert next_id not in set(ids_a) | set(ids_b), "[ERROR] ID reused after restart."
+        assert int(next_id[1:]) > max(int(i[1:]) for i in ids_a + ids_b), "[ERROR] IDs not monotonic across restarts."
+        reopened.close()
+
+    print("[SUCCESS] Test Case TC012 (shared database) passed.")
+
+if __name__ == "__main__":
+    test_tc012_report_id_allocation()
+    test_tc012_report_ids_shared_database()
@@ -0,0 +1,53 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+from datetime import datetime, timezone
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel
+
+def test_tc013_compact_report_objects():
+    """
+    Test Case TC013: Reports are slot-based and allocate lists lazily
+    """
+    report_date = datetime(2025, 3, 14, 8, 30, 15, 123456)
+    inperson_report = InPersonReport("R001", report_date, "Pushing in the hallway",
+                                     ConfidentialityLevel.CONFIDENTIAL, "Hallway B")
+    cyber_report = CyberBullyingReport("R002", report_date, "Insults in a group chat",
+                                       ConfidentialityLevel.PUBLIC, "Messenger", evidence=["screenshot.png"])
+
+    # Step 1: No per-instance dict, and ad hoc attributes are rejected
+    assert not hasattr(inperson_report, "__dict__"), "[FAIL] Report still carries a __dict__."
+    try:
+        inperson_report.notes = "extra"
+        assert False, "[FAIL] Undeclared attribute was accepted."
+    except AttributeError:
+        pass
+
+    # Step 2: assigned_teacher is a declared slot that starts empty
+    assert inperson_report.assigned_teacher is None, "[FAIL] assigned_teacher should default to None."
+
+    # Step 3: The compact date round-trips exactly (naive and aware)
+    assert inperson_report.reportDate == report_date, "[FAIL] Report date changed."
+    aware = datetime(2025, 3, 14, 8, 30, tzinfo=timezone.utc)
+    cyber_report.reportDate = aware
+    assert cyber_report.reportDate == aware, "[FAIL] Aware report date changed."
+
+    # Step 4: Witness and evidence lists are only allocated when needed
+    assert inperson_report._witnesses is None, "[FAIL] Empty witness list allocated eagerly."
+    inperson_report.witnesses.append("Jose Rizz Al")
+    assert inperson_report.witnesses == ["Jose Rizz Al"], "[FAIL] Witness not recorded."
+    assert cyber_report.evidence == ["screenshot.png"], "[FAIL] Evidence not kept."
+
+    # Step 5: Locations and platforms are interned and shared between reports
+    other = InPersonReport("R003", report_date, "Shoving", ConfidentialityLevel.PUBLIC, "".join(["Hallway", " B"]))
+    assert other.location is inperson_report.location, "[FAIL] Location string not interned."
+
+    # Step 6: A missing place is kept as None and fails validation instead of raising
+    missing = InPersonReport("R004", report_date, "Tripped", ConfidentialityLevel.PUBLIC, None)
+    assert missing.location is None and not missing.validateReport(), "[FAIL] Missing location mishandled."
+    missing = CyberBullyingReport("R005", report_date, "Spam", ConfidentialityLevel.PUBLIC, None)
+    assert missing.onlinePlatform is None and not missing.validateReport(), "[FAIL] Missing platform mishandled."
+
+    print("[SUCCESS] Test Case TC013 passed.")
+
+if __name__ == "__main__":
+    test_tc013_compact_report_objects()
@@ -0,0 +1,53 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+from datetime import datetime
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+from SchoolClass import School
+
+def test_tc014_columnar_report_aggregates():
+    """
+    Test Case TC014: Columnar analytics match the report objects and refresh incrementally
+    """
+    # Setup: School with a mix of reports
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+    school.reports.clear()
+    for n in range(1, 31):
+        if n % 3:
+            report = InPersonReport(f"R{n:03}", datetime(2025, 1 + n % 2, 5), "Incident",
+                                    ConfidentialityLevel.CONFIDENTIAL, "Cafeteria" if n % 2 else "Library")
+        else:
+            report = CyberBullyingReport(f"R{n:03}", datetime(2025, 2, 5), "Online incident",
+                                         ConfidentialityLevel.HIGHLY_CONFIDENTIAL, "Instagram")
+        school.registerReport(report)
+
+    columns = school.analytics()
+
+    # Step 1: Group-by counts match a scan of the objects
+    assert columns.countBy("type") == {"InPersonReport": 20, "CyberBullyingReport": 10}, "[FAIL] Type counts mismatch."
+    assert columns.countBy("location") == {"Cafeteria": 10, "Library": 10, None: 10}, "[FAIL] Location counts mismatch."
+    assert columns.countBy("onlinePlatform", type="CyberBullyingReport") == {"Instagram": 10}, "[FAIL] Platform counts mismatch."
+    expected_months = {}
+    for r in school.reports:
+        key = r.reportDate.strftime("%Y-%m")
+        expected_months[key] = expected_months.get(key, 0) + 1
+    assert columns.countBy("month") == expected_months, "[FAIL] Month counts mismatch."
+
+    # Step 2: New filings and status changes refresh the snapshot
+    school.registerReport(CyberBullyingReport("R031", datetime(2025, 3, 1), "DMs",
+                                              ConfidentialityLevel.PUBLIC, "TikTok"))
+    school.reports.updateStatus(school.reports.getByID("R001"), ReportStatus.RESOLVED)
+    assert columns.countBy("status") == {ReportStatus.NEW: 30, ReportStatus.RESOLVED: 1}, "[FAIL] Status counts not refreshed."
+    assert columns.count(onlinePlatform="TikTok") == 1, "[FAIL] New report not added."
+
+    # Step 3: Combined filters and removals
+    assert columns.count(confidentialityLevel=[ConfidentialityLevel.PUBLIC, ConfidentialityLevel.HIGHLY_CONFIDENTIAL]) == 11, \
+        "[FAIL] Multi-value filter mismatch."
+    school.reports.remove(school.reports.getByID("R003"))
+    assert columns.count(onlinePlatform="Instagram") == 9, "[FAIL] Removed report still counted."
+    assert "R003" not in columns.reportIDsWhere(type="CyberBullyingReport"), "[FAIL] Removed report still listed."
+
+    print("[SUCCESS] Test Case TC014 passed.")
+
+if __name__ == "__main__":
+    test_tc014_columnar_report_aggregates()
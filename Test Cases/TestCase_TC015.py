@@ -0,0 +1,57 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import builtins
+from datetime import datetime
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+from SchoolClass import School
+from UserClasses import Student, Teacher, Administrator
+from DataSecurity import hash_password
+
+def test_tc015_dashboard_counters():
+    """
+    Test Case TC015: Dashboard counters follow every state change
+    """
+    # Setup: School with a student, two teachers and an administrator
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+    student = Student("S001", "Ben Gonzales", "Ben@student.com", grade=10, passwordHash=hash_password("yulo"))
+    teacher1 = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash=hash_password("Raffy Tulfo in Action"))
+    teacher2 = Teacher("T002", "Erwin Tulfo", "Erwin@teacher.com", passwordHash=hash_password("Para sa mahirap"))
+    admin = Administrator("A001", "Cardo Dalisay", "Cardo@admin.com", passwordHash=hash_password("bengbeng"))
+    school.users.extend([student, teacher1, teacher2, admin])
+
+    # Step 1: Filing reports updates totals, type and backlog counts
+    for n in range(1, 6):
+        student.fileReport(InPersonReport(f"R{n:03}", datetime.now(), "Incident", ConfidentialityLevel.PUBLIC, "Canteen"))
+    student.fileReport(CyberBullyingReport("R006", datetime.now(), "Online", ConfidentialityLevel.CONFIDENTIAL, "TikTok"))
+    summary = school.dashboard.summary()
+    assert summary["total"] == 6 and summary["unassigned"] == 6, "[FAIL] Filing counts wrong."
+    assert summary["byType"] == {"InPersonReport": 5, "CyberBullyingReport": 1}, "[FAIL] Type counts wrong."
+
+    # Step 2: Assign, reassign, review and remove staff
+    original_input = builtins.input
+    try:
+        builtins.input = lambda _: "1"
+        admin.assignStaff(school.reports.getByID("R001"), [teacher1, teacher2])
+        admin.assignStaff(school.reports.getByID("R002"), [teacher1, teacher2])
+        builtins.input = lambda _: "2"
+        admin.assignStaff(school.reports.getByID("R002"), [teacher1, teacher2])   # Remove staff
+        admin.assignStaff(school.reports.getByID("R003"), [teacher1, teacher2])   # Assign teacher2
+    finally:
+        builtins.input = original_input
+    teacher1.reviewReport(school.reports.getByID("R001"))
+
+    summary = school.dashboard.summary()
+    assert summary["byTeacher"] == {"T001": 1, "T002": 1}, "[FAIL] Teacher counts wrong."
+    assert summary["unassigned"] == 4, "[FAIL] Backlog count wrong."
+    assert summary["byStatus"] == {ReportStatus.NEW: 5, ReportStatus.IN_PROGRESS: 1}, "[FAIL] Status counts wrong."
+
+    # Step 3: Removing a report and the consistency check
+    school.reports.remove(school.reports.getByID("R003"))
+    assert school.dashboard.summary()["byTeacher"] == {"T001": 1}, "[FAIL] Removal not counted."
+    assert school.dashboard.verify(school.reports), "[FAIL] Counters drifted from a full recount."
+
+    print("[SUCCESS] Test Case TC015 passed.")
+
+if __name__ == "__main__":
+    test_tc015_dashboard_counters()
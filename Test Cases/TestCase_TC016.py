@@ -0,0 +1,80 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import builtins
+from datetime import datetime, timedelta
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+from SchoolClass import School
+from UserClasses import Teacher
+from DataSecurity import hash_password
+from Pagination import report_page
+from MenuTypes import browse_reports
+from ReportRegistry import ReportRegistry
+
+def test_tc016_paginated_report_listing():
+    """
+    Test Case TC016: Report listings are paged with cursors, filters and sorting
+    """
+    # Setup: 45 reports, every third one cyberbullying, every fifth assigned
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+    teacher = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash=hash_password("Raffy Tulfo in Action"))
+    school.users.append(teacher)
+    start = datetime(2025, 1, 1)
+    for n in range(1, 46):
+        if n % 3 == 0:
+            report = CyberBullyingReport(f"R{n:03}", start - timedelta(days=n), "Online", ConfidentialityLevel.PUBLIC, "TikTok")
+        else:
+            report = InPersonReport(f"R{n:03}", start - timedelta(days=n), "Incident", ConfidentialityLevel.PUBLIC, "Canteen")
+        school.registerReport(report)
+        if n % 5 == 0:
+            school.reports.updateAssignment(report, teacher)
+
+    # Step 1: Walking the cursor visits every report exactly once, in ID order
+    seen, cursor = [], None
+    while True:
+        page, cursor = report_page(school.reports, pageSize=10, cursor=cursor)
+        seen.extend(r.reportID for r in page)
+        if cursor is None:
+            break
+    assert seen == [f"R{n:03}" for n in range(1, 46)], "[FAIL] Cursor walk skipped or repeated reports."
+
+    # Step 2: Filters combine with the registry indexes
+    page, cursor = report_page(school.reports, pageSize=50, reportType=CyberBullyingReport, assigned=True)
+    assert [r.reportID for r in page] == ["R015", "R030", "R045"] and cursor is None, "[FAIL] Filtered page mismatch."
+    page, _ = report_page(school.reports, pageSize=50, assigned=False, status=ReportStatus.NEW)
+    assert len(page) == 36, "[FAIL] Unassigned filter mismatch."
+
+    # Step 3: Sorting by date puts the oldest report first
+    page, cursor = report_page(school.reports, pageSize=5, sortBy="date")
+    assert page[0].reportID == "R045", "[FAIL] Date sort mismatch."
+    page, _ = report_page(school.reports, pageSize=5, sortBy="date", cursor=cursor)
+    assert page[0].reportID == "R040", "[FAIL] Date sort second page mismatch."
+
+    # Step 4: The menu pages forward and selects by the number shown on screen
+    answers = iter(["", "1", "n", "1", "n", "12"])  # any status, in-person, unassigned only, by ID; next page; pick #12
+    original_input = builtins.input
+    builtins.input = lambda _: next(answers)
+    try:
+        selected = browse_reports(school, "Select a report number", page_size=10)
+    finally:
+        builtins.input = original_input
+    expected = [r for r in school.reports if isinstance(r, InPersonReport) and r.assigned_teacher is None][11]
+    assert selected is expected, "[FAIL] Menu selected the wrong report."
+
+    # Step 5: ID-order walks skip the gaps between IDs and cross chunk boundaries
+    for reportID in ("R999999999", "R1"):
+        school.registerReport(InPersonReport(reportID, start, "Incident", ConfidentialityLevel.PUBLIC, "Canteen"))
+    walked = [r.reportID for r in school.reports.iterByID()]
+    assert walked == ["R001", "R1"] + [f"R{n:03}" for n in range(2, 46)] + ["R999999999"], "[FAIL] ID walk mismatch."
+    assert [r.reportID for r in school.reports.iterByID("R045")] == ["R999999999"], "[FAIL] Walk after a cursor failed."
+    school.reports.remove(school.reports.getByID("R1"))
+    assert len(list(school.reports.iterWhere())) == 46, "[FAIL] Unfiltered walk lost or repeated reports."
+    registry = ReportRegistry(InPersonReport(f"R{n:03}", start, "Incident", ConfidentialityLevel.PUBLIC, "Canteen")
+                              for n in range(1000, 0, -1))
+    assert [r.reportID for r in registry.iterByID("R300")] == [f"R{n:03}" for n in range(301, 1001)], \
+        "[FAIL] Chunked walk mismatch."
+
+    print("[SUCCESS] Test Case TC016 passed.")
+
+if __name__ == "__main__":
+    test_tc016_paginated_report_listing()
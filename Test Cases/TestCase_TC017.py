@@ -0,0 +1,76 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import base64
+import io
+import os
+from contextlib import redirect_stdout
+from unittest import mock
+from datetime import datetime
+from Reports import InPersonReport, ConfidentialityLevel
+from DataSecurity import SecurityManager
+
+def test_tc017_authenticated_report_encryption():
+    """
+    Test Case TC017: Report descriptions use versioned authenticated encryption
+    """
+    security_manager = SecurityManager.get_instance()
+    description = "A bullying incident near the school entrance."
+
+    # Step 1: Encrypting a report no longer yields plain base64
+    report = InPersonReport("R001", datetime.now(), description, ConfidentialityLevel.CONFIDENTIAL, "School Entrance")
+    report.encryptDetails()
+    assert report.encrypted, "[FAIL] Report not marked encrypted."
+    assert report.description.startswith("$tk1$"), "[FAIL] Ciphertext is not versioned."
+    assert description not in report.description, "[FAIL] Plaintext visible in ciphertext."
+    assert security_manager.decryptData(report.description) == description, "[FAIL] Decryption mismatch."
+
+    # Step 2: The same text encrypts differently each time (fresh nonce)
+    first, second = security_manager.encrypt_many([description, description])
+    assert first != second, "[FAIL] Nonce reused."
+    assert SecurityManager.ciphertextVersion(first) != SecurityManager.ciphertextVersion(second), "[FAIL] Versions collide."
+
+    # Step 3: Tampering is detected
+    head, body = first.rsplit("$", 1)
+    tampered = head + "$" + ("A" if body[0] != "A" else "B") + body[1:]
+    try:
+        security_manager.decryptData(tampered)
+        assert False, "[FAIL] Tampered ciphertext accepted."
+    except ValueError:
+        pass
+
+    # Step 4: Bulk round trip, including a legacy base64 value
+    values = [f"Incident {n}: name-calling in the hallway" for n in range(500)] + ["", "ünïcödé ✓"]
+    assert security_manager.decrypt_many(security_manager.encrypt_many(values)) == values, "[FAIL] Bulk round trip failed."
+    legacy = base64.b64encode(description.encode("utf-8")).decode("utf-8")
+    assert security_manager.decryptData(legacy) == description, "[FAIL] Legacy base64 value unreadable."
+
+    # Step 5: Without TUTOK_SECRET the development secret warns, and deployments refuse it
+    saved = (dict(SecurityManager._ciphers), SecurityManager._activeKeyID, SecurityManager._developmentKey)
+    environ = {name: value for name, value in os.environ.items() if name not in ("TUTOK_SECRET", "TUTOK_DEV")}
+    try:
+        with mock.patch.dict(os.environ, environ, clear=True):
+            SecurityManager._activeKeyID = None
+            output = io.StringIO()
+            with redirect_stdout(output):
+                SecurityManager.activeKeyID()
+            assert "[WARN] TUTOK_SECRET is not set" in output.getvalue(), "[FAIL] Development secret used silently."
+            try:
+                SecurityManager.requireDeploymentKey()
+                assert False, "[FAIL] Development secret accepted for a deployment."
+            except RuntimeError:
+                pass
+            os.environ["TUTOK_DEV"] = "1"
+            SecurityManager.requireDeploymentKey()  # Allowed for local development
+            os.environ["TUTOK_SECRET"] = "a real deployment secret"
+            SecurityManager._activeKeyID = None
+            SecurityManager.requireDeploymentKey()
+            del os.environ["TUTOK_DEV"]
+            SecurityManager.requireDeploymentKey()  # A configured secret needs no TUTOK_DEV
+    finally:
+        SecurityManager._ciphers, SecurityManager._activeKeyID, SecurityManager._developmentKey = saved
+
+    print("[SUCCESS] Test Case TC017 passed.")
+
+if __name__ == "__main__":
+    test_tc017_authenticated_report_encryption()
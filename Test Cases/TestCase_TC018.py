@@ -0,0 +1,66 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+from datetime import datetime
+from SchoolClass import School
+from UserClasses import Student
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel
+from DataSecurity import SecurityManager
+from EncryptionPipeline import EncryptionPipeline
+from Storage import MemoryStorage
+
+def test_tc018_background_encryption_pipeline():
+    """
+    Test Case TC018: Newly filed reports are encrypted in the background
+    """
+    security_manager = SecurityManager.get_instance()
+    school = School("S001", "Test School", "123 Main St", MemoryStorage())
+    student = Student("S100", "Jane Doe", "jane@school.edu", "hash", 10)
+    school.users.append(student)
+    backlog = InPersonReport("R001", datetime.now(), "Filed before the pipeline started.", ConfidentialityLevel.PUBLIC, "Library")
+    school.registerReport(backlog)
+
+    # Step 1: Existing plaintext reports and new filings are all encrypted by close()
+    pipeline = school.startEncryption(batchSize=16, maxPending=8)
+    descriptions = {"R001": backlog.description}
+    for n in range(2, 200):
+        reportID = school.nextReportID()
+        descriptions[reportID] = f"Incident {n}: pushed in the hallway."
+        report = CyberBullyingReport(reportID, datetime.now(), descriptions[reportID], ConfidentialityLevel.CONFIDENTIAL, "Instagram")
+        student.fileReport(report)
+    school.stopEncryption()
+    assert school.encryption is None, "[FAIL] Pipeline still attached."
+    assert all(report.encrypted for report in school.reports), "[FAIL] Some reports left in plaintext."
+    for report in school.reports:
+        assert security_manager.decryptData(report.description) == descriptions[report.reportID], "[FAIL] Decryption mismatch."
+    assert pipeline.encrypted == len(school.reports), "[FAIL] Encryption count mismatch."
+    assert pipeline.batches < len(school.reports), "[FAIL] Reports were not batched."
+
+    # Step 2: Storage sees the ciphertext, not the plaintext
+    stored = {record["reportID"]: record for record in school.storage.loadReports("S001")}
+    assert all(stored[reportID]["encrypted"] for reportID in descriptions), "[FAIL] Storage not updated."
+
+    # Step 3: A report the teacher already encrypted is left alone
+    report = InPersonReport(school.nextReportID(), datetime.now(), "Already handled.", ConfidentialityLevel.PUBLIC, "Gym")
+    report.encryptDetails()
+    ciphertext = report.description
+    pipeline = EncryptionPipeline(school.reports, useProcesses=True, workers=2)
+    school.registerReport(report)
+    pipeline.close()
+    assert report.description == ciphertext, "[FAIL] Encrypted report re-encrypted."
+
+    # Step 4: Process-pool mode encrypts with the same key as this process
+    pipeline = EncryptionPipeline(school.reports, useProcesses=True, workers=2, batchSize=8)
+    reports = [InPersonReport(school.nextReportID(), datetime.now(), f"Pool incident {n}", ConfidentialityLevel.PUBLIC, "Cafeteria")
+               for n in range(40)]
+    school.reports.extend(reports)
+    pipeline.flush()
+    assert all(report.encrypted for report in reports), "[FAIL] Process pool left reports unencrypted."
+    assert security_manager.decrypt_many([r.description for r in reports]) == [f"Pool incident {n}" for n in range(40)], \
+        "[FAIL] Process pool ciphertext unreadable."
+    pipeline.close()
+
+    print("[SUCCESS] Test Case TC018 passed.")
+
+if __name__ == "__main__":
+    test_tc018_background_encryption_pipeline()
@@ -0,0 +1,51 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import time
+from datetime import datetime
+from Reports import InPersonReport, ConfidentialityLevel
+from DataSecurity import SecurityManager, DecryptionCache
+
+def test_tc019_decrypted_description_cache():
+    """
+    Test Case TC019: Decrypted descriptions are cached per session with LRU and TTL limits
+    """
+    security_manager = SecurityManager.get_instance()
+    reports = [InPersonReport(f"R{n:03}", datetime.now(), f"Incident {n}", ConfidentialityLevel.CONFIDENTIAL, "Hallway")
+               for n in range(1, 6)]
+    for report in reports:
+        report.encryptDetails()
+    cache = DecryptionCache(security_manager, maxEntries=3, ttl=60)
+
+    # Step 1: The second view of a report is a hit
+    assert cache.decrypt(reports[0]) == "Incident 1", "[FAIL] Wrong plaintext."
+    assert cache.decrypt(reports[0]) == "Incident 1", "[FAIL] Wrong cached plaintext."
+    assert (cache.hits, cache.misses) == (1, 1), "[FAIL] Hit/miss counts wrong."
+
+    # Step 2: The least recently used entry is evicted past maxEntries
+    for report in reports[1:4]:
+        cache.decrypt(report)
+    assert len(cache) == 3 and cache.evictions == 1, "[FAIL] Cache not bounded."
+    cache.decrypt(reports[0])
+    assert cache.misses == 5, "[FAIL] Evicted entry was still served."
+
+    # Step 3: A re-encrypted report misses and replaces its stale entry
+    reports[3].description = security_manager.encryptData("Incident 4 (corrected)")
+    assert cache.decrypt(reports[3]) == "Incident 4 (corrected)", "[FAIL] Stale plaintext served."
+    assert len(cache) == 3, "[FAIL] Stale entry kept alongside the new one."
+
+    # Step 4: Entries expire after the TTL
+    short_cache = DecryptionCache(security_manager, ttl=0.01)
+    short_cache.decrypt(reports[4])
+    time.sleep(0.02)
+    short_cache.decrypt(reports[4])
+    assert (short_cache.hits, short_cache.misses) == (0, 2), "[FAIL] Expired entry served."
+
+    # Step 5: Logout clears every plaintext but keeps the metrics
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()["hits"] == 1, "[FAIL] Clear did not behave."
+
+    print("[SUCCESS] Test Case TC019 passed.")
+
+if __name__ == "__main__":
+    test_tc019_decrypted_description_cache()
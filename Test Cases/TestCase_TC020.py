@@ -0,0 +1,59 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import hashlib
+from SchoolClass import School
+from Storage import MemoryStorage
+from UserClasses import Student, Teacher
+from DataSecurity import SecurityManager, PasswordHasher, hash_password
+
+def test_tc020_password_hashing_and_upgrade():
+    """
+    Test Case TC020: Salted password hashes, rehash-on-login and the verified-credential cache
+    """
+    # Step 1: New hashes are salted and carry their parameters
+    first, second = hash_password("yulo"), hash_password("yulo")
+    assert first != second, "[FAIL] Hashes are not salted."
+    assert first.startswith("pbkdf2_sha256$"), "[FAIL] Parameters not stored with the hash."
+
+    school = School("S001", "Test School", "123 Main St", MemoryStorage())
+    student = Student("S001", "Ben Gonzales", "Ben@student.com", grade=10, passwordHash=first)
+    school.users.append(student)
+    assert student.login("yulo"), "[FAIL] Correct password rejected."
+    assert not student.login("wrong"), "[FAIL] Wrong password accepted."
+
+    # Step 2: A legacy SHA-256 hash still logs in and is upgraded in storage
+    legacy = hashlib.sha256("Raffy Tulfo in Action".encode()).hexdigest()
+    teacher = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash=legacy)
+    school.users.append(teacher)
+    assert not teacher.login("Raffy"), "[FAIL] Wrong password accepted for a legacy hash."
+    assert teacher.passwordHash == legacy, "[FAIL] Hash upgraded without a valid login."
+    assert teacher.login("Raffy Tulfo in Action"), "[FAIL] Legacy hash rejected."
+    assert teacher.passwordHash.startswith("pbkdf2_sha256$"), "[FAIL] Legacy hash not upgraded."
+    assert school.storage.findUserByEmail("S001", "raffy@teacher.com")["passwordHash"] == teacher.passwordHash, \
+        "[FAIL] Upgraded hash not saved."
+
+    # Step 3: Changing the cost setting upgrades hashes on the next login
+    previous = SecurityManager.passwordHasher()
+    try:
+        SecurityManager.configurePasswords("scrypt", n=2 ** 12, r=8, p=1)
+        assert student.login("yulo"), "[FAIL] Old-setting hash rejected."
+        assert student.passwordHash.startswith("scrypt$4096$8$1$"), "[FAIL] Hash not moved to scrypt."
+        assert student.login("yulo") and not student.login("nope"), "[FAIL] scrypt verification broken."
+    finally:
+        SecurityManager._passwordHasher = previous
+
+    # Step 4: Repeat verifications hit the cache, but only for the right password
+    hasher = PasswordHasher(iterations=50_000)
+    stored = hasher.hash("bengbeng")
+    assert hasher.verify("bengbeng", stored) and hasher.verify("bengbeng", stored), "[FAIL] Verification failed."
+    assert len(hasher._verified) == 1, "[FAIL] Verification not cached."
+    assert not hasher.verify("bengbenG", stored), "[FAIL] Cache accepted a wrong password."
+    hasher.forget()
+    assert not hasher._verified, "[FAIL] Cache not cleared."
+    assert not hasher.verify("x", "md5$abc$def"), "[FAIL] Unknown algorithm accepted."
+
+    print("[SUCCESS] Test Case TC020 passed.")
+
+if __name__ == "__main__":
+    test_tc020_password_hashing_and_upgrade()
@@ -0,0 +1,65 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import builtins
+import time
+from datetime import datetime
+from SchoolClass import School
+from UserClasses import Student, Teacher
+from Reports import InPersonReport, ConfidentialityLevel
+from DataSecurity import hash_password
+from MenuTypes import login_user, student_menu
+from Sessions import SessionManager
+
+def test_tc021_session_tokens():
+    """
+    Test Case TC021: A login issues an expiring session token that the menus work from
+    """
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+    student = Student("S001", "Ben Gonzales", "Ben@student.com", grade=10, passwordHash=hash_password("yulo"))
+    teacher = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash=hash_password("Raffy Tulfo in Action"))
+    school.users.extend([student, teacher])
+    sessions = SessionManager()
+
+    # Step 1: A successful login yields a session whose token validates
+    original_input = builtins.input
+    try:
+        answers = iter(["Ben@student.com", "yulo"])
+        builtins.input = lambda _: next(answers)
+        session = login_user("1", school, sessions)
+        assert session is not None and session.user is student, "[FAIL] Login did not issue a session."
+        assert sessions.validate(session.token) is session, "[FAIL] Token does not validate."
+        assert sessions.validate("not-a-token") is None, "[FAIL] Unknown token accepted."
+        assert sessions.login(teacher, "wrong") is None, "[FAIL] Session issued for a wrong password."
+
+        # Step 2: The student menu runs from the session and logging out revokes it
+        # An invalid report type is rejected before a report ID is allocated
+        answers = iter(["1", "9", "1", "1", "Pushed near the gym", "2", "Gym", "2", "3"])
+        builtins.input = lambda _: next(answers)
+        student_menu(session, school)
+        assert sessions.validate(session.token) is None, "[FAIL] Logout did not revoke the token."
+        assert [r.reportID for r in school.reports] == ["R001"], "[FAIL] Invalid type used up a report ID."
+    finally:
+        builtins.input = original_input
+
+    # Step 3: Sessions expire and are evicted from the store
+    short = SessionManager(ttl=0.01)
+    first = short.issue(teacher)
+    report = InPersonReport("R001", datetime.now(), "Hallway incident", ConfidentialityLevel.CONFIDENTIAL, "Hallway")
+    report.encryptDetails()
+    assert first.decryptionCache.decrypt(report) == "Hallway incident", "[FAIL] Session cache decrypt failed."
+    time.sleep(0.02)
+    assert not first.isValid(), "[FAIL] Expired session still valid."
+    short.issue(student)
+    assert len(short) == 1, "[FAIL] Expired session not evicted."
+    assert len(first.decryptionCache) == 0, "[FAIL] Expired session kept its plaintexts."
+
+    # Step 4: All sessions of a user can be revoked at once
+    a, b = sessions.issue(teacher), sessions.issue(teacher)
+    sessions.revokeUser(teacher)
+    assert not a.isValid() and not b.isValid(), "[FAIL] User sessions not revoked."
+
+    print("[SUCCESS] Test Case TC021 passed.")
+
+if __name__ == "__main__":
+    test_tc021_session_tokens()
@@ -0,0 +1,61 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+from datetime import datetime
+from UserClasses import Student, Teacher, Administrator
+from Reports import InPersonReport, ConfidentialityLevel
+from DataSecurity import SecurityManager
+from Permissions import PermissionPolicy
+
+def test_tc022_compiled_permissions():
+    """
+    Test Case TC022: Role permissions, role hierarchy and per-report rules
+    """
+    security_manager = SecurityManager.get_instance()
+    student = Student("S001", "Ben Gonzales", "Ben@student.com", grade=10, passwordHash="x")
+    other = Student("S002", "Jose Rizz Al", "Jose@student.com", grade=11, passwordHash="x")
+    teacher = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash="x")
+    admin = Administrator("A001", "Cardo Dalisay", "Cardo@admin.com", passwordHash="x")
+
+    # Step 1: Role-level checks, including permissions inherited from "Staff"
+    assert security_manager.checkPermission(student, "file_report"), "[FAIL] Student cannot file."
+    assert not security_manager.checkPermission(student, "assign_staff"), "[FAIL] Student can assign."
+    assert security_manager.checkPermission(admin, "assign_staff"), "[FAIL] Admin cannot assign."
+    assert not security_manager.checkPermission(admin, "review_report"), "[FAIL] Admin can review."
+    assert security_manager.checkPermission(teacher, "view_report"), "[FAIL] Teacher did not inherit view_report."
+    assert not security_manager.checkPermission(teacher, "no_such_action"), "[FAIL] Unknown action allowed."
+
+    # Step 2: Per-report rules
+    levels = list(ConfidentialityLevel)
+    reports = []
+    for n in range(3000):
+        report = InPersonReport(f"R{n:04}", datetime.now(), f"Incident {n}", levels[n % 3], "Hallway",
+                                reporter=student if n % 2 else other)
+        report.assigned_teacher = teacher if n % 5 == 0 else None
+        reports.append(report)
+    assigned, unassigned = reports[0], reports[1]
+    assert security_manager.checkPermission(teacher, "review_report", assigned), "[FAIL] Assigned review denied."
+    assert not security_manager.checkPermission(teacher, "review_report", unassigned), "[FAIL] Unassigned review allowed."
+    highly = next(r for r in reports if r.confidentialityLevel == ConfidentialityLevel.HIGHLY_CONFIDENTIAL)
+    assert not security_manager.checkPermission(admin, "decrypt_report", highly), "[FAIL] Clearance not enforced."
+    assert security_manager.checkPermission(admin, "decrypt_report", reports[0]), "[FAIL] Public decrypt denied."
+
+    # Step 3: Batch filtering agrees with the single checks
+    for user in (student, teacher, admin):
+        for action in ("view_report", "review_report", "decrypt_report"):
+            expected = [r for r in reports if security_manager.checkPermission(user, action, r)]
+            assert security_manager.filter_permitted(user, reports, action) == expected, \
+                f"[FAIL] Batch filter mismatch for {user.role} {action}."
+    assert len(security_manager.filter_permitted(student, reports)) == 1500, "[FAIL] Student sees others' reports."
+
+    # Step 4: Cyclic role hierarchies are rejected
+    try:
+        PermissionPolicy(roleParents={"Teacher": ("Staff",), "Staff": ("Teacher",)})
+        assert False, "[FAIL] Cyclic hierarchy accepted."
+    except ValueError:
+        pass
+
+    print("[SUCCESS] Test Case TC022 passed.")
+
+if __name__ == "__main__":
+    test_tc022_compiled_permissions()
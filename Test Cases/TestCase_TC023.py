@@ -0,0 +1,112 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import asyncio
+import json
+from unittest.mock import patch
+from SchoolClass import School
+from UserClasses import Student, Teacher, Administrator
+from DataSecurity import hash_password
+from IntakeService import IntakeService
+
+async def request(port, method, path, payload=None, token=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n"
+    if token:
+        head += f"Authorization: Bearer {token}\r\n"
+    writer.write(head.encode() + b"\r\n" + body)
+    response = await reader.read()
+    writer.close()
+    status_line, _, rest = response.partition(b"\r\n")
+    return int(status_line.split()[1]), json.loads(rest.split(b"\r\n\r\n", 1)[1])
+
+def test_tc023_http_intake_service():
+    """
+    Test Case TC023: Students, admins and teachers work through the HTTP/JSON service
+    """
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City")
+    student = Student("S001", "Ben Gonzales", "Ben@student.com", grade=10, passwordHash=hash_password("yulo"))
+    teacher = Teacher("T001", "Raffy Tulfo", "Raffy@teacher.com", passwordHash=hash_password("Raffy Tulfo in Action"))
+    admin = Administrator("A001", "Cardo Dalisay", "Cardo@admin.com", passwordHash=hash_password("bengbeng"))
+    school.users.extend([student, teacher, admin])
+
+    async def scenario():
+        service = IntakeService(school, port=0)
+        await service.start()
+        port = service.port
+        try:
+            # Step 1: Login issues tokens; a bad password does not
+            status, body = await request(port, "POST", "/login", {"email": "ben@student.com", "password": "yulo"})
+            assert status == 200, "[FAIL] Student login failed."
+            student_token = body["token"]
+            status, _ = await request(port, "POST", "/login", {"email": "ben@student.com", "password": "nope"})
+            assert status == 401, "[FAIL] Bad password accepted."
+            _, body = await request(port, "POST", "/login", {"email": "Cardo@admin.com", "password": "bengbeng"})
+            admin_token = body["token"]
+            _, body = await request(port, "POST", "/login", {"email": "Raffy@teacher.com", "password": "Raffy Tulfo in Action"})
+            teacher_token = body["token"]
+
+            # Step 2: Students file many reports concurrently and list them
+            results = await asyncio.gather(*(
+                request(port, "POST", "/reports", {"type": "cyber", "description": f"Incident {n}",
+                                                   "onlinePlatform": "Instagram"}, student_token)
+                for n in range(50)))
+            assert all(status == 201 for status, _ in results), "[FAIL] Filing failed."
+            assert len({body["reportID"] for _, body in results}) == 50, "[FAIL] Report IDs collided."
+            status, body = await request(port, "GET", "/reports/mine", token=student_token)
+            assert status == 200 and len(body["reports"]) == 50, "[FAIL] Listing mismatch."
+            status, _ = await request(port, "POST", "/reports", {"type": "cyber", "description": ""}, student_token)
+            assert status == 400, "[FAIL] Empty description accepted."
+            for place in ({"location": None}, {"location": ["Gym"]}, {}):
+                status, _ = await request(port, "POST", "/reports", {"type": "in_person", "description": "Pushed",
+                                                                     **place}, student_token)
+                assert status == 400, f"[FAIL] Report with place {place} accepted."
+            with patch.object(Student, "fileReport", side_effect=RuntimeError("storage down")):
+                status, body = await request(port, "POST", "/reports", {"type": "cyber", "description": "Again",
+                                                                        "onlinePlatform": "Instagram"}, student_token)
+            assert status == 500 and "error" in body, "[FAIL] Unexpected error not answered with a 500."
+            status, _ = await request(port, "POST", "/reports", {"type": "phone", "description": "Calls"}, student_token)
+            assert status == 400, "[FAIL] Unknown report type accepted."
+            _, body = await request(port, "POST", "/reports", {"type": "cyber", "description": "Once more",
+                                                                 "onlinePlatform": "Instagram"}, student_token)
+            # R051 went to the request that failed with a 500; the 400s used none
+            assert body["reportID"] == "R052", "[FAIL] Rejected requests used up report IDs."
+            status, _ = await request(port, "GET", "/reports/mine")
+            assert status == 401, "[FAIL] Missing token accepted."
+
+            # Step 3: Only the admin assigns, and only the assigned teacher reviews
+            reportID = results[0][1]["reportID"]
+            status, _ = await request(port, "POST", f"/reports/{reportID}/assign", {"teacherID": "T001"}, student_token)
+            assert status == 403, "[FAIL] Student assigned staff."
+            status, _ = await request(port, "POST", f"/reports/{reportID}/assign", {"teacherID": []}, admin_token)
+            assert status == 400, "[FAIL] Non-string teacherID accepted."
+            status, body = await request(port, "POST", f"/reports/{reportID}/assign", {"teacherID": "T001"}, admin_token)
+            assert status == 200 and body["assignedTeacher"] == "T001", "[FAIL] Assignment failed."
+            status, body = await request(port, "POST", f"/reports/{reportID}/review", {"decrypt": True}, teacher_token)
+            assert status == 200 and body["status"] == "IN_PROGRESS", "[FAIL] Review failed."
+            assert body["description"] == "Incident 0", "[FAIL] Decrypted description mismatch."
+            other = results[1][1]["reportID"]
+            status, _ = await request(port, "POST", f"/reports/{other}/review", {}, teacher_token)
+            assert status == 403, "[FAIL] Unassigned report reviewed."
+            # Decrypting reviews on one session run on executor threads and share its cache
+            for _, body in results[2:20]:
+                school.reports.updateAssignment(school.reports.getByID(body["reportID"]), teacher)
+            reviews = await asyncio.gather(*(
+                request(port, "POST", f"/reports/{body['reportID']}/review", {"decrypt": True}, teacher_token)
+                for _, body in results[2:20] for _ in range(3)))
+            assert [body.get("description") for _, body in reviews] == \
+                [f"Incident {n}" for n in range(2, 20) for _ in range(3)], "[FAIL] Concurrent decryption mismatch."
+
+            # Step 4: Logging out revokes the token
+            await request(port, "POST", "/logout", token=student_token)
+            status, _ = await request(port, "GET", "/reports/mine", token=student_token)
+            assert status == 401, "[FAIL] Token still valid after logout."
+        finally:
+            await service.stop()
+
+    asyncio.run(scenario())
+    print("[SUCCESS] Test Case TC023 passed.")
+
+if __name__ == "__main__":
+    test_tc023_http_intake_service()
@@ -0,0 +1,132 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import threading
+from collections import Counter
+from datetime import datetime
+from SchoolClass import School
+from Storage import MemoryStorage
+from UserClasses import Student, Teacher, Administrator
+from Reports import InPersonReport, ConfidentialityLevel, ReportStatus
+
+class StatusEvents:
+    """Listener counting every status transition it is told about."""
+    def __init__(self):
+        self.transitions = Counter()
+    def reportAdded(self, report): pass
+    def reportRemoved(self, report): pass
+    def reportUpdated(self, report, field, old):
+        if field == "status":
+            self.transitions[(report.reportID, old)] += 1
+
+def test_tc024_concurrent_filing_and_review():
+    """
+    Test Case TC024: Many threads filing, assigning and reviewing keep the registry consistent
+    """
+    school = School("SCH001", "BatStateU-The-NEU", "Golden Country Homes, Brgy. Alangilan, Batangas City",
+                    MemoryStorage())
+    students = [Student(f"S{n:03}", f"Student {n}", f"s{n}@student.com", grade=10, passwordHash="x") for n in range(8)]
+    teachers = [Teacher(f"T{n:03}", f"Teacher {n}", f"t{n}@teacher.com", passwordHash="x") for n in range(4)]
+    admin = Administrator("A001", "Cardo Dalisay", "Cardo@admin.com", passwordHash="x")
+    school.users.extend(students + teachers + [admin])
+    events = StatusEvents()
+    school.reports.addListener(events)
+    pipeline = school.startEncryption(maxPending=16, batchSize=8)
+
+    per_student = 150
+    filing_done = threading.Event()
+    errors = []
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+
+    def file_reports(student):
+        try:
+            for n in range(per_student):
+                report = InPersonReport(school.nextReportID(), datetime.now(), f"{student.userID} incident {n}",
+                                        ConfidentialityLevel.CONFIDENTIAL, "Hallway")
+                assert student.fileReport(report), "[FAIL] Filing rejected."
+        except Exception as e:
+            errors.append(e)
+
+    def assign_reports(teacher_index):
+        try:
+            while not filing_done.is_set() or school.reports.unassigned():
+                for report in school.reports.unassigned():
+                    # Several assigners race for the same report; exactly one wins.
+                    school.reports.compareAndSetAssignment(report, None, teachers[teacher_index])
+        except Exception as e:
+            errors.append(e)
+
+    def review_reports(teacher):
+        try:
+            while not filing_done.is_set() or school.reports.unassigned():
+                for report in school.reports.byTeacher(teacher):
+                    teacher.reviewReport(report)
+            for report in school.reports.byTeacher(teacher):
+                teacher.reviewReport(report)
+        except Exception as e:
+            errors.append(e)
+
+    try:
+        filers = [threading.Thread(target=file_reports, args=(s,)) for s in students]
+        workers = [threading.Thread(target=assign_reports, args=(n,)) for n in range(len(teachers))]
+        workers += [threading.Thread(target=review_reports, args=(t,)) for t in teachers]
+        for thread in filers + workers:
+            thread.start()
+        for thread in filers:
+            thread.join()
+        filing_done.set()
+        for thread in workers:
+            thread.join()
+        school.stopEncryption()
+    finally:
+        sys.setswitchinterval(previous_interval)
+
+    assert not errors, f"[FAIL] Worker raised: {errors[0]!r}"
+    total = len(students) * per_student
+    reports = school.reports.snapshot()
+
+    # Invariant 1: every filing registered once, with a unique ID
+    assert len(reports) == total and len({r.reportID for r in reports}) == total, "[FAIL] Lost or duplicated reports."
+    assert all(school.reports.getByID(r.reportID) is r for r in reports), "[FAIL] ID index out of sync."
+
+    # Invariant 2: every report assigned once and moved NEW -> IN_PROGRESS exactly once
+    assert not school.reports.unassigned(), "[FAIL] Unassigned reports left."
+    assert sum(len(school.reports.byTeacher(t)) for t in teachers) == total, "[FAIL] Teacher index out of sync."
+    assert len(school.reports.byStatus(ReportStatus.IN_PROGRESS)) == total, "[FAIL] Status index out of sync."
+    assert all(r.status == ReportStatus.IN_PROGRESS for r in reports), "[FAIL] Report not reviewed."
+    assert len(events.transitions) == total and set(events.transitions.values()) == {1}, \
+        "[FAIL] A status transition was applied twice or lost."
+
+    # Invariant 3: listeners saw a consistent history
+    assert school.dashboard.verify(reports), "[FAIL] Dashboard counters drifted."
+    stored = school.storage.loadReports("SCH001")
+    assert len(stored) == total, "[FAIL] Storage missed reports."
+    # Reviews race the pipeline, so either may have encrypted a report, but never both.
+    assert all(r.encrypted for r in reports) and 0 < pipeline.encrypted <= total, "[FAIL] Reports left unencrypted."
+    assert all(record["encrypted"] and record["status"] == "IN_PROGRESS" for record in stored), \
+        "[FAIL] Storage holds a stale report."
+
+    # Invariant 4: a failing listener is skipped, and the listeners after it stay in step
+    school = School("SCH002", "Listener School", "Listener Street", MemoryStorage())
+    student = Student("S001", "Ana", "ana@student.com", grade=10, passwordHash="x")
+    school.users.append(student)
+    def fail(*args):
+        raise RuntimeError("listener failed")
+    school.duplicates.reportAdded = fail  # Runs before the case tracker
+    saveReports = school.storage.saveReports
+    school.storage.saveReports = fail     # The first listener of all
+    report = InPersonReport("R001", datetime.now(), "Lunch money taken", ConfidentialityLevel.PUBLIC, "Canteen")
+    assert student.fileReport(report), "[FAIL] A failing listener aborted the filing."
+    assert school.dashboard.summary()["total"] == 1, "[FAIL] Dashboard missed the report."
+    assert school.searchReports("lunch money") == [report], "[FAIL] Search index missed the report."
+    assert school.cases.caseOf(report).caseID == "C-R001", "[FAIL] Case tracker missed the report."
+    school.storage.saveReports = saveReports
+    school.reports.updateStatus(report, ReportStatus.RESOLVED)
+    assert school.storage.loadReports("SCH002")[0]["status"] == "RESOLVED", "[FAIL] Storage stopped receiving events."
+    assert school.dashboard.verify(school.reports.snapshot()), "[FAIL] Dashboard counters drifted."
+
+    print("[SUCCESS] Test Case TC024 passed.")
+
+if __name__ == "__main__":
+    test_tc024_concurrent_filing_and_review()
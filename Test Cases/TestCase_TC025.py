@@ -0,0 +1,63 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+from datetime import datetime
+from SchoolDirectory import SchoolDirectory
+from SchoolClass import School
+from Storage import MemoryStorage
+from UserClasses import Student, Teacher, Administrator
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+
+def test_tc025_school_directory():
+    """
+    Test Case TC025: Many schools in one process, each its own partition
+    """
+    directory = SchoolDirectory(processes=2)
+    schools = [directory.create(f"SCH{n:03}", f"School {n}", f"Street {n}", MemoryStorage()) for n in range(4)]
+    staff = {}
+    for school in schools:
+        student = Student("S001", f"Student of {school.schoolID}", f"s@{school.schoolID}.edu", grade=10, passwordHash="x")
+        teacher = Teacher("T001", f"Teacher of {school.schoolID}", f"t@{school.schoolID}.edu", passwordHash="x")
+        admin = Administrator("A001", f"Admin of {school.schoolID}", f"a@{school.schoolID}.edu", passwordHash="x")
+        school.users.extend([student, teacher, admin])
+        staff[school.schoolID] = (student, teacher, admin)
+
+    # Step 1: Filing, assigning and reviewing act on the user's own school
+    assert School.get_instance() not in schools, "[FAIL] A hosted school became the default school."
+    for n, school in enumerate(schools):
+        student, teacher, admin = staff[school.schoolID]
+        assert student.school is school and directory.schoolOf(student) is school, "[FAIL] User not routed."
+        for k in range(10 * (n + 1)):
+            report_class = InPersonReport if k % 2 else CyberBullyingReport
+            report = report_class(school.nextReportID(), datetime.now(), f"Incident {k}",
+                                  ConfidentialityLevel.CONFIDENTIAL, "Hallway")
+            assert student.fileReport(report), "[FAIL] Filing rejected."
+        first = school.reports.getByID("R001")
+        assert directory.schoolOf(first) is school, "[FAIL] Report not routed."
+        assert admin.assignTeacher(first, teacher), "[FAIL] Assignment rejected."
+        assert teacher.reviewReport(first), "[FAIL] Review rejected."
+
+    # Step 2: Partitions are isolated (every school has its own R001)
+    for n, school in enumerate(schools):
+        assert len(school.reports) == 10 * (n + 1), "[FAIL] Reports leaked between schools."
+        assert school.reports.getByID("R001").reporter is staff[school.schoolID][0], "[FAIL] Wrong R001."
+        assert len(school.storage.loadReports(school.schoolID)) == 10 * (n + 1), "[FAIL] Storage not partitioned."
+    outsider = staff["SCH000"][0]
+    assert schools[1].users.getByEmail(outsider.email) is None, "[FAIL] User visible in another school."
+    assert directory.findUser("s@SCH002.edu") is staff["SCH002"][0], "[FAIL] Cross-school user lookup failed."
+
+    # Step 3: Cross-school aggregates agree with and without the process pool
+    pooled = directory.countBy("status")
+    directory.processes = None
+    local = directory.countBy("status")
+    assert pooled == local == {ReportStatus.NEW: 96, ReportStatus.IN_PROGRESS: 4}, "[FAIL] Status totals wrong."
+    assert directory.countBy("type", status=ReportStatus.NEW) == {"InPersonReport": 50, "CyberBullyingReport": 46}, \
+        "[FAIL] Filtered totals wrong."
+    assert directory.count(teacher="T001") == 4, "[FAIL] Count wrong."
+    assert directory.summary() == {"total": 100, "unassigned": 96, "schools": 4}, "[FAIL] Summary wrong."
+    directory.close()
+
+    print("[SUCCESS] Test Case TC025 passed.")
+
+if __name__ == "__main__":
+    test_tc025_school_directory()
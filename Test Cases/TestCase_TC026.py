@@ -0,0 +1,85 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import gzip
+import json
+import os
+import tempfile
+from SchoolClass import School
+from UserClasses import Student, Teacher
+from DataSecurity import SecurityManager
+from RosterImport import import_roster, RosterImporter
+
+def test_tc026_roster_import():
+    """
+    Test Case TC026: Streaming roster import from CSV and JSON lines
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        school = School("SCH026", "Roster School", "Import Street")
+        school.users.append(Student("S000", "Existing", "taken@school.edu", grade=9, passwordHash="x"))
+        SecurityManager.configurePasswords("pbkdf2_sha256", iterations=1000)
+        try:
+            # Step 1: CSV import keeps going past bad rows and duplicates
+            csv_path = os.path.join(tmp, "roster.csv")
+            with open(csv_path, "w", encoding="utf-8") as f:
+                f.write("userID,name,email,role,grade,password\n"
+                        "S001,Ana,ana@school.edu,Student,10,ana-pass\n"
+                        "S002,Ben,TAKEN@school.edu,Student,10,ben-pass\n"
+                        "S003,Cid,cid@school.edu,Student,ten,cid-pass\n"
+                        "T001,Dee,dee@school.edu,Teacher,,dee-pass\n"
+                        "T002,Eve,ana@school.edu,Teacher,,eve-pass\n"
+                        "X001,Fay,fay@school.edu,Janitor,,fay-pass\n"
+                        "A001,Gus,gus@school.edu,Administrator,,\n")
+            result = import_roster(school, csv_path, chunkSize=2)
+            assert result.imported == 2, f"[FAIL] Expected 2 imported users, got {result.imported}."
+            assert result.duplicates == 2 and result.invalid == 3, f"[FAIL] Unexpected rejections: {result}."
+            assert [error.line for error in result.errors] == [3, 4, 6, 7, 8], "[FAIL] Wrong error lines."
+            assert isinstance(school.users.getByEmail("dee@school.edu"), Teacher), "[FAIL] Teacher not imported."
+
+            # Step 2: Imported users log in with their initial password
+            ana = school.users.getByEmail("ana@school.edu")
+            assert ana.grade == 10 and ana.school is school, "[FAIL] Student fields not imported."
+            assert ana.login("ana-pass") and not ana.login("wrong"), "[FAIL] Imported credentials do not work."
+
+            # Step 3: Gzipped JSON lines, hashed on a process pool
+            jsonl_path = os.path.join(tmp, "roster.jsonl.gz")
+            with gzip.open(jsonl_path, "wt", encoding="utf-8") as f:
+                for n in range(25):
+                    f.write(json.dumps({"userID": f"P{n:03}", "name": f"Pupil {n}", "email": f"p{n}@school.edu",
+                                        "role": "Student", "grade": 8, "password": f"pw{n}"}) + "\n")
+                f.write("{not json\n")
+                # Wrong JSON types are rejected row by row instead of aborting the import
+                f.write(json.dumps({"userID": "X001", "name": "Num", "email": 5, "role": "Student", "grade": 8,
+                                    "password": "pw"}) + "\n")
+                f.write(json.dumps({"userID": "X002", "name": "Num", "email": "x2@school.edu", "role": "Teacher",
+                                    "password": 123}) + "\n")
+                f.write(json.dumps({"userID": "S001", "name": "Again", "email": "new@school.edu",
+                                    "role": "Teacher", "password": "pw"}) + "\n")
+            result = import_roster(school, jsonl_path, chunkSize=10, processes=2)
+            assert result.imported == 25, f"[FAIL] Expected 25 imported users, got {result.imported}."
+            assert result.invalid == 3 and result.duplicates == 1, f"[FAIL] Unexpected rejections: {result}."
+            assert school.users.getByEmail("p24@school.edu").login("pw24"), "[FAIL] Pool-hashed password rejected."
+            assert len(school.users) == 28, "[FAIL] Directory size is wrong."
+
+            # Step 4: A user registered while the chunk was being hashed is a duplicate row, not an abort
+            def rows():
+                yield 1, {"userID": "Q001", "name": "Quin", "email": "quin@school.edu", "role": "Teacher",
+                          "passwordHash": "x"}
+                yield 2, {"userID": "Q002", "name": "Rae", "email": "rae@school.edu", "role": "Teacher",
+                          "passwordHash": "x"}
+                # The first chunk is validated by now; another session registers Q001 before it commits.
+                school.users.append(Teacher("Q001", "Other Quin", "other.quin@school.edu", passwordHash="x"))
+                yield 3, {"userID": "Q003", "name": "Sam", "email": "sam@school.edu", "role": "Teacher",
+                          "passwordHash": "x"}
+            result = RosterImporter(school, chunkSize=2).importRows(rows())
+            assert result.imported == 2 and result.duplicates == 1, f"[FAIL] Unexpected result: {result}."
+            assert [error.line for error in result.errors] == [1], "[FAIL] Duplicate row not recorded."
+            assert school.users.getByID("Q001").name == "Other Quin", "[FAIL] Concurrent user overwritten."
+            assert school.users.getByID("Q002") and school.users.getByID("Q003"), "[FAIL] Import stopped early."
+        finally:
+            SecurityManager.configurePasswords("pbkdf2_sha256")
+
+    print("[SUCCESS] Test Case TC026 passed.")
+
+if __name__ == "__main__":
+    test_tc026_roster_import()
@@ -0,0 +1,96 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import csv
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime
+from SchoolClass import School
+from UserClasses import Student
+from DataSecurity import SecurityManager
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel
+from ReportExport import ReportExporter, export_reports, cursor_path
+
+def test_tc027_report_export():
+    """
+    Test Case TC027: Streaming export of reports to JSONL and CSV
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        school = School("SCH027", "Export School", "Export Street")
+        student = Student("S001", "Ana", "ana@school.edu", grade=10, passwordHash="x")
+        school.users.append(student)
+        levels = [ConfidentialityLevel.PUBLIC, ConfidentialityLevel.CONFIDENTIAL, ConfidentialityLevel.HIGHLY_CONFIDENTIAL]
+        for n in range(1, 13):
+            if n % 2:
+                report = InPersonReport(f"R{n:03}", datetime(2025, 1, n), f"Secret {n}", levels[n % 3], "Gym",
+                                        witnesses=["Ben"])
+            else:
+                report = CyberBullyingReport(f"R{n:03}", datetime(2025, 1, n), f"Secret {n}", levels[n % 3], "Chat",
+                                             evidence=["screenshot.png"])
+            if n % 4 == 0:
+                report.encryptDetails()
+            student.fileReport(report)
+        # Filing order is not ID order
+        school.reports.append(school.reports.pop(0))
+
+        # Step 1: JSONL in ID order, with type fields and per-level descriptions
+        path = os.path.join(tmp, "reports.jsonl.gz")
+        assert export_reports(school, path) == 12, "[FAIL] Not every report was exported."
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert [r["reportID"] for r in records] == [f"R{n:03}" for n in range(1, 13)], "[FAIL] Not in ID order."
+        assert records[0]["location"] == "Gym" and records[0]["witnesses"] == ["Ben"], "[FAIL] In-person fields missing."
+        assert records[1]["onlinePlatform"] == "Chat" and records[1]["evidence"] == ["screenshot.png"], "[FAIL] Cyber fields missing."
+        security = SecurityManager.get_instance()
+        for n, record in enumerate(records, start=1):
+            level = levels[n % 3]
+            if level is ConfidentialityLevel.PUBLIC:
+                assert record["description"] == f"Secret {n}" and not record["encrypted"], "[FAIL] Public text not plain."
+            elif level is ConfidentialityLevel.CONFIDENTIAL:
+                assert record["encrypted"] and security.decryptData(record["description"]) == f"Secret {n}", "[FAIL] Confidential text not encrypted."
+            else:
+                assert record["redacted"] and record["description"] is None, "[FAIL] Highly confidential text leaked."
+        assert not school.reports.getByID("R002").encrypted, "[FAIL] Export changed a stored report."
+
+        # Step 2: An interrupted CSV export resumes from the last saved segment
+        path = os.path.join(tmp, "reports.csv")
+        exporter = ReportExporter(school, segmentSize=2)
+        try:
+            original = exporter.record
+            def failing(report):
+                if report.reportID == "R006":
+                    raise IOError("disk full")
+                return original(report)
+            exporter.record = failing
+            exporter.export(path)
+        except IOError:
+            pass
+        assert exporter.cursor == "R004", f"[FAIL] Cursor should be R004, got {exporter.cursor}."
+        with open(cursor_path(path), encoding="utf-8") as f:
+            assert json.load(f)["cursor"] == "R004", "[FAIL] Cursor not saved next to the export."
+        exporter = ReportExporter(school, segmentSize=2)  # As a new process would
+        assert exporter.resume(path) == 8, "[FAIL] Resume exported the wrong reports."
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["reportID"] for row in rows] == [f"R{n:03}" for n in range(1, 13)], "[FAIL] Resumed CSV is wrong."
+        assert json.loads(rows[0]["witnesses"]) == ["Ben"] and rows[0]["onlinePlatform"] == "", "[FAIL] CSV columns wrong."
+        assert not os.path.exists(cursor_path(path)), "[FAIL] Cursor left behind after a finished export."
+
+        # Step 3: A resumed gzip export is a valid multi-member file with every record once
+        path = os.path.join(tmp, "reports.jsonl.gz")
+        exporter = ReportExporter(school, segmentSize=5)
+        exporter.record = failing
+        try:
+            exporter.export(path)
+        except IOError:
+            pass
+        assert ReportExporter(school, segmentSize=5).resume(path) == 7, "[FAIL] Gzip resume exported the wrong reports."
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert [json.loads(line)["reportID"] for line in f] == [f"R{n:03}" for n in range(1, 13)], "[FAIL] Resumed gzip is wrong."
+
+    print("[SUCCESS] Test Case TC027 passed.")
+
+if __name__ == "__main__":
+    test_tc027_report_export()
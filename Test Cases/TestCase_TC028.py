@@ -0,0 +1,64 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+from datetime import datetime
+from SchoolClass import School
+from UserClasses import Student
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel, ReportStatus
+
+def test_tc028_report_search():
+    """
+    Test Case TC028: Full-text search over descriptions, locations and platforms
+    """
+    school = School("SCH028", "Search School", "Search Street")
+    student = Student("S001", "Ana", "ana@school.edu", grade=10, passwordHash="x")
+    school.users.append(student)
+    level = ConfidentialityLevel.PUBLIC
+    reports = [
+        InPersonReport("R001", datetime.now(), "Pushed near the lockers after lunch", level, "Hallway B"),
+        InPersonReport("R002", datetime.now(), "Name calling in the hallway", level, "Cafeteria"),
+        CyberBullyingReport("R003", datetime.now(), "Mean comments in the class group chat", level, "Messenger"),
+        CyberBullyingReport("R004", datetime.now(), "Group chat members mocked a photo", level, "Instagram"),
+        InPersonReport("R005", datetime.now(), "Lockers vandalised", level, "Hallway B"),
+    ]
+    reports[4].encryptDetails()  # Filed already encrypted
+    school.startEncryption(linger=0)
+    for report in reports:
+        student.fileReport(report)
+    school.encryption.flush()
+    index = school.searchIndex
+    ids = lambda results: [r.reportID for r in results]
+
+    # Step 1: Words match descriptions and places, place matches rank higher
+    assert ids(index.search("hallway")) == ["R001", "R005", "R002"], "[FAIL] Place match should rank first."
+    assert ids(index.search("lockers")) == ["R001"], "[FAIL] Encrypted description should not be indexed."
+    assert all(r.encrypted for r in reports), "[FAIL] Pipeline did not encrypt the reports."
+
+    # Step 2: Phrases, exclusions and filters
+    assert ids(index.search('"group chat"')) == ["R003", "R004"], "[FAIL] Phrase search failed."
+    assert ids(index.search('"chat group"')) == [], "[FAIL] Phrase word order ignored."
+    assert ids(index.search("chat -instagram")) == ["R003"], "[FAIL] Exclusion failed."
+    school.reports.updateStatus(reports[0], ReportStatus.RESOLVED)
+    assert ids(index.search("hallway", status=ReportStatus.NEW)) == ["R005", "R002"], "[FAIL] Status filter ignored."
+    assert ids(index.search("chat", reportType=InPersonReport)) == [], "[FAIL] Type filter ignored."
+
+    # Step 3: Removed reports leave the index
+    school.reports.remove(reports[4])
+    assert ids(index.search("hallway")) == ["R001", "R002"], "[FAIL] Removed report still found."
+    assert len(index) == 4, "[FAIL] Index size is wrong."
+    school.stopEncryption()
+
+    # Step 4: Confidential descriptions stay out of the index; searchReports finds them through the blind index
+    secret = InPersonReport("R006", datetime.now(), "Lockers kicked in during lunch",
+                            ConfidentialityLevel.CONFIDENTIAL, "Gym")
+    student.fileReport(secret)
+    assert ids(index.search("kicked")) == [], "[FAIL] Confidential description was indexed."
+    assert ids(index.search("gym")) == ["R006"], "[FAIL] Confidential report's place not indexed."
+    assert ids(school.searchReports("lockers")) == ["R001", "R006"], "[FAIL] Combined search failed."
+    assert ids(school.searchReports("lockers -kicked")) == ["R001"], "[FAIL] Exclusion not applied to blind matches."
+    assert ids(school.searchReports("lockers", reportType=CyberBullyingReport)) == [], "[FAIL] Filter not applied."
+
+    print("[SUCCESS] Test Case TC028 passed.")
+
+if __name__ == "__main__":
+    test_tc028_report_search()
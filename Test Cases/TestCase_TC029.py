@@ -0,0 +1,65 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import os
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+from SchoolClass import School
+from Storage import SQLiteStorage
+from UserClasses import Student
+from DataSecurity import SecurityManager
+from BlindIndex import BlindIndex
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel
+
+def test_tc029_blind_index():
+    """
+    Test Case TC029: Searching confidential reports without decrypting them
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = SQLiteStorage(os.path.join(tmp, "blind.db"))
+        school = School("SCH029", "Blind School", "Blind Street", storage)
+        student = Student("S001", "Ana", "ana@school.edu", grade=10, passwordHash="x")
+        school.users.append(student)
+        reports = [
+            InPersonReport("R001", datetime.now(), "Pushed near the lockers", ConfidentialityLevel.CONFIDENTIAL, "Gym"),
+            CyberBullyingReport("R002", datetime.now(), "Threats in the group chat", ConfidentialityLevel.HIGHLY_CONFIDENTIAL, "Messenger"),
+            InPersonReport("R003", datetime.now(), "Lockers vandalised", ConfidentialityLevel.PUBLIC, "Hallway"),
+            InPersonReport("R004", datetime.now(), "Bag thrown into the lockers", ConfidentialityLevel.CONFIDENTIAL, "Hallway"),
+        ]
+        for report in reports:
+            report.encryptDetails()
+            student.fileReport(report)
+        previous_key = SecurityManager.activeKey()
+        no_decrypt = patch.object(SecurityManager, "decryptData", side_effect=AssertionError("decrypted"))
+
+        # Step 1: Keyword and exact-match search without decrypting anything
+        with no_decrypt:
+            assert [r.reportID for r in school.blindIndex.search("LOCKERS")] == ["R001", "R004"], "[FAIL] Keyword search failed."
+            assert [r.reportID for r in school.blindIndex.search("group chat")] == ["R002"], "[FAIL] Multi-word search failed."
+            assert [r.reportID for r in school.blindIndex.equals("  pushed NEAR the lockers ")] == ["R001"], "[FAIL] Equality search failed."
+            assert school.blindIndex.search("vandalised") == [], "[FAIL] Public report should not be blind indexed."
+
+        # Step 2: Tokens are stored with the report and reused on load
+        record = storage.loadReports("SCH029")[0]
+        assert record["blindIndex"].startswith(previous_key[0] + "$"), "[FAIL] Tokens not stored."
+        loaded = School.load(storage, "SCH029")
+        with no_decrypt:
+            rebuilt = BlindIndex(loaded.reports)
+            assert [r.reportID for r in rebuilt.search("lockers")] == ["R001", "R004"], "[FAIL] Loaded index is wrong."
+
+        # Step 3: A key rotation re-tokenizes under the new key
+        try:
+            SecurityManager.configure("rotated secret", keyID="k-tc029")
+            assert [r.reportID for r in school.blindIndex.search("threats")] == ["R002"], "[FAIL] Search after rotation failed."
+            assert all(r.blindIndex[0] == "k-tc029" for r in school.reports if r.blindIndex), "[FAIL] Index not rebuilt."
+            assert storage.loadReports("SCH029")[0]["blindIndex"].startswith("k-tc029$"), "[FAIL] Rebuilt tokens not saved."
+            assert school.blindIndex.rebuild() == 0, "[FAIL] Nothing should be left to rebuild."
+        finally:
+            SecurityManager.installKey(*previous_key)
+            storage.close()
+
+    print("[SUCCESS] Test Case TC029 passed.")
+
+if __name__ == "__main__":
+    test_tc029_blind_index()
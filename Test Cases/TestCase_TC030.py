@@ -0,0 +1,89 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+from datetime import datetime, timedelta, timezone
+from SchoolClass import School
+from UserClasses import Student
+from Pagination import render_report_page
+from Duplicates import DuplicateDetector
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel
+
+def test_tc030_duplicate_detection():
+    """
+    Test Case TC030: Near-duplicate reports are flagged at filing time
+    """
+    school = School("SCH030", "Duplicate School", "Duplicate Street")
+    student = Student("S001", "Ana", "ana@school.edu", grade=10, passwordHash="x")
+    school.users.append(student)
+    start = datetime(2025, 3, 3, 8, 0)
+    level = ConfidentialityLevel.CONFIDENTIAL
+    text = "Three older students pushed Ben against the lockers and took his phone after lunch"
+    reports = [
+        InPersonReport("R001", start, text, level, "Hallway B"),
+        # Same incident, reworded slightly, by a witness an hour later
+        InPersonReport("R002", start + timedelta(hours=1), text.replace("Three", "3") + " today", level, "hallway  b"),
+        # Same words, different place
+        InPersonReport("R003", start + timedelta(hours=2), text, level, "Cafeteria"),
+        # Same words and place, but a month later
+        InPersonReport("R004", start + timedelta(days=30), text, level, "Hallway B"),
+        # Unrelated report in the same place and window
+        InPersonReport("R005", start + timedelta(days=30, hours=1), "Someone wrote insults on the whiteboard", level, "Hallway B"),
+        CyberBullyingReport("R006", start, "Mean memes about Ana posted in the class group chat", level, "Messenger"),
+        CyberBullyingReport("R007", start + timedelta(days=1), "mean memes about Ana posted in the class group chat again", level, "Messenger"),
+    ]
+    for report in reports:
+        report.encryptDetails()  # Detection reads the plaintext through the key
+        assert student.fileReport(report), "[FAIL] Filing rejected."
+    detector = school.duplicates
+
+    # Step 1: Only near-duplicates in the same place and window are flagged
+    assert detector.duplicatesOf("R002") == ["R001"], "[FAIL] Reworded duplicate missed."
+    assert detector.duplicatesOf("R003") == [], "[FAIL] Different place flagged."
+    assert detector.duplicatesOf("R004") == [], "[FAIL] Report outside the window flagged."
+    assert detector.duplicatesOf("R005") == [], "[FAIL] Unrelated report flagged."
+    assert detector.duplicatesOf("R007") == ["R006"], "[FAIL] Cyberbullying duplicate missed."
+    assert detector.groups() == {"R001": ["R001", "R002"], "R006": ["R006", "R007"]}, "[FAIL] Wrong groups."
+
+    # Step 2: The admin listing marks duplicates
+    listing = render_report_page(list(school.reports), groupOf=detector.groupOf)
+    assert "Report ID: R002, Type: InPersonReport, Status: NEW, Assigned Staff: None, Possible duplicate of R001" in listing, \
+        "[FAIL] Listing does not mark duplicates."
+    assert "R003, Type: InPersonReport, Status: NEW, Assigned Staff: None\n" in listing, "[FAIL] Non-duplicate marked."
+
+    # Step 3: Removing a report breaks up its group
+    school.reports.remove(reports[6])
+    assert detector.groups() == {"R001": ["R001", "R002"]}, "[FAIL] Group not broken up."
+    assert detector.groupOf("R006") == "R006", "[FAIL] Leftover report still grouped."
+
+    # Step 4: Removing the first report of a group hands the group to the next one
+    later = start + timedelta(days=30)
+    for n in (8, 9):
+        assert student.fileReport(InPersonReport(f"R{n:03}", later + timedelta(hours=n), text, level, "Hallway B")), \
+            "[FAIL] Filing rejected."
+    assert detector.groups()["R004"] == ["R004", "R008", "R009"], "[FAIL] Group of three not formed."
+    school.reports.remove(reports[3])
+    assert detector.groups() == {"R001": ["R001", "R002"], "R008": ["R008", "R009"]}, "[FAIL] Group not re-rooted."
+    assert detector.groupOf("R009") == "R008" and detector.groupOf("R004") == "R004", "[FAIL] Stale group root."
+
+    # Step 5: Empty and stopword-only descriptions are never flagged
+    for n, description in enumerate(["", "...", "it was the", "It was the!"], start=10):
+        report = CyberBullyingReport(f"R{n:03}", later, description, level, "Discord")
+        school.reports.append(report)  # Bypasses validation, as an import would
+        assert detector.duplicatesOf(report.reportID) == [], f"[FAIL] {description!r} flagged as a duplicate."
+
+    # Step 6: Naive and timezone-aware dates are compared on one clock
+    mixed = DuplicateDetector()
+    mixed.reportAdded(InPersonReport("R014", later, "Ben's bag was thrown in the bin by two boys", level, "Gym"))
+    mixed.reportAdded(InPersonReport("R015", (later + timedelta(hours=3)).astimezone(timezone.utc),
+                                     "Ben's bag was thrown in the bin by two boys again", level, "Gym"))
+    assert mixed.duplicatesOf("R015") == ["R014"], "[FAIL] Duplicate with an aware date missed."
+    mixed.reportAdded(InPersonReport("R016", later + timedelta(days=60), "Ben's bag was thrown in the bin by two boys",
+                                     level, "Gym"))
+    mixed.reportAdded(InPersonReport("R017", (later + timedelta(days=60, hours=1)).astimezone(timezone.utc),
+                                     "Ben's bag was thrown in the bin by two boys", level, "Gym"))
+    assert mixed.duplicatesOf("R017") == ["R016"], "[FAIL] Expired reports still matched."
+
+    print("[SUCCESS] Test Case TC030 passed.")
+
+if __name__ == "__main__":
+    test_tc030_duplicate_detection()
@@ -0,0 +1,75 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import builtins
+from datetime import datetime, timedelta, timezone
+from SchoolClass import School
+from UserClasses import Student, Teacher, Administrator
+from Reports import InPersonReport, CyberBullyingReport, ConfidentialityLevel
+
+def test_tc031_case_clustering():
+    """
+    Test Case TC031: Related reports are grouped into cases and a case is assigned at once
+    """
+    school = School("SCH031", "Case School", "Case Street")
+    ana = Student("S001", "Ana", "ana@school.edu", grade=10, passwordHash="x")
+    ben = Student("S002", "Ben", "ben@school.edu", grade=10, passwordHash="x")
+    teacher = Teacher("T001", "Mr. Cruz", "cruz@school.edu", passwordHash="x")
+    admin = Administrator("A001", "Admin", "admin@school.edu", passwordHash="x")
+    school.users.extend([ana, ben, teacher, admin])
+    start = datetime(2025, 3, 3, 8, 0)
+    level = ConfidentialityLevel.PUBLIC
+    filings = [
+        (ana, InPersonReport("R001", start, "Pushed in the hallway", level, "Hallway B", witnesses=["Carl Reyes"])),
+        # Another reporter, but the same witness a week later
+        (ben, InPersonReport("R002", start + timedelta(days=7), "Bag thrown on the floor", level, "Gym",
+                             witnesses=["carl  reyes"])),
+        # Same reporter and place as R002, two weeks on
+        (ben, InPersonReport("R003", start + timedelta(days=21), "Mocked while changing", level, "gym")),
+        # Same reporter, but online: a separate situation
+        (ben, CyberBullyingReport("R004", start + timedelta(days=22), "Insults in the chat", level, "Messenger")),
+        # Same witness, but months later
+        (ana, InPersonReport("R005", start + timedelta(days=120), "Tripped at recess", level, "Playground",
+                             witnesses=["Carl Reyes"])),
+    ]
+    for student, report in filings:
+        assert student.fileReport(report), "[FAIL] Filing rejected."
+    reports = {report.reportID: report for _, report in filings}
+
+    # Step 1: Linked reports share a case, others stand alone
+    case = school.cases.caseOf(reports["R003"])
+    assert case.caseID == "C-R001", "[FAIL] Case not named after its first report."
+    assert [r.reportID for r in case] == ["R001", "R002", "R003"], "[FAIL] Wrong case members."
+    assert len(school.cases.caseOf(reports["R004"])) == 1, "[FAIL] Online report joined the case."
+    assert len(school.cases.caseOf(reports["R005"])) == 1, "[FAIL] Report outside the window joined the case."
+    assert [c.caseID for c in school.cases.cases()] == ["C-R001"], "[FAIL] Wrong list of cases."
+    assert reports["R003"]._witnesses is None, "[FAIL] Linking allocated an empty witness list."
+
+    # Step 2: One assignStaff call assigns the whole case
+    original_input = builtins.input
+    builtins.input = lambda _: "1"
+    try:
+        admin.assignStaff(case, [teacher])
+    finally:
+        builtins.input = original_input
+    assert all(r.assigned_teacher is teacher for r in case), "[FAIL] Case not assigned as a whole."
+    assert reports["R004"].assigned_teacher is None, "[FAIL] Report outside the case assigned."
+
+    # Step 3: Removing the report that linked them keeps the rest of the case together
+    school.reports.remove(reports["R002"])
+    assert [r.reportID for r in school.cases.caseOf(reports["R003"])] == ["R001", "R003"], \
+        "[FAIL] Case split or kept the removed report."
+    school.reports.append(reports["R002"])
+    assert len(school.cases.caseOf(reports["R002"])) == 3, "[FAIL] Re-filed report did not rejoin its case."
+
+    # Step 4: Naive and timezone-aware dates link on one clock
+    naive = InPersonReport("R006", start + timedelta(days=200), "Name-calling", level, "Library", witnesses=["Dina Cruz"])
+    aware = InPersonReport("R007", (start + timedelta(days=201)).astimezone(timezone.utc), "Laughed at", level,
+                           "Canteen", witnesses=["Dina Cruz"])
+    assert ana.fileReport(naive) and ana.fileReport(aware), "[FAIL] Mixed dates rejected."
+    assert school.cases.caseOf(aware).caseID == "C-R006", "[FAIL] Report with an aware date not linked."
+
+    print("[SUCCESS] Test Case TC031 passed.")
+
+if __name__ == "__main__":
+    test_tc031_case_clustering()
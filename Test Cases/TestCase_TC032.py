@@ -0,0 +1,66 @@
+import sys
+sys.path.append('C:/Users/NV3/Code/Student-Bullying-Reporting-Application') #change to your own file path
+
+import builtins
+from datetime import datetime
+from SchoolClass import School
+from UserClasses import Student, Teacher, Administrator
+from Reports import InPersonReport, ConfidentialityLevel, ReportStatus
+from Scheduler import AssignmentScheduler
+
+def test_tc032_auto_assignment():
+    """
+    Test Case TC032: The backlog is assigned by open caseload, capacity and affinity
+    """
+    school = School("SCH032", "Scheduler School", "Scheduler Street")
+    students = [Student(f"S{n:03}", f"Student {n}", f"s{n}@school.edu", grade=9, passwordHash="x") for n in range(1, 7)]
+    cruz = Teacher("T001", "Mr. Cruz", "cruz@school.edu", passwordHash="x")
+    lim = Teacher("T002", "Ms. Lim", "lim@school.edu", passwordHash="x")
+    admin = Administrator("A001", "Admin", "admin@school.edu", passwordHash="x")
+    school.users.extend(students + [cruz, lim, admin])
+    levels = [ConfidentialityLevel.PUBLIC, ConfidentialityLevel.HIGHLY_CONFIDENTIAL]
+    for n, student in enumerate(students, start=1):
+        report = InPersonReport(f"R{n:03}", datetime(2025, 3, n), f"Incident {n}", levels[n % 2], f"Room {n}")
+        assert student.fileReport(report), "[FAIL] Filing rejected."
+    reports = list(school.reports)
+    # Mr. Cruz already has a resolved report (no load) and an open public one (load 1)
+    admin.assignTeacher(reports[0], cruz)
+    admin.assignTeacher(reports[1], cruz)
+    school.reports.updateStatus(reports[0], ReportStatus.RESOLVED)
+    scheduler = AssignmentScheduler(school, capacity=6, affinity=())
+    assert scheduler.caseloads() == {"T001": 1, "T002": 0}, "[FAIL] Wrong open caseloads."
+
+    # Step 1: A dry run previews without assigning
+    plan = scheduler.assign(admin, dryRun=True)
+    assert [(r.reportID, t.userID) for r, t in plan] == [("R003", "T002"), ("R004", "T001"), ("R005", "T001"),
+                                                          ("R006", "T002")], "[FAIL] Unbalanced plan."
+    assert len(school.reports.unassigned()) == 4, "[FAIL] Dry run assigned reports."
+
+    # Step 2: Capacity leaves what does not fit unassigned
+    scheduler = AssignmentScheduler(school, capacity=4, affinity=())
+    plan = scheduler.plan()
+    assert [r.reportID for r in scheduler.unplaced] == ["R005"], "[FAIL] Capacity not respected."
+    assert [(r.reportID, t.userID) for r, t in plan] == [("R003", "T002"), ("R004", "T001"), ("R006", "T001")], \
+        "[FAIL] Wrong plan under capacity."
+
+    # Step 3: Affinity keeps a reporter with their teacher
+    later = InPersonReport("R007", datetime(2025, 3, 9), "Again", ConfidentialityLevel.PUBLIC, "Room 2")
+    assert students[1].fileReport(later), "[FAIL] Filing rejected."
+    plan = AssignmentScheduler(school, affinity=("reporter",)).plan([later])
+    assert plan == [(later, cruz)], "[FAIL] Affinity ignored."
+
+    # Step 4: Applying assigns everything, and Enter takes the suggestion in manual assignment
+    applied = AssignmentScheduler(school, affinity=()).assign(admin, reports[2:])
+    assert len(applied) == 4 and school.reports.unassigned() == [later], "[FAIL] Batch not applied."
+    original_input = builtins.input
+    builtins.input = lambda _: ""
+    try:
+        admin.assignStaff(later, [cruz, lim])
+    finally:
+        builtins.input = original_input
+    assert later.assigned_teacher is cruz, "[FAIL] Suggested teacher not assigned."
+
+    print("[SUCCESS] Test Case TC032 passed.")
+
+if __name__ == "__main__":
+    test_tc032_auto_assignment()
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from Reports import BullyingReport  
-    from DataSecurity import hash_password, SecurityManager
+    from DataSecurity import SecurityManager
 
 class User(ABC):
     def __init__(self, userID: str, name: str, email: str, role: str, passwordHash: str):
@@ -12,54 +12,102 @@ class User(ABC):
         self.email = email
         self.role = role
         self.passwordHash = passwordHash
+        self.school = None  # Set by the School whose user directory holds this user
 
     @abstractmethod
     def login(self, password: str) -> bool:
         pass
 
+    def checkPassword(self, password: str) -> bool:
+        """Verify a password, upgrading an outdated stored hash on success."""
+        from DataSecurity import SecurityManager
+        from SchoolClass import School
+
+        hasher = SecurityManager.passwordHasher()
+        if not hasher.verify(password, self.passwordHash):
+            return False
+        if hasher.needsRehash(self.passwordHash):
+            old = self.passwordHash
+            self.passwordHash = hasher.hash(password)
+            hasher.forget(old)
+            school = School.of(self)
+            if school is not None:
+                school.users.notifyUpdated(self, "passwordHash", old)
+        return True
+
+    def toRecord(self) -> dict:
+        """Flat representation used by storage backends."""
+        return {
+            "userID": self.userID,
+            "name": self.name,
+            "email": self.email,
+            "role": self.role,
+            "passwordHash": self.passwordHash,
+        }
+
 class Student(User):
     def __init__(self, userID: str, name: str, email: str, grade: int, passwordHash: str):
         super().__init__(userID, name, email, "Student", passwordHash)
         self.grade = grade  
 
+    def toRecord(self) -> dict:
+        record = super().toRecord()
+        record["grade"] = self.grade
+        return record
+
     def login(self, password: str) -> bool:
-        from DataSecurity import hash_password
-        return hash_password(password) == self.passwordHash
+        return self.checkPassword(password)
 
-    def fileReport(self, report: 'BullyingReport') -> None:
-        """Allows a student to file a bullying report."""
+    def fileReport(self, report: 'BullyingReport') -> bool:
+        """Allows a student to file a bullying report. Returns whether it was registered."""
         from Reports import BullyingReport
         from SchoolClass import School  
 
-        school = School.get_instance() 
+        school = School.of(self)
         if not isinstance(report, BullyingReport):
             print("[ERROR] Invalid report submission.")
-            return
+            return False
+        if school is None:
+            print(f"[ERROR] Student {self.name} is not registered in any school.")
+            return False
+        if school.users.getByID(self.userID) is not self:
+            print(f"[ERROR] Student {self.name} is not registered in {school.name}.")
+            return False
 
         report.reporter = self  # Assign the student as the reporter
-        school.registerReport(report)  # Register report within the school system
+        if not school.registerReport(report):  # Register report within the school system
+            return False
         print(f"[SUCCESS] Report {report.reportID} submitted by {self.name}.")
+        return True
 
 class Teacher(User):
     def __init__(self, userID: str, name: str, email: str, passwordHash: str):
         super().__init__(userID, name, email, "Teacher", passwordHash)
 
     def login(self, password: str) -> bool:
-        from DataSecurity import hash_password
-        return hash_password(password) == self.passwordHash
+        return self.checkPassword(password)
 
-    def reviewReport(self, report) -> None:
+    def reviewReport(self, report) -> bool:
+        """Start work on an assigned report. Returns False if it is not this teacher's."""
         from Reports import ReportStatus
+        from SchoolClass import School
+        from DataSecurity import SecurityManager
+
+        if not SecurityManager.get_instance().checkPermission(self, "review_report", report):
+            print(f"[ERROR] Report {report.reportID} is not assigned to {self.name}.")
+            return False
         print(f"\n[INFO] Teacher {self.name} is reviewing Report ID: {report.reportID}.")
-        # For demonstration, update status if the report is new.
-        if report.status == ReportStatus.NEW:
-            report.status = ReportStatus.IN_PROGRESS
+        # For demonstration, update status if the report is new. Compare-and-set,
+        # so two concurrent reviews move it to IN_PROGRESS exactly once.
+        if School.of(self).reports.compareAndSetStatus(report, ReportStatus.NEW, ReportStatus.IN_PROGRESS):
             print(f"[UPDATE] Report {report.reportID} status updated to IN_PROGRESS.")
         else:
             print(f"[INFO] Report {report.reportID} has already been processed.")
         # Encrypt the description if not already encrypted
         if not report.encrypted:
             report.encryptDetails()
+            School.of(self).reports.notifyUpdated(report, "description")
+        return True
 
 
 class Administrator(User):
@@ -67,21 +115,22 @@ class Administrator(User):
         super().__init__(userID, name, email, "Administrator", passwordHash)
 
     def login(self, password: str) -> bool:
-        from DataSecurity import hash_password
-        return hash_password(password) == self.passwordHash
+        return self.checkPassword(password)
 
     def assignStaff(self, report, available_teachers: list) -> None:
-        """Assign, change, or remove a teacher from the report."""
-        from DataSecurity import SecurityManager  
-        security_manager = SecurityManager()  
+        """Assign, change, or remove a teacher from the report, or from every report of a Case."""
+        from DataSecurity import SecurityManager
+        from Cases import Case
 
-        if not security_manager.checkPermission(self, "assign_staff"):  
+        if not SecurityManager.get_instance().checkPermission(self, "assign_staff"):
             print("Permission denied to assign staff.")
             return
 
         # Check if a staff is already assigned
-        if hasattr(report, "assigned_teacher") and report.assigned_teacher:
-            print(f"\n[INFO] Report {report.reportID} is already assigned to {report.assigned_teacher.name}.")
+        label = f"Case {report.caseID}" if isinstance(report, Case) else f"Report {report.reportID}"
+        assigned = sorted({item.assigned_teacher.name for item in _reports_in(report) if item.assigned_teacher})
+        if assigned:
+            print(f"\n[INFO] {label} is already assigned to {', '.join(assigned)}.")
             print("1. Change Staff")
             print("2. Remove Staff")
             print("3. Back")
@@ -91,8 +140,7 @@ class Administrator(User):
             if choice == "1":
                 self._assignNewTeacher(report, available_teachers)
             elif choice == "2":
-                report.assigned_teacher = None
-                print(f"\n[UPDATE] Staff removed from Report {report.reportID}.")
+                self._assignAll(report, None)
             else:
                 print("[INFO] Returning to previous menu.")
                 return
@@ -100,17 +148,32 @@ class Administrator(User):
             self._assignNewTeacher(report, available_teachers)
 
     def _assignNewTeacher(self, report, available_teachers: list) -> None:
-        """Helper method to assign a new teacher to the report."""
+        """Helper method to assign a new teacher to the report (or case).
+
+        Teachers are listed with their open caseloads, and pressing Enter
+        takes the one the AssignmentScheduler suggests.
+        """
+        from Scheduler import AssignmentScheduler
+        from SchoolClass import School
+
         if not available_teachers:
             print("[ERROR] No available teachers to assign.")
             return
 
+        scheduler = AssignmentScheduler(School.of(self))
+        loads = scheduler.caseloads(available_teachers)
+        suggested = scheduler.suggest(_reports_in(report), available_teachers)
         print("\n--- Available Teachers ---")
         for idx, teacher in enumerate(available_teachers, start=1):
-            print(f"{idx}. {teacher.name} ({teacher.email})") 
+            mark = " [suggested]" if teacher is suggested else ""
+            print(f"{idx}. {teacher.name} ({teacher.email}), open caseload {loads[teacher.userID]}{mark}")
 
+        answer = input("Select a teacher by number (Enter for the suggested one): ").strip()
+        if not answer and suggested is not None:
+            self._assignAll(report, suggested)
+            return
         try:
-            sel = int(input("Select a teacher by number: "))
+            sel = int(answer)
             if sel < 1 or sel > len(available_teachers):
                 print("[ERROR] Invalid selection.")
                 return
@@ -119,5 +182,51 @@ class Administrator(User):
             print("[ERROR] Invalid input; please enter a number.")
             return
 
-        report.assigned_teacher = selected_teacher  
-        print(f"\n[UPDATE] Administrator {self.name} assigned {selected_teacher.name} to report {report.reportID}.")
+        self._assignAll(report, selected_teacher)
+
+    def _assignAll(self, report, teacher: 'Teacher') -> None:
+        """Assign (or remove) `teacher` on a report or every report of a case, in one storage transaction."""
+        from SchoolClass import School
+
+        with School.of(self).batch():
+            for item in _reports_in(report):
+                if not self.assignTeacher(item, teacher):
+                    return
+
+    def assignTeacher(self, report, teacher: 'Teacher') -> bool:
+        """Assign `teacher` to the report, or remove its staff if teacher is None (no prompts)."""
+        from DataSecurity import SecurityManager
+        from SchoolClass import School
+
+        if not SecurityManager.get_instance().checkPermission(self, "assign_staff"):
+            print("Permission denied to assign staff.")
+            return False
+        if teacher is not None and teacher.role != "Teacher":
+            print(f"[ERROR] {teacher.name} is not a teacher.")
+            return False
+        School.of(self).reports.updateAssignment(report, teacher)
+        if teacher is None:
+            print(f"\n[UPDATE] Staff removed from Report {report.reportID}.")
+        else:
+            print(f"\n[UPDATE] Administrator {self.name} assigned {teacher.name} to report {report.reportID}.")
+        return True
+
+
+def _reports_in(target) -> list:
+    """The reports of a Case, or a single report as a list of one."""
+    from Cases import Case
+
+    return list(target) if isinstance(target, Case) else [target]
+
+
+def user_from_record(record: dict) -> User:
+    """Rebuild a user from User.toRecord() output."""
+    common = dict(userID=record["userID"], name=record["name"], email=record["email"],
+                  passwordHash=record["passwordHash"])
+    if record["role"] == "Student":
+        return Student(grade=record["grade"], **common)
+    if record["role"] == "Teacher":
+        return Teacher(**common)
+    if record["role"] == "Administrator":
+        return Administrator(**common)
+    raise ValueError(f"Unknown user role: {record['role']}")
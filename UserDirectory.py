@@ -0,0 +1,186 @@
+import threading
+from collections.abc import MutableSequence
+from typing import TYPE_CHECKING
+
+from Listeners import ListenerSet
+
+if TYPE_CHECKING:
+    from UserClasses import User
+
+
+def emailKey(email: str) -> str:
+    """Normalise an email address for case-insensitive lookups."""
+    return email.strip().casefold()
+
+
+class UserDirectory(MutableSequence):
+    """List of users held by a School, keyed by email and userID.
+
+    Behaves like the plain list School.users used to be. Lookups by
+    casefolded email or by userID, and the per-role views, cost O(1)
+    whatever the number of users. Like ReportRegistry with report IDs,
+    adding a user whose email or userID is already taken raises ValueError
+    and leaves the directory unchanged.
+
+    Safe to share between threads: changes happen under one lock, and
+    listeners added with addListener() are told about every change, in
+    order and one at a time, through userAdded(user), userRemoved(user)
+    and userUpdated(user, field, old). Like ReportRegistry, events are
+    delivered after the lock is released.
+    """
+
+    def __init__(self, users=None):
+        self._listeners = ListenerSet()
+        self._lock = threading.RLock()
+        self._users = []
+        self._byEmail = {}
+        self._byID = {}
+        self._byRole = {}
+        if users:
+            self.extend(users)
+
+    # --- Listeners ---
+
+    def addListener(self, listener) -> None:
+        self._listeners.add(listener)
+
+    def removeListener(self, listener) -> None:
+        self._listeners.remove(listener)
+
+    # --- Index maintenance (callers hold self._lock) ---
+
+    def _check(self, users: list, replacing: list = ()) -> None:
+        """Raise ValueError if any of `users` would reuse an email or userID held by another user."""
+        emails, userIDs = set(), set()
+        for user in users:
+            key = emailKey(user.email)
+            holder = self._byEmail.get(key)
+            if key in emails or (holder is not None and holder not in replacing):
+                raise ValueError(f"A user with email {user.email} is already registered.")
+            holder = self._byID.get(user.userID)
+            if user.userID in userIDs or (holder is not None and holder not in replacing):
+                raise ValueError(f"User {user.userID} is already registered.")
+            emails.add(key)
+            userIDs.add(user.userID)
+
+    def _index(self, user) -> None:
+        self._byEmail[emailKey(user.email)] = user
+        self._byID[user.userID] = user
+        self._byRole.setdefault(user.role, {})[user.userID] = user
+        self._listeners.queue("userAdded", user)
+
+    def _unindex(self, user) -> None:
+        key = emailKey(user.email)
+        if self._byEmail.get(key) is user:
+            del self._byEmail[key]
+        if self._byID.get(user.userID) is user:
+            del self._byID[user.userID]
+        role = self._byRole.get(user.role, {})
+        if role.get(user.userID) is user:
+            del role[user.userID]
+        self._listeners.queue("userRemoved", user)
+
+    def _delete(self, index) -> None:
+        removed = self._users[index]
+        for user in (removed if isinstance(index, slice) else [removed]):
+            self._unindex(user)
+        del self._users[index]
+
+    # --- MutableSequence interface ---
+
+    def __getitem__(self, index):
+        return self._users[index]
+
+    def __setitem__(self, index, value) -> None:
+        with self._lock:
+            if isinstance(index, slice):
+                value = list(value)
+                self._check(value, self._users[index])
+                for user in self._users[index]:
+                    self._unindex(user)
+                for user in value:
+                    self._index(user)
+            else:
+                self._check([value], [self._users[index]])
+                self._unindex(self._users[index])
+                self._index(value)
+            self._users[index] = value
+        self._listeners.deliver()
+
+    def __delitem__(self, index) -> None:
+        with self._lock:
+            self._delete(index)
+        self._listeners.deliver()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(self._users[:])
+
+    def __repr__(self) -> str:
+        return f"UserDirectory({list(self)!r})"
+
+    def insert(self, index: int, user) -> None:
+        with self._lock:
+            self._check([user])
+            self._index(user)
+            self._users.insert(index, user)
+        self._listeners.deliver()
+
+    def append(self, user) -> None:
+        with self._lock:
+            self._check([user])
+            self._index(user)
+            self._users.append(user)
+        self._listeners.deliver()
+
+    def remove(self, user) -> None:
+        with self._lock:
+            self._delete(self._users.index(user))
+        self._listeners.deliver()
+
+    def pop(self, index: int = -1):
+        with self._lock:
+            user = self._users[index]
+            self._delete(index)
+        self._listeners.deliver()
+        return user
+
+    def clear(self) -> None:
+        with self._lock:
+            for user in self._users:
+                self._listeners.queue("userRemoved", user)
+            self._users.clear()
+            self._byEmail.clear()
+            self._byID.clear()
+            self._byRole.clear()
+        self._listeners.deliver()
+
+    def notifyUpdated(self, user: 'User', field: str, old=None) -> None:
+        """Tell listeners about an in-place change to a non-indexed field."""
+        if self._byID.get(user.userID) is user:
+            self._listeners.queue("userUpdated", user, field, old)
+            self._listeners.deliver(wait=False)
+
+    # --- Lookups ---
+
+    def getByEmail(self, email: str, role: str = None) -> 'User':
+        """Return the user with this email (optionally only if it has the given role)."""
+        user = self._byEmail.get(emailKey(email))
+        if user is not None and role is not None and user.role != role:
+            return None
+        return user
+
+    def getByID(self, userID: str) -> 'User':
+        """Return the user with this userID, or None."""
+        return self._byID.get(userID)
+
+    def withRole(self, role: str) -> list:
+        """All users with the given role ("Student", "Teacher" or "Administrator")."""
+        with self._lock:
+            return list(self._byRole.get(role, {}).values())
+
+    def countRole(self, role: str) -> int:
+        return len(self._byRole.get(role, {}))
@@ -1,10 +1,36 @@
-from DummyData import school
+import os
+import sys
+
+from DummyData import school as dummy_school
+from SchoolClass import School
+from Storage import open_storage
 from MenuTypes import teacher_menu, login_user, admin_menu, student_menu
-from DataSecurity import SecurityManager
+from Sessions import SessionManager
 
 def main():
-    # Instantiate the security manager.
-    security_manager = SecurityManager()
+    # Logged-in users get a session token; menus work from the session.
+    sessions = SessionManager()
+
+    # Pick the storage backend, e.g. TUTOK_STORAGE=sqlite:tutok.db (none by default: data lives in memory).
+    spec = os.environ.get("TUTOK_STORAGE")
+    storage = open_storage(spec) if spec else None
+    if storage is not None and storage.loadSchool(dummy_school.schoolID) is not None:
+        school = School.load(storage, dummy_school.schoolID)
+    else:
+        # First run: seed the storage (if any) with the dummy data.
+        school = dummy_school
+        if storage is not None:
+            school.attachStorage(storage)
+
+    # Encrypt report descriptions in the background as soon as they are filed.
+    school.startEncryption()
+
+    # "python main.py serve [port]" runs the HTTP/JSON intake service instead of the menus.
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from IntakeService import serve
+        serve(school, port=int(sys.argv[2]) if len(sys.argv) > 2 else 8080)
+        school.stopEncryption()
+        return
 
     # Main CLI loop.
     while True:
@@ -18,18 +44,19 @@ def main():
 
         if role_choice == "4":
             print("[INFO] Exiting system...")
+            school.stopEncryption()
             break
 
-        user = login_user(role_choice, school)
-        if user is None:
+        session = login_user(role_choice, school, sessions)
+        if session is None:
             continue
 
         if role_choice == "1":
-            student_menu(user, school)
+            student_menu(session, school)
         elif role_choice == "2":
-            teacher_menu(user, school, security_manager)
+            teacher_menu(session, school)
         elif role_choice == "3":
-            admin_menu(user, school, security_manager)
+            admin_menu(session, school)
 
 
 if __name__ == "__main__":